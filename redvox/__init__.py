@@ -27,4 +27,5 @@ def print_redvox_info() -> None:
     print(f"parallelism enabled: {redvox.settings.is_parallelism_enabled()}")
     print(f"native extra enabled: {redvox.settings.is_native_extra_enabled()}")
     print(f"gui extra enabled: {redvox.settings.is_gui_extra_enabled()}")
+    print(f"protobuf implementation: {redvox.settings.protobuf_implementation()}")
     print()
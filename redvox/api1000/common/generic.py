@@ -4,8 +4,14 @@ generics correctly and cause errors to appear where there are none. However, gen
 mypy, and unless we decide to remove generics, we will place them here.
 """
 
-from typing import Generic, Callable, List, Dict, TypeVar
+import base64
+import json
+import math
+from typing import Any, Generic, Callable, List, Dict, TypeVar
 
+import numpy as np
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.internal.type_checkers import ToShortestFloat
 from google.protobuf.json_format import MessageToJson, MessageToDict
 
 from redvox.api1000.common.metadata import Metadata
@@ -91,6 +97,143 @@ class ProtoRepeatedMessage(Generic[P, T]):
         return str(self)
 
 
+def _is_map_field(field: FieldDescriptor) -> bool:
+    """
+    :param field: Field descriptor to inspect.
+    :return: True if the field is a protobuf map field, False otherwise.
+    """
+    return field.message_type is not None and field.message_type.GetOptions().map_entry
+
+
+def _non_finite_to_json(value: float) -> Any:
+    """
+    Converts non-finite floating point values into the strings used by the protobuf JSON specification.
+    :param value: Value to convert.
+    :return: "NaN", "Infinity", "-Infinity", or the original value if it is finite.
+    """
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "-Infinity" if value < 0.0 else "Infinity"
+    return value
+
+
+def _scalar_to_dict_value(
+    field: FieldDescriptor, value: Any, message_to_dict: Callable[[Any], Dict[str, Any]]
+) -> Any:
+    """
+    Converts a single (non-repeated) protobuf value into its JSON compatible Python representation.
+    :param field: The descriptor of the field the value belongs to.
+    :param value: The value to convert.
+    :param message_to_dict: The function used to convert message values.
+    :return: The JSON compatible Python representation of the value.
+    """
+    field_type: int = field.type
+    if field_type == FieldDescriptor.TYPE_MESSAGE:
+        return message_to_dict(value)
+    if field_type == FieldDescriptor.TYPE_ENUM:
+        enum_value = field.enum_type.values_by_number.get(value)
+        return value if enum_value is None else enum_value.name
+    if field_type == FieldDescriptor.TYPE_BYTES:
+        return base64.b64encode(value).decode("utf-8")
+    if field.cpp_type in (FieldDescriptor.CPPTYPE_INT64, FieldDescriptor.CPPTYPE_UINT64):
+        return str(value)
+    if field.cpp_type == FieldDescriptor.CPPTYPE_DOUBLE:
+        return value if math.isfinite(value) else _non_finite_to_json(value)
+    if field.cpp_type == FieldDescriptor.CPPTYPE_FLOAT:
+        return ToShortestFloat(value) if math.isfinite(value) else _non_finite_to_json(value)
+    return value
+
+
+def _repeated_to_dict_value(
+    field: FieldDescriptor, values: Any, message_to_dict: Callable[[Any], Dict[str, Any]]
+) -> List[Any]:
+    """
+    Converts a repeated protobuf field into a list of JSON compatible Python values. Numeric fields are converted in
+    bulk rather than element by element.
+    :param field: The descriptor of the repeated field.
+    :param values: The repeated field container.
+    :param message_to_dict: The function used to convert message values.
+    :return: A list of JSON compatible Python values.
+    """
+    cpp_type: int = field.cpp_type
+    if cpp_type == FieldDescriptor.CPPTYPE_DOUBLE or cpp_type == FieldDescriptor.CPPTYPE_FLOAT:
+        if len(values) == 0:
+            return []
+        if cpp_type == FieldDescriptor.CPPTYPE_FLOAT:
+            # numpy's shortest round-trip formatting of float32 matches protobuf's ToShortestFloat
+            result: List[Any] = np.asarray(values, dtype=np.float32).astype(str).astype(np.float64).tolist()
+        else:
+            result = list(values)
+        if not all(map(math.isfinite, result)):
+            result = list(map(_non_finite_to_json, result))
+        return result
+    if cpp_type in (FieldDescriptor.CPPTYPE_BOOL, FieldDescriptor.CPPTYPE_INT32, FieldDescriptor.CPPTYPE_UINT32) or (
+        cpp_type == FieldDescriptor.CPPTYPE_STRING and field.type == FieldDescriptor.TYPE_STRING
+    ):
+        return list(values)
+    return [_scalar_to_dict_value(field, value, message_to_dict) for value in values]
+
+
+def _map_to_dict_value(
+    field: FieldDescriptor, values: Any, message_to_dict: Callable[[Any], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Converts a protobuf map field into a dictionary of JSON compatible Python values with string keys.
+    :param field: The descriptor of the map field.
+    :param values: The map field container.
+    :param message_to_dict: The function used to convert message values.
+    :return: A dictionary of JSON compatible Python values.
+    """
+    value_field: FieldDescriptor = field.message_type.fields_by_name["value"]
+    return {
+        (("true" if key else "false") if isinstance(key, bool) else str(key)): _scalar_to_dict_value(
+            value_field, value, message_to_dict
+        )
+        for key, value in values.items()
+    }
+
+
+def _proto_to_dict(message: Any) -> Dict[str, Any]:
+    """
+    Converts a protobuf message into a Python dictionary by walking its descriptor directly. The output matches
+    MessageToDict(message, always_print_fields_with_no_presence=True) without the intermediate JSON machinery.
+    :param message: The protobuf message to convert.
+    :return: The message as a Python dictionary.
+    """
+    result: Dict[str, Any] = {}
+    for field in message.DESCRIPTOR.fields:
+        name: str = field.name
+        if _is_map_field(field):
+            result[field.json_name] = _map_to_dict_value(field, getattr(message, name), _proto_to_dict)
+        elif field.is_repeated:
+            result[field.json_name] = _repeated_to_dict_value(field, getattr(message, name), _proto_to_dict)
+        elif field.has_presence:
+            if message.HasField(name):
+                result[field.json_name] = _scalar_to_dict_value(field, getattr(message, name), _proto_to_dict)
+        else:
+            result[field.json_name] = _scalar_to_dict_value(field, getattr(message, name), _proto_to_dict)
+    return result
+
+
+def _proto_to_json_dict(message: Any) -> Dict[str, Any]:
+    """
+    Converts a protobuf message into the Python dictionary that MessageToJson(message, True) encodes. Keys are the
+    proto field names and only fields that are set or non-default are included, in field number order.
+    :param message: The protobuf message to convert.
+    :return: The message as a Python dictionary.
+    """
+    result: Dict[str, Any] = {}
+    for field, value in message.ListFields():
+        if _is_map_field(field):
+            result[field.name] = _map_to_dict_value(field, value, _proto_to_json_dict)
+        elif field.is_repeated:
+            result[field.name] = _repeated_to_dict_value(field, value, _proto_to_json_dict)
+        else:
+            result[field.name] = _scalar_to_dict_value(field, value, _proto_to_json_dict)
+    return result
+
+
 class ProtoBase(Generic[P]):
     """
     This class represents common routines between all sub-messages in API M.
@@ -114,19 +257,26 @@ class ProtoBase(Generic[P]):
         """
         return self._metadata
 
-    def as_json(self) -> str:
+    def as_json(self, compact: bool = False) -> str:
         """
         Serializes and returns the backing protobuf as JSON.
+        :param compact: If True, return the same JSON without indentation, which is much faster to produce than the
+                        default indented output of protobuf's MessageToJson. Default False.
         :return: The backing protobuf as JSON.
         """
+        if compact:
+            return json.dumps(_proto_to_json_dict(self._proto), separators=(",", ":"))
         return MessageToJson(self._proto, True)
 
-    def as_dict(self) -> Dict:
+    def as_dict(self, use_json_format: bool = False) -> Dict:
         """
         Serializes and returns the backing protobuf as a Python dictionary.
+        :param use_json_format: If True, use protobuf's (much slower) MessageToDict. Default False.
         :return: The backing protobuf as a Python dictionary.
         """
-        return MessageToDict(self._proto, True)
+        if use_json_format:
+            return MessageToDict(self._proto, True)
+        return _proto_to_dict(self._proto)
 
     def as_bytes(self) -> bytes:
         """
@@ -2,25 +2,48 @@
 This module handles compression and decompression of API M data.
 """
 
+from typing import List
+
+import lz4.block
 import lz4.frame
+import numpy as np
+
+# The LZ4 block format can not represent inputs of 2 GiB or larger
+MAX_BLOCK_INPUT_SIZE: int = 0x7E000000
+
+# Compression level used by compress_hc. This was the default level prior to favoring the fast LZ4 mode.
+HC_COMPRESSION_LEVEL: int = 12
 
 
-def compress(data: bytes, compression_level: int = 12) -> bytes:
+def compress(data: bytes, compression_level: int = 0) -> bytes:
     """
     Compresses the provided data using the LZ4 frame protocol.
     :param data: The bytes to compress.
     :param compression_level: A value between 0 and 12 where 0 os faster but less compression and 12 is slower, but
-                              provides more compression.
+                              provides more compression. Values of 3 and above use the much slower LZ4-HC mode.
+                              Default 0 (fast mode).
     :return: Compressed bytes.
     """
     return lz4.frame.compress(
         data,
         compression_level=compression_level,
+        block_size=lz4.frame.BLOCKSIZE_MAX4MB,
+        block_linked=True,
+        store_size=True,
         return_bytearray=True,
-        block_linked=False,
     )
 
 
+def compress_hc(data: bytes) -> bytes:
+    """
+    Compresses the provided data using the LZ4 frame protocol in high compression mode. This trades a large amount of
+    compression speed for a modest gain in compression ratio and is intended for archival use.
+    :param data: The bytes to compress.
+    :return: Compressed bytes.
+    """
+    return compress(data, HC_COMPRESSION_LEVEL)
+
+
 def decompress(data: bytes) -> bytes:
     """
     Decompresses the provided data using the LZ4 frame protocol.
@@ -28,3 +51,70 @@ def decompress(data: bytes) -> bytes:
     :return: The decompressed bytes.
     """
     return lz4.frame.decompress(data, True)
+
+
+def decompress_frames(data: bytes) -> bytes:
+    """
+    Decompresses data made of one or more concatenated LZ4 frames, as lz4.frame.open does when reading a file.
+    lz4.frame.decompress on its own only decompresses the first frame.
+    :param data: Data to decompress.
+    :return: The decompressed bytes of all frames.
+    """
+    decompressed, bytes_read = lz4.frame.decompress(data, return_bytes_read=True)
+    if bytes_read >= len(data):
+        return decompressed
+
+    chunks: List[bytes] = [decompressed]
+    remaining: memoryview = memoryview(data)[bytes_read:]
+    while len(remaining) > 0:
+        decompressed, bytes_read = lz4.frame.decompress(remaining, return_bytes_read=True)
+        chunks.append(decompressed)
+        remaining = remaining[bytes_read:]
+    return b"".join(chunks)
+
+
+def block_compress(data: bytes) -> bytearray:
+    """
+    Compresses the provided in-memory data using the LZ4 block format. The block format avoids the framing overhead of
+    the frame protocol, but is not compatible with it. Use this for buffers that are compressed and decompressed in
+    memory, not for .rdvxm files.
+    :param data: The bytes to compress. Must be smaller than MAX_BLOCK_INPUT_SIZE.
+    :return: Compressed bytes with the uncompressed size stored in the header.
+    """
+    if len(data) >= MAX_BLOCK_INPUT_SIZE:
+        raise ValueError(f"data of size {len(data)} is too large for the LZ4 block format")
+    return lz4.block.compress(data, mode="fast", store_size=True, return_bytearray=True)
+
+
+def block_decompress(data: bytes) -> bytearray:
+    """
+    Decompresses data compressed with block_compress.
+    :param data: Data to decompress.
+    :return: The decompressed bytes.
+    """
+    return lz4.block.decompress(data, return_bytearray=True)
+
+
+def compress_shuffled(values: np.ndarray) -> bytearray:
+    """
+    Byte shuffles a numeric array and then compresses it using the LZ4 block format. Shuffling groups the first byte
+    of every element together, then the second byte, and so on. Neighboring samples in sensor data tend to share their
+    high order bytes, so the shuffled bytes contain much longer repeated runs for LZ4 to match than the raw array.
+    :param values: A 1-dimensional numeric array to compress.
+    :return: The compressed bytes. Use decompress_shuffled with the same dtype to recover the array.
+    """
+    contiguous: np.ndarray = np.ascontiguousarray(values)
+    shuffled: np.ndarray = contiguous.view(np.uint8).reshape(-1, contiguous.dtype.itemsize).T
+    return block_compress(shuffled.tobytes())
+
+
+def decompress_shuffled(data: bytes, dtype: np.dtype) -> np.ndarray:
+    """
+    Decompresses data compressed with compress_shuffled.
+    :param data: Data to decompress.
+    :param dtype: The dtype of the array that was compressed.
+    :return: The decompressed 1-dimensional array.
+    """
+    _dtype: np.dtype = np.dtype(dtype)
+    shuffled: np.ndarray = np.frombuffer(block_decompress(data), dtype=np.uint8)
+    return shuffled.reshape(_dtype.itemsize, -1).T.copy().view(_dtype).reshape(-1)
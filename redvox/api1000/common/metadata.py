@@ -2,6 +2,7 @@
 This module provides functions and wrappers for working API M metadata fields.
 """
 
+import sys
 from typing import Dict
 
 from redvox.api1000.common.typing import check_type
@@ -32,10 +33,8 @@ class Metadata:
         Returns the metadata as a dictionary.
         :return: The metadata as a dictionary.
         """
-        metadata_dict: Dict[str, str] = dict()
-        for key, value in self._metadata_proto.items():
-            metadata_dict[key] = value
-        return metadata_dict
+        # Keys and values repeat across every packet, so interning them lets all packets share one copy
+        return {sys.intern(key): sys.intern(value) for key, value in self._metadata_proto.items()}
 
     def set_metadata(self, metadata: Dict[str, str]) -> "Metadata":
         """
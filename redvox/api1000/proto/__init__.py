@@ -0,0 +1,11 @@
+"""
+This package contains the generated protobuf bindings for API M.
+"""
+
+import warnings
+
+import redvox.settings
+
+if not redvox.settings.is_native_protobuf_enabled():
+    warnings.warn("The pure python protobuf runtime is in use, which is much slower at reading RedVox packets. "
+                  "Unset the environmental variable PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION to use the native runtime.")
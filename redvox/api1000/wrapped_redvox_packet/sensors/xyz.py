@@ -4,7 +4,10 @@ This module contains functionality for working with XYZ channeled API M sensors.
 
 from typing import List, Optional
 
+import numpy as np
+
 import redvox.api1000.common.common as common
+import redvox.api1000.errors as errors
 import redvox.api1000.common.typing
 import redvox.api1000.proto.redvox_api_m_pb2 as redvox_api_m_pb2
 import redvox.api1000.common.generic
@@ -108,8 +111,8 @@ class Xyz(
         """
         common.check_type(y_samples, [common.SamplePayload])
         # noinspection Mypy
-        self.get_proto().x_samples.CopyFrom(y_samples.get_proto())
-        self._y_samples = common.SamplePayload(self.get_proto().x_samples)
+        self.get_proto().y_samples.CopyFrom(y_samples.get_proto())
+        self._y_samples = common.SamplePayload(self.get_proto().y_samples)
         return self
 
     def get_z_samples(self) -> common.SamplePayload:
@@ -126,8 +129,33 @@ class Xyz(
         """
         common.check_type(z_samples, [common.SamplePayload])
         # noinspection Mypy
-        self.get_proto().x_samples.CopyFrom(z_samples.get_proto())
-        self._z_samples = common.SamplePayload(self.get_proto().x_samples)
+        self.get_proto().z_samples.CopyFrom(z_samples.get_proto())
+        self._z_samples = common.SamplePayload(self.get_proto().z_samples)
+        return self
+
+    def get_samples_xyz(self) -> np.ndarray:
+        """
+        :return: The x, y, and z samples as a single (N, 3) array where each row contains the x, y, and z values of
+                 one sample. This is convenient for operations that act on all three axes at once.
+        """
+        return np.stack(
+            (self._x_samples.get_values(), self._y_samples.get_values(), self._z_samples.get_values()), axis=1
+        )
+
+    def set_samples_xyz(self, samples: np.ndarray, update_value_statistics: bool = False) -> "Xyz":
+        """
+        Sets the x, y, and z samples from a single (N, 3) array where each row contains the x, y, and z values of one
+        sample.
+        :param samples: The samples to set.
+        :param update_value_statistics: Optional, should the statistics be derived?
+        :return: A modified instance of self.
+        """
+        common.check_type(samples, [np.ndarray])
+        if samples.ndim != 2 or samples.shape[1] != 3:
+            raise errors.ApiMError(f"samples must have the shape (N, 3), but has the shape {samples.shape}")
+        self._x_samples.set_values(samples[:, 0], update_value_statistics)
+        self._y_samples.set_values(samples[:, 1], update_value_statistics)
+        self._z_samples.set_values(samples[:, 2], update_value_statistics)
         return self
 
 
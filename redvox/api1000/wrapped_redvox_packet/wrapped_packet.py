@@ -9,7 +9,6 @@ from typing import Optional, List
 
 # noinspection PyPackageRequirements
 from google.protobuf import json_format
-import lz4.frame
 
 from redvox.api1000.common.common import check_type
 import redvox.api1000.common.typing
@@ -20,6 +19,7 @@ import redvox.api1000.wrapped_redvox_packet.timing_information as _timing_inform
 import redvox.common.date_time_utils as dt_utils
 
 from redvox.api1000.common.generic import ProtoBase, ProtoRepeatedMessage
+from redvox.api1000.common.lz4 import decompress_frames
 from redvox.api1000.proto.redvox_api_m_pb2 import RedvoxPacketM
 from redvox.api1000.wrapped_redvox_packet.event_streams import EventStream
 
@@ -93,7 +93,7 @@ class WrappedRedvoxPacketM(ProtoBase[RedvoxPacketM]):
         """
         redvox.api1000.common.typing.check_type(data, [bytes])
         proto: RedvoxPacketM = RedvoxPacketM()
-        proto.ParseFromString(lz4.frame.decompress(data, False))
+        proto.ParseFromString(decompress_frames(data))
         return WrappedRedvoxPacketM(proto)
 
     @staticmethod
@@ -110,10 +110,10 @@ class WrappedRedvoxPacketM(ProtoBase[RedvoxPacketM]):
                 f"Path to file={rdvxm_path} does not exist."
             )
 
-        with lz4.frame.open(rdvxm_path, "rb") as serialized_in:
-            proto: RedvoxPacketM = RedvoxPacketM()
-            proto.ParseFromString(serialized_in.read())
-            return WrappedRedvoxPacketM(proto)
+        # Decompressing the whole file at once lets LZ4 allocate the output once from the frame's stored content size,
+        # rather than growing it chunk by chunk as the streaming reader does.
+        with open(rdvxm_path, "rb") as compressed_in:
+            return WrappedRedvoxPacketM.from_compressed_bytes(compressed_in.read())
 
     @staticmethod
     def from_json(json_str: str) -> "WrappedRedvoxPacketM":
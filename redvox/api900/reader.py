@@ -4,15 +4,21 @@ This module provides functions and classes for working with RedVox API 900 data.
 """
 
 import collections
+import concurrent.futures
+import functools
 import glob
+import multiprocessing.pool
 import os
 import os.path
+import re
 import typing
 
 import redvox.api900.lib.api900_pb2 as api900_pb2
 import redvox.api900.concat as concat
 import redvox.common.date_time_utils as date_time_utils
 import redvox.api900.reader_utils as reader_utils
+import redvox.settings as settings
+from redvox.common.parallel_utils import maybe_parallel_map
 
 # For backwards compatibility, we want to expose as much as we can from this file since everything used to live in this
 # file. This will allow old code that referenced everything through this module to still function. Someday "soon" we
@@ -43,6 +49,18 @@ from redvox.api900.sensors.light_sensor import LightSensor
 from redvox.api900.sensors.infrared_sensor import InfraredSensor
 from redvox.api900.sensors.image_sensor import ImageSensor
 
+# Below this number of files, the overhead of dispatching reads to a process pool outweighs the gains
+_MIN_PARALLEL_READS: int = 4
+
+# Matches valid API 900 file names of the form [redvox_id]_[timestamp_ms].rdvxz
+_REDVOX_FILENAME_RE: typing.Pattern[str] = re.compile(r"(?P<redvox_id>[0-9]{10})_(?P<timestamp_ms>[0-9]{13})\.rdvxz\Z")
+
+# Number of decompressed files kept in memory by read_rdvxz_file and read_rdvxz_file_range
+_FILE_CACHE_SIZE: int = 256
+
+# Number of threads used to prefetch and decompress files while packets are parsed serially
+_PREFETCH_THREADS: int = 4
+
 # pylint: disable=C0103
 WrappedRedvoxPackets = typing.List[WrappedRedvoxPacket]
 # pylint: disable=C0103
@@ -81,9 +99,7 @@ def read_buffer(buf: bytes, is_compressed: bool = True) -> api900_pb2.RedvoxPack
     :return: Deserialized protobuf redvox packet.
     """
     buffer = reader_utils.lz4_decompress(buf) if is_compressed else buf
-    redvox_packet = api900_pb2.RedvoxPacket()
-    redvox_packet.ParseFromString(buffer)
-    return redvox_packet
+    return api900_pb2.RedvoxPacket.FromString(buffer)
 
 
 def read_file(file: str, is_compressed: bool = None) -> api900_pb2.RedvoxPacket:
@@ -106,23 +122,121 @@ def read_file(file: str, is_compressed: bool = None) -> api900_pb2.RedvoxPacket:
 def read_rdvxz_file(path: str) -> WrappedRedvoxPacket:
     """
     Reads a .rdvxz file from the specified path and returns a WrappedRedvoxPacket.
+
+    When the file cache is enabled in redvox.settings, the decompressed contents of recently read .rdvxz files are
+    cached, so reading the same unmodified file again skips the disk read and decompression. Each call still returns
+    a new, independent WrappedRedvoxPacket. See clear_file_cache.
     :param path: The path of the file.
     :return: A WrappedRedvoxPacket.
     """
-    return wrap(read_file(path))
+    if path.split(".")[-1] != "rdvxz":
+        return wrap(read_file(path))
+    return wrap(read_buffer(_read_decompressed_file(path), False))
+
+
+@functools.lru_cache(maxsize=_FILE_CACHE_SIZE)
+def _read_decompressed_file_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Reads and decompresses a .rdvxz file. The modification time and size are only part of the cache key, so a
+    modified file is read again.
+    :param path: The path of the file.
+    :param mtime_ns: The modification time of the file in nanoseconds.
+    :param size: The size of the file in bytes.
+    :return: The serialized protobuf packet.
+    """
+    with open(path, "rb") as fin:
+        return reader_utils.lz4_decompress(fin.read())
+
+
+def _read_decompressed_file(path: str) -> bytes:
+    """
+    Reads and decompresses a .rdvxz file without parsing it, using the file cache when it is enabled.
+    :param path: The path of the file.
+    :return: The serialized protobuf packet.
+    """
+    if not settings.is_file_cache_enabled():
+        with open(path, "rb") as fin:
+            return reader_utils.lz4_decompress(fin.read())
+    stat: os.stat_result = os.stat(path)
+    return _read_decompressed_file_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+def clear_file_cache() -> None:
+    """
+    Clears the cache of decompressed .rdvxz files used by read_rdvxz_file and read_rdvxz_file_range while the file
+    cache is enabled in redvox.settings.
+    """
+    _read_decompressed_file_cached.cache_clear()
+
+
+def _prefetch_decompressed_files(paths: typing.List[str]) -> typing.Iterator[bytes]:
+    """
+    Reads and decompresses files on a small thread pool while the caller consumes the results. File reads and LZ4
+    decompression release the GIL, so this overlaps I/O and decompression with the caller's parsing. At most
+    2 * _PREFETCH_THREADS files are buffered ahead of the caller.
+    :param paths: The paths of the files to read.
+    :return: An iterator of serialized protobuf packets in the same order as the provided paths.
+    """
+    max_in_flight: int = 2 * _PREFETCH_THREADS
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_PREFETCH_THREADS) as executor:
+        in_flight: typing.Deque[concurrent.futures.Future] = collections.deque()
+        for path in paths:
+            in_flight.append(executor.submit(_read_decompressed_file, path))
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def _read_rdvxz_files(paths: typing.List[str],
+                      pool: typing.Optional[multiprocessing.pool.Pool] = None) -> typing.Iterator[WrappedRedvoxPacket]:
+    """
+    Reads and wraps multiple .rdvxz files. The files are read and decompressed in parallel when parallelism is
+    enabled in redvox.settings and enough files are provided, otherwise they are prefetched on a thread pool.
+    :param paths: The paths of the files to read.
+    :param pool: An optional pool to read the files with.
+    :return: An iterator of WrappedRedvoxPackets in the same order as the provided paths.
+    """
+    buffers: typing.Iterator[bytes]
+    if settings.is_parallelism_enabled() and len(paths) >= _MIN_PARALLEL_READS:
+        # The generated protobuf classes can not be pickled, so workers return the decompressed bytes to be parsed
+        # here.
+        buffers = maybe_parallel_map(pool, _read_decompressed_file, iter(paths), chunk_size=8)
+    elif len(paths) > 1:
+        buffers = _prefetch_decompressed_files(paths)
+    else:
+        buffers = map(_read_decompressed_file, paths)
+    return map(lambda buf: wrap(read_buffer(buf, False)), buffers)
 
 
-def _is_int(int_as_str: str) -> bool:
+def _list_rdvxz_paths(directory: str) -> typing.List[str]:
     """
-    Returns true if the given string can be parsed as an int.
-    :param int_as_str: String to test.
-    :return: True if it is an int, False otherwise.
+    Lists the paths of the .rdvxz files directly within a directory. This uses os.scandir which avoids the additional
+    stat calls and pattern matching performed by glob.
+    :param directory: The directory to list.
+    :return: The paths of the .rdvxz files in the directory or an empty list if the directory does not exist.
     """
     try:
-        int(int_as_str)
-        return True
-    except ValueError:
-        return False
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries
+                    if entry.name.endswith(".rdvxz")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _list_subdirectory_names(directory: str) -> typing.Set[str]:
+    """
+    Lists the names of the subdirectories directly within a directory.
+    :param directory: The directory to list.
+    :return: The names of the subdirectories or an empty set if the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
 
 
 def _is_valid_redvox_filename(filename: str) -> bool:
@@ -131,44 +245,31 @@ def _is_valid_redvox_filename(filename: str) -> bool:
     :param filename: Filename to test.
     :return: True if it is valid, valse otherwise.
     """
-    return len(filename) == 30 \
-        and _is_int(filename[0:10]) \
-        and filename[10:11] == "_" \
-        and _is_int(filename[11:24]) \
-        and filename[24:len(filename)] == ".rdvxz"
+    return _REDVOX_FILENAME_RE.match(filename) is not None
 
 
 def _is_path_in_set(path: str,
                     start_timestamp_utc_s: int,
                     end_timestamp_utc_s: int,
-                    redvox_ids: typing.Set[str] = None) -> bool:
+                    redvox_ids: typing.AbstractSet[str] = frozenset()) -> bool:
     """
     Determines whether a given path is in a provided time range and set of redvox_ids.
     :param path: The path to check.
     :param start_timestamp_utc_s: Start of time range.
     :param end_timestamp_utc_s: End of time range.
-    :param redvox_ids: Optional set of redvox ids.
+    :param redvox_ids: Optional set of redvox ids. When empty, all redvox ids are accepted.
     :return: True if path is in set false otherwise.
     """
-    if redvox_ids is None:
-        redvox_ids = set()
-    filename = path.split(os.sep)[-1]
-
-    if not _is_valid_redvox_filename(filename):
+    match: typing.Optional[typing.Match[str]] = _REDVOX_FILENAME_RE.match(os.path.basename(path))
+    if match is None:
         return False
 
-    timestamp = int(date_time_utils.milliseconds_to_seconds(float(filename[11:24])))
+    timestamp: int = int(match.group("timestamp_ms")) // 1000
 
     if not start_timestamp_utc_s <= timestamp <= end_timestamp_utc_s:
         return False
 
-    if len(redvox_ids) > 0:
-        if len(redvox_ids) > 0:
-            redvox_id = filename[0:10]
-            if redvox_id not in redvox_ids:
-                return False
-
-    return True
+    return not redvox_ids or match.group("redvox_id") in redvox_ids
 
 
 def _extract_timestamp_s(path: str) -> int:
@@ -200,7 +301,7 @@ def _get_time_range_paths(paths: typing.List[str],
     :return: A tuple containing the start and end timestamps of the data range.
     """
     if redvox_ids is not None:
-        paths = list(filter(lambda path: _extract_redvox_id(path) in redvox_ids, paths))
+        paths = [path for path in paths if _extract_redvox_id(path) in redvox_ids]
 
     if len(paths) == 0:
         return -1, -1
@@ -227,8 +328,7 @@ def _get_paths_time_range(directory: str,
         all_paths = glob.glob(os.path.join(directory, "**", "*.rdvxz"),
                               recursive=recursive)
     else:
-        all_paths = glob.glob(os.path.join(directory, "*.rdvxz"),
-                              recursive=recursive)
+        all_paths = _list_rdvxz_paths(directory)
 
     return _get_time_range_paths(all_paths, redvox_ids)
 
@@ -246,7 +346,7 @@ def _sort_dict_by_key(unsorted_dict: typing.Dict[str, typing.List[WrappedRedvoxP
 def _get_structured_paths(directory: str,
                           start_timestamp_utc_s: int,
                           end_timestamp_utc_s: int,
-                          redvox_ids: typing.Set[str] = None) -> typing.List[str]:
+                          redvox_ids: typing.AbstractSet[str] = frozenset()) -> typing.List[str]:
     """
     Given a base directory (which should end with api900), find the paths of all structured .rdvxz files.
     :param directory: The base directory path (which should end with api900)
@@ -255,15 +355,23 @@ def _get_structured_paths(directory: str,
     :param redvox_ids: An optional set of redvox_ids to filter against.
     :return: A list of paths in a structured layout of filtered .rdvxz files.
     """
-    if redvox_ids is None:
-        redvox_ids = set()
     paths = []
+    # The day directories of each month are listed once, so days (and whole months) without data cost no syscalls
+    month_key: typing.Optional[typing.Tuple[str, str]] = None
+    month_dir: str = ""
+    days_in_month: typing.Set[str] = set()
     for (year, month, day) in date_time_utils.DateIterator(start_timestamp_utc_s, end_timestamp_utc_s):
-        all_paths = glob.glob(os.path.join(directory, year, month, day, "*.rdvxz"))
-        valid_paths = list(
-            filter(lambda path: _is_path_in_set(path, start_timestamp_utc_s, end_timestamp_utc_s, redvox_ids),
-                   all_paths))
-        paths.extend(valid_paths)
+        if month_key != (year, month):
+            month_key = (year, month)
+            month_dir = os.path.join(directory, year, month)
+            days_in_month = _list_subdirectory_names(month_dir)
+
+        if day not in days_in_month:
+            continue
+
+        all_paths = _list_rdvxz_paths(os.path.join(month_dir, day))
+        paths.extend([path for path in all_paths
+                      if _is_path_in_set(path, start_timestamp_utc_s, end_timestamp_utc_s, redvox_ids)])
     return paths
 
 
@@ -280,10 +388,16 @@ def _group_by(grouping_fn: typing.Callable[[T], TT],
     :param items: The items to group.
     :return: A dictionary where each key groups similar items into the value.
     """
-    grouped = collections.defaultdict(list)
+    grouped: typing.Dict[TT, typing.List[T]] = {}
+    get_group = grouped.get
 
     for item in items:
-        grouped[grouping_fn(item)].append(item)
+        key: TT = grouping_fn(item)
+        group: typing.Optional[typing.List[T]] = get_group(key)
+        if group is None:
+            grouped[key] = [item]
+        else:
+            group.append(item)
     return grouped
 
 
@@ -297,13 +411,23 @@ def _id_uuid(wrapped_redvox_packet: WrappedRedvoxPacket) -> str:
                       wrapped_redvox_packet.uuid())
 
 
+def _id_uuid_tuple(wrapped_redvox_packet: WrappedRedvoxPacket) -> typing.Tuple[str, str]:
+    """
+    Extracts the redvox id and uuid from a WrappedRedvoxPacket.
+    :param wrapped_redvox_packet: Packet to extract redvox id and uuid from.
+    :return: A tuple of (redvox_id, uuid)
+    """
+    return wrapped_redvox_packet.redvox_id(), wrapped_redvox_packet.uuid()
+
+
 # pylint: disable=R0913
 def read_rdvxz_file_range(directory: str,
                           start_timestamp_utc_s: typing.Optional[int] = None,
                           end_timestamp_utc_s: typing.Optional[int] = None,
                           redvox_ids: typing.Optional[typing.List[str]] = None,
                           structured_layout: bool = False,
-                          concat_continuous_segments: bool = True) -> typing.Dict[
+                          concat_continuous_segments: bool = True,
+                          pool: typing.Optional[multiprocessing.pool.Pool] = None) -> typing.Dict[
                               str, typing.List[WrappedRedvoxPacket]]:
     """
     Reads a range of .rdvxz files from a given directory.
@@ -324,17 +448,19 @@ def read_rdvxz_file_range(directory: str,
     :param structured_layout: An optional value to define if this is loading structured data (default=False).
     :param concat_continuous_segments: An optional value to define if this function should concatenate rdvxz files into
                                        a multiple continuous rdvxz files seperated at gaps.
+    :param pool: An optional pool used to read the files in parallel when parallelism is enabled (default=None).
     :return: A dictionary where each key is a single redvox id and each value is a list of ordered WrappedRedvoxPackets.
     """
 
-    # Remove trailing directory separators
     if redvox_ids is None:
         redvox_ids = []
-    while directory.endswith("/") or directory.endswith("\\"):
-        directory = directory[:-1]
+    # Remove trailing directory separators
+    directory = directory.rstrip("/\\")
+
+    redvox_ids_set: typing.FrozenSet[str] = frozenset(redvox_ids)
 
     if start_timestamp_utc_s is None or end_timestamp_utc_s is None:
-        ids = None if len(redvox_ids) == 0 else set(redvox_ids)
+        ids = None if len(redvox_ids_set) == 0 else redvox_ids_set
         start_adjusted, end_adjusted = _get_paths_time_range(directory, ids, structured_layout)
 
         if start_timestamp_utc_s is None:
@@ -342,24 +468,28 @@ def read_rdvxz_file_range(directory: str,
 
         if end_timestamp_utc_s is None:
             end_timestamp_utc_s = end_adjusted
+
     if structured_layout:
         paths = _get_structured_paths(directory,
                                       start_timestamp_utc_s,
                                       end_timestamp_utc_s,
-                                      set(redvox_ids))
+                                      redvox_ids_set)
     else:
-        all_paths = glob.glob(os.path.join(directory, "*.rdvxz"))
-        paths = list(
-            filter(lambda path: _is_path_in_set(path, start_timestamp_utc_s, end_timestamp_utc_s, set(redvox_ids)),
-                   all_paths))
+        all_paths = _list_rdvxz_paths(directory)
+        paths = [path for path in all_paths
+                 if _is_path_in_set(path, start_timestamp_utc_s, end_timestamp_utc_s, redvox_ids_set)]
 
     # Convert to WrappedRedvoxPackets
-    wrapped_redvox_packets = map(read_rdvxz_file, paths)
+    wrapped_redvox_packets = _read_rdvxz_files(paths, pool)
 
-    # Group by redvox_id
-    grouped = _group_by(_id_uuid, wrapped_redvox_packets)
+    # Group by redvox_id and uuid. Grouping on a tuple avoids formatting a key string for every packet.
+    grouped: typing.Dict[str, typing.List[WrappedRedvoxPacket]] = {
+        "%s:%s" % id_uuid: packets
+        for id_uuid, packets in _group_by(_id_uuid_tuple, wrapped_redvox_packets).items()
+    }
 
-    # Sort
+    # Sort. list.sort evaluates the key once per packet and timsort is fast on the resulting ints, so this is not
+    # improved by extracting the timestamps into a numpy array and using argsort.
     for packets in grouped.values():
         packets.sort(key=WrappedRedvoxPacket.app_file_start_timestamp_machine)
 
@@ -405,24 +535,15 @@ def read_json_string(json: str) -> WrappedRedvoxPacket:
     return wrap(reader_utils.from_json(json))
 
 
-def read_directory(directory_path: str) -> typing.Dict[str, typing.List[WrappedRedvoxPacket]]:
+def read_directory(directory_path: str,
+                   pool: typing.Optional[multiprocessing.pool.Pool] = None) -> typing.Dict[
+                       str, typing.List[WrappedRedvoxPacket]]:
     """
     Reads .rdvxz files from a directory and returns a dictionary from redvox_id -> a list of sorted wrapped redvox
     packets that belong to that device.
     :param directory_path: The path to the directory containing .rdvxz files.
+    :param pool: An optional pool used to read the files in parallel when parallelism is enabled (default=None).
     :return: A dictionary representing a mapping from redvox_id to its packets.
     """
-
-    # Make sure the directory ends with a trailing slash "/"
-    if directory_path[-1] != "/":
-        directory_path = directory_path + "/"
-
-    file_paths = sorted(glob.glob(directory_path + "*.rdvxz"))
-    protobuf_packets = map(read_file, file_paths)
-    wrapped_packets = list(map(wrap, protobuf_packets))
-    grouped = collections.defaultdict(list)
-
-    for wrapped_packet in wrapped_packets:
-        grouped[wrapped_packet.redvox_id()].append(wrapped_packet)
-
-    return grouped
+    file_paths = sorted(_list_rdvxz_paths(directory_path))
+    return _group_by(WrappedRedvoxPacket.redvox_id, _read_rdvxz_files(file_paths, pool))
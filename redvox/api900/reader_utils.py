@@ -4,6 +4,7 @@ users.
 """
 
 import struct
+import sys
 import typing
 
 from google.protobuf import json_format
@@ -46,8 +47,9 @@ def lz4_decompress(buf: bytes) -> bytes:
             "uncompressed size [{}] must be > 0".format(uncompressed_size)
         )
 
+    # A memoryview skips copying the compressed payload just to drop the 4 byte size header
     return lz4.block.decompress(
-        buf[4:], uncompressed_size=calculate_uncompressed_size(buf)
+        memoryview(buf)[4:], uncompressed_size=uncompressed_size
     )
 
 
@@ -494,12 +496,9 @@ def get_metadata_as_dict(metadata: typing.List[str]) -> typing.Dict[str, str]:
         )
 
     metadata_dict = {}
-    metadata_copy = metadata.copy()
-    while len(metadata_copy) >= 2:
-        metadata_key = metadata_copy.pop(0)
-        metadata_value = metadata_copy.pop(0)
-        if metadata_key not in metadata_dict:
-            metadata_dict[metadata_key] = metadata_value
+    for i in range(0, len(metadata), 2):
+        # The first occurrence of a key wins. Keys and values repeat across packets, so they are interned.
+        metadata_dict.setdefault(sys.intern(metadata[i]), sys.intern(metadata[i + 1]))
     return metadata_dict
 
 
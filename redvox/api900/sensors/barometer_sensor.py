@@ -58,3 +58,12 @@ class BarometerSensor(UnevenlySampledSensor):
         :return: The standard deviation of this channel's payload.
         """
         return self._unevenly_sampled_channel.get_value_std(api900_pb2.BAROMETER)
+
+    def payload_stats(self) -> typing.Tuple[float, float, float]:
+        """Returns the mean, median, and standard deviation of this channel's payload.
+        :return: The mean, median, and standard deviation of this channel's payload.
+        """
+        channel = self._unevenly_sampled_channel
+        return (channel.get_value_mean(api900_pb2.BAROMETER),
+                channel.get_value_median(api900_pb2.BAROMETER),
+                channel.get_value_std(api900_pb2.BAROMETER))
@@ -175,21 +175,24 @@ class InterleavedChannel:
         self.protobuf_channel.float32_payload.ClearField("payload")
         self.protobuf_channel.float64_payload.ClearField("payload")
 
+        # protobuf copies python numbers much faster than numpy scalars
+        values = payload_values.tolist() if isinstance(payload_values, numpy.ndarray) else payload_values
+
         # set the payload based on the type of data
         if pl_type == constants.PayloadType.BYTE_PAYLOAD:
             self.protobuf_channel.byte_payload.payload = payload_values
         elif pl_type == constants.PayloadType.UINT32_PAYLOAD:
-            self.protobuf_channel.uint32_payload.payload.extend(payload_values)
+            self.protobuf_channel.uint32_payload.payload.extend(values)
         elif pl_type == constants.PayloadType.UINT64_PAYLOAD:
-            self.protobuf_channel.uint64_payload.payload.extend(payload_values)
+            self.protobuf_channel.uint64_payload.payload.extend(values)
         elif pl_type == constants.PayloadType.INT32_PAYLOAD:
-            self.protobuf_channel.int32_payload.payload.extend(payload_values)
+            self.protobuf_channel.int32_payload.payload.extend(values)
         elif pl_type == constants.PayloadType.INT64_PAYLOAD:
-            self.protobuf_channel.int64_payload.payload.extend(payload_values)
+            self.protobuf_channel.int64_payload.payload.extend(values)
         elif pl_type == constants.PayloadType.FLOAT32_PAYLOAD:
-            self.protobuf_channel.float32_payload.payload.extend(payload_values)
+            self.protobuf_channel.float32_payload.payload.extend(values)
         elif pl_type == constants.PayloadType.FLOAT64_PAYLOAD:
-            self.protobuf_channel.float64_payload.payload.extend(payload_values)
+            self.protobuf_channel.float64_payload.payload.extend(values)
         else:
             raise TypeError("Unknown payload type to set.")
 
@@ -222,7 +225,8 @@ class InterleavedChannel:
         :return: A numpy array of floats or ints of a single channel type.
         """
         idx = self.channel_index(channel_type)
-        if idx < 0:
+        # an empty payload would only be rejected by deinterleave_array
+        if idx < 0 or len(self.payload) == 0:
             return reader_utils.empty_array()
         try:
             payload: numpy.ndarray = reader_utils.deinterleave_array(self.payload, idx, len(self.channel_types))
@@ -59,7 +59,8 @@ class UnevenlySampledChannel(interleaved_channel.InterleavedChannel):
         """
         timestamps = reader_utils.to_array(timestamps)
         self.timestamps_microseconds_utc = timestamps
-        self.protobuf_channel.timestamps_microseconds_utc[:] = timestamps
+        self.protobuf_channel.timestamps_microseconds_utc[:] = \
+            timestamps.tolist() if isinstance(timestamps, numpy.ndarray) else timestamps
 
         if len(timestamps) > 0:
             self.sample_interval_std, self.sample_interval_mean, self.sample_interval_median = \
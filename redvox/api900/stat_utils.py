@@ -15,7 +15,10 @@ def calc_utils(values: numpy.array) -> Tuple[float, float, float]:
     :return: std deviation, mean, median
     """
     mean = numpy.mean(values, dtype=float)
-    stddev = numpy.std(values, dtype=float)
+    # same as numpy.std(values, dtype=float), but reuses the mean instead of computing it again
+    deviations = numpy.subtract(values, mean, dtype=float)
+    numpy.multiply(deviations, deviations, out=deviations)
+    stddev = numpy.sqrt(deviations.sum() / len(values))
     median = numpy.median(values)
     return stddev, mean, median
 
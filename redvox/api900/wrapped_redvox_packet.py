@@ -33,9 +33,7 @@ def read_buffer(buf: bytes, is_compressed: bool = True) -> api900_pb2.RedvoxPack
     :return: Deserialized protobuf redvox packet.
     """
     buffer = reader_utils.lz4_decompress(buf) if is_compressed else buf
-    redvox_packet = api900_pb2.RedvoxPacket()
-    redvox_packet.ParseFromString(buffer)
-    return redvox_packet
+    return api900_pb2.RedvoxPacket.FromString(buffer)
 
 
 # pylint: disable=R0904
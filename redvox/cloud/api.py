@@ -2,15 +2,106 @@
 This module contains methods for interacting with the RedVox cloud based API.
 """
 # from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from collections import OrderedDict
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from redvox.cloud.config import RedVoxConfig
+try:
+    import orjson
+
+    def _dumps_req(req: Any) -> bytes:
+        # orjson serializes (nested) dataclasses natively, without first building a dict with to_dict
+        return orjson.dumps(req, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps_req(req: Any) -> bytes:
+        return json.dumps(req.to_dict()).encode()
+
+    _loads = json.loads
+
+from redvox.cloud.config import RedVoxConfig, resolve_url
 import redvox.cloud.errors as cloud_errors
 from redvox.cloud.routes import RoutesV1
 
 
+_JSON_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
+
+
+def new_session() -> requests.Session:
+    """
+    Creates an HTTP session that keeps connections to the cloud API alive and pools them, so that consecutive
+    requests do not pay for a new TCP and TLS handshake. Failed connections and gateway errors are retried with a
+    short backoff. POST is retried along with the idempotent methods, since the POST routes of the cloud API are
+    queries. When the retries of a gateway error run out, the last response is returned rather than raised.
+    :return: A new HTTP session. It is the responsibility of the caller to close it.
+    """
+    session: requests.Session = requests.Session()
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Successful responses of requests made with use_cache=True, keyed by URL and a digest of the request body
+_RESPONSE_CACHE_SIZE: int = 256
+_RESPONSE_CACHE: "OrderedDict[Tuple[str, bytes], requests.Response]" = OrderedDict()
+_RESPONSE_CACHE_LOCK: threading.Lock = threading.Lock()
+
+
+def clear_response_cache() -> None:
+    """
+    Clears the cached responses of requests made with use_cache=True.
+    """
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+
+
+def _get_cached_response(key: Tuple[str, bytes]) -> Optional[requests.Response]:
+    with _RESPONSE_CACHE_LOCK:
+        resp: Optional[requests.Response] = _RESPONSE_CACHE.get(key)
+        if resp is not None:
+            _RESPONSE_CACHE.move_to_end(key)
+        return resp
+
+
+def _cache_response(key: Tuple[str, bytes], resp: requests.Response) -> None:
+    # Reading the content here ensures it is retained with the cached response
+    _ = resp.content
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = resp
+        _RESPONSE_CACHE.move_to_end(key)
+        while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
+
+def json_resp(resp: requests.Response) -> Any:
+    """
+    Decodes the JSON body of a response. orjson is used when it is installed as it is several times faster than the
+    standard library for large metadata responses.
+    :param resp: The response to decode.
+    :return: The decoded JSON body.
+    """
+    return _loads(resp.content)
+
+
 def post_req(
     redvox_config: RedVoxConfig,
     route: str,
@@ -18,6 +109,7 @@ def post_req(
     resp_transform: Callable[[requests.Response], Any],
     session: Optional[requests.Session] = None,
     timeout: Optional[float] = 10.0,
+    use_cache: bool = False,
 ) -> Optional[Any]:
     """
     Performs an HTTP POST request.
@@ -25,27 +117,41 @@ def post_req(
     :param route: Route to POST to.
     :param req: Request to send in POST.
     :param resp_transform: Function to transform the response into something we can use.
-    :param session: The HTTP session.
+    :param session: An (optional) HTTP session. A new session is used for this request only when not provided.
     :param timeout: An (optional) timeout.
+    :param use_cache: When True, a successful response to an identical earlier request is reused instead of making
+                      the request again. The cached response is transformed anew on every call. Default False.
     :return: The optional response.
     """
-    url: str = redvox_config.url(route)
+    url: str = resolve_url(redvox_config, route)
     # noinspection Mypy
-    req_dict: Dict = req.to_dict()
+    body: bytes = _dumps_req(req)
+
+    cache_key: Optional[Tuple[str, bytes]] = None
+    if use_cache:
+        cache_key = (url, hashlib.blake2b(body, digest_size=16).digest())
+        cached_resp: Optional[requests.Response] = _get_cached_response(cache_key)
+        if cached_resp is not None:
+            return resp_transform(cached_resp)
 
     try:
-        if session:
-            resp: requests.Response = session.post(url, json=req_dict, timeout=timeout)
+        if session is None:
+            # Sessions are not shared between calls, so their connections are never used by several threads or
+            # forked processes, and are closed once the response is read
+            with new_session() as own_session:
+                resp: requests.Response = own_session.post(url, data=body, headers=_JSON_HEADERS, timeout=timeout)
         else:
-            resp = requests.post(url, json=req_dict, timeout=timeout)
+            resp = session.post(url, data=body, headers=_JSON_HEADERS, timeout=timeout)
         if resp.status_code == 200:
+            if cache_key is not None:
+                _cache_response(cache_key, resp)
             # noinspection Mypy
             return resp_transform(resp)
         else:
             return None
     except requests.RequestException as ex:
         raise cloud_errors.ApiConnectionError(
-            f"Error making POST request to {url}: with body: {req_dict}: {ex}"
+            f"Error making POST request to {url}: with body: {body.decode()}: {ex}"
         )
 
 
@@ -61,12 +167,13 @@ def health_check(
     :param timeout: An optional timeout.
     :return: True if the endpoint is up, False otherwise.
     """
-    url: str = redvox_config.url(RoutesV1.HEALTH_CHECK)
+    url: str = resolve_url(redvox_config, RoutesV1.HEALTH_CHECK)
 
-    if session:
-        resp: requests.Response = session.get(url, timeout=timeout)
+    if session is None:
+        with new_session() as own_session:
+            resp: requests.Response = own_session.get(url, timeout=timeout)
     else:
-        resp = requests.get(url, timeout=timeout)
+        resp = session.get(url, timeout=timeout)
 
     if resp.status_code == 200:
         return True
@@ -8,7 +8,7 @@ from typing import Callable, Optional
 from dataclasses_json import dataclass_json
 import requests
 
-from redvox.cloud.api import post_req
+from redvox.cloud.api import json_resp, post_req
 from redvox.cloud.config import RedVoxConfig
 from redvox.cloud.routes import RoutesV1
 
@@ -111,7 +111,7 @@ def authenticate_user(
     # pylint: disable=E1101
     handle_resp: Callable[
         [requests.Response], AuthResp
-    ] = lambda resp: AuthResp.from_dict(resp.json())
+    ] = lambda resp: AuthResp.from_dict(json_resp(resp))
     res: Optional[AuthResp] = post_req(
         redvox_config,
         RoutesV1.AUTH_USER,
@@ -142,7 +142,7 @@ def validate_token(
     # pylint: disable=E1101
     handle_resp: Callable[
         [requests.Response], ValidateTokenResp
-    ] = lambda resp: ValidateTokenResp.from_dict(resp.json())
+    ] = lambda resp: ValidateTokenResp.from_dict(json_resp(resp))
     return post_req(
         redvox_config,
         RoutesV1.VALIDATE_TOKEN,
@@ -171,7 +171,7 @@ def refresh_token(
     # pylint: disable=E1101
     handle_resp: Callable[
         [requests.Response], RefreshTokenResp
-    ] = lambda resp: RefreshTokenResp.from_dict(resp.json())
+    ] = lambda resp: RefreshTokenResp.from_dict(json_resp(resp))
     return post_req(
         redvox_config,
         RoutesV1.REFRESH_TOKEN,
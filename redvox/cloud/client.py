@@ -10,8 +10,6 @@ import threading
 from multiprocessing import Queue
 from typing import List, Optional, Tuple, TYPE_CHECKING, Iterator
 
-import requests
-
 import redvox.cloud.api as api
 import redvox.cloud.auth_api as auth_api
 from redvox.cloud.config import RedVoxConfig
@@ -96,7 +94,7 @@ class CloudClient:
         self.timeout: Optional[float] = timeout
 
         self.__session = (
-            requests.Session()
+            api.new_session()
         )  # This must be initialized before the auth req!
 
         self.__refresh_timer = None
@@ -278,9 +276,8 @@ class CloudClient:
             start_ts_s, end_ts_s, chunk_by_seconds
         )
         metadata_resp: metadata_api.MetadataResp = metadata_api.MetadataResp([])
-
-        for start_ts, end_ts in time_chunks:
-            metadata_req: metadata_api.MetadataReq = metadata_api.MetadataReq(
+        metadata_reqs: List[metadata_api.MetadataReq] = [
+            metadata_api.MetadataReq(
                 self.auth_token,
                 start_ts,
                 end_ts,
@@ -288,16 +285,16 @@ class CloudClient:
                 metadata_to_include,
                 self.redvox_config.secret_token,
             )
+            for start_ts, end_ts in time_chunks
+        ]
 
-            chunked_resp: Optional[
-                metadata_api.MetadataResp
-            ] = metadata_api.request_metadata(
-                self.redvox_config,
-                metadata_req,
-                session=self.__session,
-                timeout=self.timeout,
-            )
-
+        chunked_resp: Optional[metadata_api.MetadataResp]
+        for chunked_resp in metadata_api.request_metadata_batch(
+            self.redvox_config,
+            metadata_reqs,
+            session=self.__session,
+            timeout=self.timeout,
+        ):
             if chunked_resp:
                 metadata_resp.metadata.extend(chunked_resp.metadata)
 
@@ -481,23 +478,24 @@ class CloudClient:
             metadata_api.TimingMetaResponse([])
         )
 
-        for start_ts, end_ts in time_chunks:
-            timing_req: metadata_api.TimingMetaRequest = metadata_api.TimingMetaRequest(
+        timing_reqs: List[metadata_api.TimingMetaRequest] = [
+            metadata_api.TimingMetaRequest(
                 self.auth_token,
                 start_ts,
                 end_ts,
                 station_ids,
                 self.redvox_config.secret_token,
             )
-            chunked_resp: metadata_api.TimingMetaResponse = (
-                metadata_api.request_timing_metadata(
-                    self.redvox_config,
-                    timing_req,
-                    session=self.__session,
-                    timeout=self.timeout,
-                )
-            )
+            for start_ts, end_ts in time_chunks
+        ]
 
+        chunked_resp: metadata_api.TimingMetaResponse
+        for chunked_resp in metadata_api.request_timing_metadata_batch(
+            self.redvox_config,
+            timing_reqs,
+            session=self.__session,
+            timeout=self.timeout,
+        ):
             if chunked_resp:
                 metadata_resp.items.extend(chunked_resp.items)
 
@@ -3,6 +3,7 @@ This module contains capabilities for loading RedVox specific configurations fro
 """
 
 from dataclasses import dataclass
+import functools
 import os
 from pathlib import Path
 from typing import Optional
@@ -169,4 +170,21 @@ class RedVoxConfig:
         :param end_point: Endpoint to use.
         :return: The formatted API URL.
         """
-        return f"{self.protocol}://{self.host}:{self.port}{end_point}"
+        return resolve_url(self, end_point)
+
+
+@functools.lru_cache(maxsize=64)
+def _format_url(protocol: str, host: str, port: int, end_point: str) -> str:
+    return f"{protocol}://{host}:{port}{end_point}"
+
+
+def resolve_url(redvox_config: RedVoxConfig, end_point: str) -> str:
+    """
+    Formats the API URL for a configuration, the same as RedVoxConfig.url. The URLs are memoized since the same few
+    routes are formatted for every request. Calling this directly also skips the runtime type checks that pyserde
+    adds to the methods of RedVoxConfig, which cost several times more than the formatting itself.
+    :param redvox_config: The configuration.
+    :param end_point: Endpoint to use.
+    :return: The formatted API URL.
+    """
+    return _format_url(redvox_config.protocol, redvox_config.host, redvox_config.port, end_point)
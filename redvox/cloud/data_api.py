@@ -10,7 +10,7 @@ from typing import Callable, List, Optional, Tuple
 from dataclasses_json import dataclass_json
 import requests
 
-from redvox.cloud.api import post_req
+from redvox.cloud.api import json_resp, post_req
 from redvox.cloud.config import RedVoxConfig
 import redvox.cloud.data_io as data_io
 import redvox.cloud.data_client as data_client
@@ -117,7 +117,7 @@ def request_report_data(
     # pylint: disable=E1101
     handle_resp: Callable[
         [requests.Response], ReportDataResp
-    ] = lambda resp: ReportDataResp.from_dict(resp.json())
+    ] = lambda resp: ReportDataResp.from_dict(json_resp(resp))
     return post_req(
         redvox_config,
         RoutesV1.DATA_REPORT_REQ,
@@ -158,7 +158,7 @@ def request_range_data(
     # pylint: disable=E1101
     handle_resp: Callable[
         [requests.Response], DataRangeResp
-    ] = lambda resp: DataRangeResp.from_dict(resp.json())
+    ] = lambda resp: DataRangeResp.from_dict(json_resp(resp))
 
     # API 900
     if req_type == DataRangeReqType.API_900:
@@ -2,21 +2,34 @@
 This module contains classes and enums for working with generic RedVox packet metadata through the cloud API.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import json
-from typing import Callable, Dict, List, Optional, TypeVar, Tuple
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Tuple, Union, get_type_hints
 
 from dataclasses_json import dataclass_json
+import numpy as np
 import requests
 from redvox.api1000.wrapped_redvox_packet.wrapped_packet import WrappedRedvoxPacketM
 
-from redvox.cloud.api import post_req
+from redvox.cloud.api import json_resp, new_session, post_req
 from redvox.cloud.config import RedVoxConfig
 from redvox.cloud.routes import RoutesV1, RoutesV2
+from redvox.common.dataclass_utils import dataclass_decoder, unwrap_optional
+
+# Metadata responses can contain many thousands of instances, so the metadata dataclasses are slotted where supported
+# (Python 3.10+) to avoid allocating a __dict__ per instance.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# The sensor metadata dataclasses are frozen so that identical instances within a response can be shared. This bounds
+# the number of distinct instances remembered per sensor type.
+_INTERN_CACHE_SIZE: int = 4096
 
 
 @dataclass_json
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class AudioMetadata:
     """
     Metadata associated with audio sensors.
@@ -32,7 +45,7 @@ class AudioMetadata:
 
 
 @dataclass_json
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SingleMetadata:
     """
     Metadata associated with sensors that only contain a single dimensional channel of data
@@ -52,7 +65,7 @@ class SingleMetadata:
 
 
 @dataclass_json
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class XyzMetadata:
     """
     Metadata for sensors that have 3-dimensions of data (accelerometer, gyroscope, magenetometer)
@@ -77,7 +90,7 @@ class XyzMetadata:
 
 
 @dataclass_json
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class LocationMetadata:
     """
     Metadata associated with the location sensor.
@@ -108,7 +121,7 @@ class LocationMetadata:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_SLOTS)
 class PacketMetadataResult:
     """
     Metadata associated with RedVox API 900 packets.
@@ -149,8 +162,6 @@ class PacketMetadataResult:
     proximity_sensor: Optional[SingleMetadata] = None
 
 
-@dataclass_json
-@dataclass
 # pylint: disable=C0103
 class AvailableMetadata:
     """
@@ -197,45 +208,48 @@ class AvailableMetadata:
         Returns a list of all available metadata definitions.
         :return: A list of all available metadata definitions.
         """
-        return [
-            AvailableMetadata.Api,
-            AvailableMetadata.StationId,
-            AvailableMetadata.StationUuid,
-            AvailableMetadata.AuthEmail,
-            AvailableMetadata.IsBackfilled,
-            AvailableMetadata.IsPrivate,
-            AvailableMetadata.IsScrambled,
-            AvailableMetadata.StationMake,
-            AvailableMetadata.StationModel,
-            AvailableMetadata.StationOs,
-            AvailableMetadata.StationOsVersion,
-            AvailableMetadata.StationAppVersion,
-            AvailableMetadata.BatteryLevel,
-            AvailableMetadata.StationTemperature,
-            AvailableMetadata.AcquisitionUrl,
-            AvailableMetadata.SynchUrl,
-            AvailableMetadata.AuthUrl,
-            AvailableMetadata.OsTs,
-            AvailableMetadata.MachTs,
-            AvailableMetadata.ServerTs,
-            AvailableMetadata.DataKey,
-            AvailableMetadata.MachTimeZero,
-            AvailableMetadata.BestLatency,
-            AvailableMetadata.BestOffset,
-            AvailableMetadata.AudioSensor,
-            AvailableMetadata.BarometerSensor,
-            AvailableMetadata.AccelerometerSensor,
-            AvailableMetadata.GyroscopeSensor,
-            AvailableMetadata.TimeSynchronizationSensor,
-            AvailableMetadata.MagnetometerSensor,
-            AvailableMetadata.LightSensor,
-            AvailableMetadata.ProximitySensor,
-            AvailableMetadata.LocationSensor,
-        ]
+        return list(_ALL_AVAILABLE_METADATA)
+
+
+_ALL_AVAILABLE_METADATA: Tuple[str, ...] = (
+    AvailableMetadata.Api,
+    AvailableMetadata.StationId,
+    AvailableMetadata.StationUuid,
+    AvailableMetadata.AuthEmail,
+    AvailableMetadata.IsBackfilled,
+    AvailableMetadata.IsPrivate,
+    AvailableMetadata.IsScrambled,
+    AvailableMetadata.StationMake,
+    AvailableMetadata.StationModel,
+    AvailableMetadata.StationOs,
+    AvailableMetadata.StationOsVersion,
+    AvailableMetadata.StationAppVersion,
+    AvailableMetadata.BatteryLevel,
+    AvailableMetadata.StationTemperature,
+    AvailableMetadata.AcquisitionUrl,
+    AvailableMetadata.SynchUrl,
+    AvailableMetadata.AuthUrl,
+    AvailableMetadata.OsTs,
+    AvailableMetadata.MachTs,
+    AvailableMetadata.ServerTs,
+    AvailableMetadata.DataKey,
+    AvailableMetadata.MachTimeZero,
+    AvailableMetadata.BestLatency,
+    AvailableMetadata.BestOffset,
+    AvailableMetadata.AudioSensor,
+    AvailableMetadata.BarometerSensor,
+    AvailableMetadata.AccelerometerSensor,
+    AvailableMetadata.GyroscopeSensor,
+    AvailableMetadata.TimeSynchronizationSensor,
+    AvailableMetadata.MagnetometerSensor,
+    AvailableMetadata.LightSensor,
+    AvailableMetadata.ProximitySensor,
+    AvailableMetadata.LocationSensor,
+)
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_SLOTS)
 class MetadataReq:
     """
     The definition of a metadata request. Fields should include the definitions defined by AvailableMetadata.
@@ -250,7 +264,7 @@ class MetadataReq:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_SLOTS)
 class MetadataResp:
     """
     Response of a metadata request.
@@ -350,6 +364,7 @@ class StationStatusResp:
 
 # pylint: disable=C0103
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 def _get(key: str, json_dict: Dict, default: Optional[T] = None) -> Optional[T]:
@@ -423,7 +438,7 @@ class MetadataRespM:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_SLOTS)
 class TimingMetaRequest:
     """
     Request for timing metadata.
@@ -437,7 +452,7 @@ class TimingMetaRequest:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_SLOTS)
 class TimingMeta:
     """
     Timing metadata extracted from an individual packet.
@@ -453,7 +468,7 @@ class TimingMeta:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_SLOTS)
 class TimingMetaResponse:
     """
     Response of obtaining timing metadta.
@@ -462,11 +477,35 @@ class TimingMetaResponse:
     items: List[TimingMeta]
 
 
+_build_metadata_resp: Callable[[Dict], MetadataResp] = dataclass_decoder(MetadataResp, _INTERN_CACHE_SIZE)
+_build_timing_meta: Callable[[Dict], TimingMeta] = dataclass_decoder(TimingMeta, _INTERN_CACHE_SIZE)
+_build_station_status_resp: Callable[[Dict], StationStatusResp] = dataclass_decoder(
+    StationStatusResp, _INTERN_CACHE_SIZE
+)
+
+
+def _timing_meta_response_from_json(json_content: Union[List[Dict], Dict, None]) -> TimingMetaResponse:
+    """
+    Converts the decoded body of a timing metadata response into a TimingMetaResponse. The body is expected to be a
+    list of timing metadata, but a serialized TimingMetaResponse (an object with an "items" list) is also accepted.
+    :param json_content: The decoded JSON body.
+    :return: A timing response containing TimingMeta instances.
+    """
+    if json_content is None:
+        return TimingMetaResponse([])
+
+    if isinstance(json_content, dict):
+        json_content = json_content.get("items") or []
+
+    return TimingMetaResponse([_build_timing_meta(item) for item in json_content])
+
+
 def request_timing_metadata(
     redvox_config: RedVoxConfig,
     timing_req: TimingMetaRequest,
     session: Optional[requests.Session] = None,
     timeout: Optional[float] = None,
+    use_cache: bool = False,
 ) -> TimingMetaResponse:
     """
     Retrieve timing metadata.
@@ -474,15 +513,13 @@ def request_timing_metadata(
     :param timing_req: An instance of a timing request.
     :param session: An (optional) session for re-using an HTTP client.
     :param timeout: An (optional) timeout.
+    :param use_cache: When True, reuse the response of an identical earlier request made with use_cache=True
+                      (default False).
     :return: An instance of a timing response.
     """
 
     def handle_resp(resp) -> TimingMetaResponse:
-        json_content: List[Dict] = resp.json()
-        # noinspection Mypy
-        # pylint: disable=E1101
-        items: List[TimingMeta] = list(map(TimingMeta.from_dict, json_content))
-        return TimingMetaResponse(items)
+        return _timing_meta_response_from_json(json_resp(resp))
 
     res: Optional[TimingMetaResponse] = post_req(
         redvox_config,
@@ -491,16 +528,46 @@ def request_timing_metadata(
         handle_resp,
         session,
         timeout,
+        use_cache,
     )
 
     return res if res else TimingMetaResponse([])
 
 
+def request_timing_metadata_batch(
+    redvox_config: RedVoxConfig,
+    timing_reqs: List[TimingMetaRequest],
+    session: Optional[requests.Session] = None,
+    timeout: Optional[float] = None,
+    max_workers: int = 8,
+    use_cache: bool = False,
+) -> List[TimingMetaResponse]:
+    """
+    Retrieve timing metadata for several requests concurrently.
+    :param redvox_config: An instance of the API configuration.
+    :param timing_reqs: The timing requests to make.
+    :param session: An (optional) session for re-using an HTTP client. Concurrent requests use a session per thread
+                    instead.
+    :param timeout: An (optional) timeout.
+    :param max_workers: The maximum number of concurrent requests (default 8).
+    :param use_cache: When True, reuse the response of an identical earlier request made with use_cache=True
+                      (default False).
+    :return: A timing response for each request, in the same order as the requests.
+    """
+    return _map_requests(
+        lambda req, req_session: request_timing_metadata(redvox_config, req, req_session, timeout, use_cache),
+        timing_reqs,
+        session,
+        max_workers,
+    )
+
+
 def request_metadata(
     redvox_config: RedVoxConfig,
     packet_metadata_req: MetadataReq,
     session: Optional[requests.Session] = None,
     timeout: Optional[float] = None,
+    use_cache: bool = False,
 ) -> Optional[MetadataResp]:
     """
     Requests generic metadata from the cloud API.
@@ -508,13 +575,191 @@ def request_metadata(
     :param packet_metadata_req: An instance of a metadata request.
     :param session: An (optional) session for re-using an HTTP client.
     :param timeout: An (optional) timeout.
+    :param use_cache: When True, reuse the response of an identical earlier request made with use_cache=True
+                      (default False).
     :return: A metadata response on successful call or None if there is an error.
     """
     # noinspection Mypy
     # pylint: disable=E1101
     handle_resp: Callable[
         [requests.Response], MetadataResp
-    ] = lambda resp: MetadataResp.from_dict(resp.json())
+    ] = lambda resp: _build_metadata_resp(json_resp(resp))
+    return post_req(
+        redvox_config,
+        RoutesV1.METADATA_REQ,
+        packet_metadata_req,
+        handle_resp,
+        session,
+        timeout,
+        use_cache,
+    )
+
+
+def _map_requests(
+    request_fn: Callable[[T, Optional[requests.Session]], R],
+    reqs: List[T],
+    session: Optional[requests.Session],
+    max_workers: int,
+) -> List[R]:
+    """
+    Performs a request for each of the provided request objects. The requests are I/O bound, so they are issued
+    concurrently from a pool of threads. requests.Session is not thread safe, so each thread makes its requests with
+    its own session, and these sessions are closed once all requests are done.
+    :param request_fn: Function that performs a single request with the given session.
+    :param reqs: The request objects.
+    :param session: An (optional) session. It is only used when the requests are made one at a time.
+    :param max_workers: The maximum number of concurrent requests.
+    :return: The results of each request in the same order as reqs.
+    """
+    if len(reqs) <= 1 or max_workers <= 1:
+        return [request_fn(req, session) for req in reqs]
+
+    thread_sessions: threading.local = threading.local()
+    sessions: List[requests.Session] = []
+    sessions_lock: threading.Lock = threading.Lock()
+
+    def request_in_thread(req: T) -> R:
+        thread_session: Optional[requests.Session] = getattr(thread_sessions, "session", None)
+        if thread_session is None:
+            thread_session = thread_sessions.session = new_session()
+            with sessions_lock:
+                sessions.append(thread_session)
+        return request_fn(req, thread_session)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(reqs))) as executor:
+            return list(executor.map(request_in_thread, reqs))
+    finally:
+        for thread_session in sessions:
+            thread_session.close()
+
+
+def request_metadata_batch(
+    redvox_config: RedVoxConfig,
+    packet_metadata_reqs: List[MetadataReq],
+    session: Optional[requests.Session] = None,
+    timeout: Optional[float] = None,
+    max_workers: int = 8,
+    use_cache: bool = False,
+) -> List[Optional[MetadataResp]]:
+    """
+    Requests generic metadata from the cloud API for several requests concurrently.
+    :param redvox_config: An instance of the API config.
+    :param packet_metadata_reqs: The metadata requests to make.
+    :param session: An (optional) session for re-using an HTTP client. Concurrent requests use a session per thread
+                    instead.
+    :param timeout: An (optional) timeout.
+    :param max_workers: The maximum number of concurrent requests (default 8).
+    :param use_cache: When True, reuse the response of an identical earlier request made with use_cache=True
+                      (default False).
+    :return: A metadata response or None on error for each request, in the same order as the requests.
+    """
+    return _map_requests(
+        lambda req, req_session: request_metadata(redvox_config, req, req_session, timeout, use_cache),
+        packet_metadata_reqs,
+        session,
+        max_workers,
+    )
+
+
+def _column_dtypes(cls: type) -> Dict[str, Any]:
+    """
+    Determines the NumPy dtype used to store each scalar field of a dataclass as a column.
+    :param cls: The dataclass.
+    :return: A dictionary of field names to dtypes. Fields that are not scalars are omitted.
+    """
+    dtypes: Dict[str, Any] = {}
+    for name, field_type in get_type_hints(cls).items():
+        field_type = unwrap_optional(field_type)
+        if field_type is bool:
+            dtypes[name] = np.bool_
+        elif field_type in (int, float):
+            dtypes[name] = np.float64
+        elif field_type is str:
+            dtypes[name] = object
+    return dtypes
+
+
+class PacketMetadataResultBatch:
+    """
+    A column oriented view of many PacketMetadataResults. Each scalar field of PacketMetadataResult is available as an
+    attribute of the same name holding a NumPy array with one entry per result, which allows aggregating a field over
+    all results without visiting every result object, i.e. batch.best_latency.mean().
+
+    Numeric fields are stored as float64 with missing values as NaN, boolean fields as bool with missing values as
+    False, and string fields as object arrays with missing values as None. Sensor metadata is not included.
+    """
+
+    COLUMN_DTYPES: Dict[str, Any] = _column_dtypes(PacketMetadataResult)
+
+    def __init__(self, columns: Dict[str, np.ndarray]) -> None:
+        """
+        Initialize the instance.
+        :param columns: A dictionary of field names to columns of equal length.
+        """
+        self.columns: Dict[str, np.ndarray] = columns
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        try:
+            return self.__dict__["columns"][name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    @staticmethod
+    def from_json(json_dicts: List[Dict]) -> "PacketMetadataResultBatch":
+        """
+        Builds the columns directly from decoded JSON metadata results.
+        :param json_dicts: The decoded metadata results.
+        :return: A batch containing the results.
+        """
+        columns: Dict[str, np.ndarray] = {}
+        for name, dtype in PacketMetadataResultBatch.COLUMN_DTYPES.items():
+            if dtype is np.bool_:
+                columns[name] = np.array([bool(json_dict.get(name)) for json_dict in json_dicts], dtype=dtype)
+            else:
+                columns[name] = np.array([json_dict.get(name) for json_dict in json_dicts], dtype=dtype)
+        return PacketMetadataResultBatch(columns)
+
+    @staticmethod
+    def from_metadata(metadata: List[PacketMetadataResult]) -> "PacketMetadataResultBatch":
+        """
+        Builds the columns from existing metadata results.
+        :param metadata: The metadata results.
+        :return: A batch containing the results.
+        """
+        columns: Dict[str, np.ndarray] = {}
+        for name, dtype in PacketMetadataResultBatch.COLUMN_DTYPES.items():
+            if dtype is np.bool_:
+                columns[name] = np.array([bool(getattr(result, name)) for result in metadata], dtype=dtype)
+            else:
+                columns[name] = np.array([getattr(result, name) for result in metadata], dtype=dtype)
+        return PacketMetadataResultBatch(columns)
+
+
+def request_metadata_columnar(
+    redvox_config: RedVoxConfig,
+    packet_metadata_req: MetadataReq,
+    session: Optional[requests.Session] = None,
+    timeout: Optional[float] = None,
+    use_cache: bool = False,
+) -> Optional[PacketMetadataResultBatch]:
+    """
+    Requests generic metadata from the cloud API and returns it in column oriented form. This skips constructing a
+    PacketMetadataResult per result.
+    :param redvox_config: An instance of the API config.
+    :param packet_metadata_req: An instance of a metadata request.
+    :param session: An (optional) session for re-using an HTTP client.
+    :param timeout: An (optional) timeout.
+    :param use_cache: When True, reuse the response of an identical earlier request made with use_cache=True
+                      (default False).
+    :return: A batch of metadata results on successful call or None if there is an error.
+    """
+    handle_resp: Callable[
+        [requests.Response], PacketMetadataResultBatch
+    ] = lambda resp: PacketMetadataResultBatch.from_json(json_resp(resp)["metadata"])
     return post_req(
         redvox_config,
         RoutesV1.METADATA_REQ,
@@ -522,6 +767,7 @@ def request_metadata(
         handle_resp,
         session,
         timeout,
+        use_cache,
     )
 
 
@@ -542,7 +788,7 @@ def request_metadata_m(
     # noinspection Mypy
     handle_resp: Callable[
         [requests.Response], MetadataRespM
-    ] = lambda resp: MetadataRespM.from_json(resp.json())
+    ] = lambda resp: MetadataRespM.from_json(json_resp(resp))
     return post_req(
         redvox_config,
         RoutesV1.METADATA_REQ_M,
@@ -562,7 +808,7 @@ def request_station_statuses(
     # noinspection Mypy
     handle_resp: Callable[
         [requests.Response], StationStatusResp
-    ] = lambda resp: StationStatusResp.from_dict(resp.json())
+    ] = lambda resp: _build_station_status_resp(json_resp(resp))
     return post_req(
         redvox_config,
         RoutesV1.STATION_STATUS_TIMELINE,
@@ -667,7 +913,7 @@ def request_geo_metadata(
     # noinspection Mypy
     handle_resp: Callable[
         [requests.Response], GeoMetadataResp
-    ] = lambda resp: GeoMetadataResp.from_json(resp.json())
+    ] = lambda resp: GeoMetadataResp.from_json(json_resp(resp))
     return post_req(
         redvox_config,
         RoutesV2.GEO_METADATA_REQ,
@@ -18,7 +18,7 @@ from dataclasses_json import dataclass_json
 from redvox.api1000.wrapped_redvox_packet.station_information import StationInformation
 from redvox.api1000.wrapped_redvox_packet.timing_information import TimingInformation
 from redvox.api1000.wrapped_redvox_packet.wrapped_packet import WrappedRedvoxPacketM
-from redvox.cloud.api import post_req
+from redvox.cloud.api import json_resp, post_req
 from redvox.cloud.config import RedVoxConfig
 from redvox.cloud.routes import RoutesV3
 from redvox.common.date_time_utils import datetime_from_epoch_microseconds_utc as us2dt
@@ -340,7 +340,9 @@ def request_session(
     :return: An instance of the SessionModelResp.
     """
     # noinspection Mypy
-    handle_resp: Callable[[requests.Response], SessionModelResp] = lambda resp: SessionModelResp.from_dict(resp.json())
+    handle_resp: Callable[[requests.Response], SessionModelResp] = lambda resp: SessionModelResp.from_dict(
+        json_resp(resp)
+    )
     return post_req(
         redvox_config,
         RoutesV3.SESSION_MODEL,
@@ -367,7 +369,7 @@ def request_sessions(
     """
     # noinspection Mypy
     handle_resp: Callable[[requests.Response], SessionModelsResp] = lambda resp: SessionModelsResp.from_dict(
-        resp.json()
+        json_resp(resp)
     )
     return post_req(
         redvox_config,
@@ -396,7 +398,7 @@ def request_dynamic_session(
     # noinspection Mypy
     handle_resp: Callable[
         [requests.Response], DynamicSessionModelResp
-    ] = lambda resp: DynamicSessionModelResp.from_dict(resp.json())
+    ] = lambda resp: DynamicSessionModelResp.from_dict(json_resp(resp))
     return post_req(
         redvox_config,
         RoutesV3.DYNAMIC_SESSION_MODEL,
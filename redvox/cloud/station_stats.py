@@ -10,7 +10,7 @@ import requests
 from dataclasses_json import dataclass_json
 
 import redvox.common.file_statistics as file_stats
-from redvox.cloud.api import post_req
+from redvox.cloud.api import json_resp, post_req
 from redvox.cloud.config import RedVoxConfig
 from redvox.cloud.routes import RoutesV1
 from redvox.common.date_time_utils import (
@@ -147,7 +147,7 @@ def request_station_stats(
     # noinspection Mypy
     handle_resp: Callable[
         [requests.Response], StationStatResp
-    ] = lambda resp: StationStatResp.from_dict(resp.json()).into_station_stats_resp()
+    ] = lambda resp: StationStatResp.from_dict(json_resp(resp)).into_station_stats_resp()
     return post_req(
         redvox_config,
         RoutesV1.STATION_STATS,
@@ -400,7 +400,7 @@ def convert_api_900_to_1000_raw(packet: api_900.RedvoxPacket) -> api_m.RedvoxPac
     normalized_audio: np.ndarray = (
         reader_utils.extract_payload(audio_900) / _NORMALIZATION_CONSTANT
     )
-    packet_m.sensors.audio.samples.values[:] = list(normalized_audio)
+    packet_m.sensors.audio.samples.values[:] = normalized_audio.tolist()
     packet_m.sensors.audio.samples.unit = api_m.RedvoxPacketM.Unit.NORMALIZED_COUNTS
     for i in range(0, len(audio_900.metadata), 2):
         v: str = audio_900.metadata[i + 1] if (i + 1) < len(audio_900.metadata) else ""
@@ -419,9 +419,9 @@ def convert_api_900_to_1000_raw(packet: api_900.RedvoxPacket) -> api_m.RedvoxPac
         packet_m.sensors.pressure.timestamps.timestamps[
             :
         ] = barometer_900.timestamps_microseconds_utc
-        packet_m.sensors.pressure.samples.values[:] = list(
-            reader_utils.extract_payload(barometer_900)
-        )
+        packet_m.sensors.pressure.samples.values[:] = reader_utils.extract_payload(
+            barometer_900
+        ).tolist()
         packet_m.sensors.pressure.samples.unit = api_m.RedvoxPacketM.Unit.KILOPASCAL
         for i in range(0, len(barometer_900.metadata), 2):
             v = (
@@ -745,9 +745,9 @@ def convert_api_900_to_1000_raw(packet: api_900.RedvoxPacket) -> api_m.RedvoxPac
         packet_m.sensors.light.timestamps.timestamps[
             :
         ] = light_900.timestamps_microseconds_utc
-        packet_m.sensors.light.samples.values[:] = list(
-            reader_utils.extract_payload(light_900)
-        )
+        packet_m.sensors.light.samples.values[:] = reader_utils.extract_payload(
+            light_900
+        ).tolist()
         packet_m.sensors.light.samples.unit = api_m.RedvoxPacketM.Unit.LUX
         for i in range(0, len(light_900.metadata), 2):
             v = light_900.metadata[i + 1] if (i + 1) < len(light_900.metadata) else ""
@@ -771,9 +771,9 @@ def convert_api_900_to_1000_raw(packet: api_900.RedvoxPacket) -> api_m.RedvoxPac
         packet_m.sensors.proximity.timestamps.timestamps[
             :
         ] = proximity_900.timestamps_microseconds_utc
-        packet_m.sensors.proximity.samples.values[:] = list(
-            reader_utils.extract_payload(proximity_900)
-        )
+        packet_m.sensors.proximity.samples.values[:] = reader_utils.extract_payload(
+            proximity_900
+        ).tolist()
         packet_m.sensors.proximity.samples.unit = api_m.RedvoxPacketM.Unit.CENTIMETERS
         for i in range(0, len(proximity_900.metadata), 2):
             v = (
@@ -0,0 +1,165 @@
+"""
+Fast conversion of dataclasses_json dataclasses to and from dictionaries.
+
+dataclasses_json inspects the fields and type hints of a dataclass every time an instance is converted. The
+functions in this module resolve the type hints once per dataclass and return a converter that only does the work
+needed for the values of each field. The converters produce the same results as to_dict and from_dict for the
+dataclasses used by the SDK.
+"""
+
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+
+
+def unwrap_optional(field_type: Any) -> Any:
+    """
+    :param field_type: The annotated type of a dataclass field.
+    :return: The type inside Optional, or field_type if it isn't Optional.
+    """
+    if get_origin(field_type) is Union:
+        return next(arg for arg in get_args(field_type) if arg is not type(None))
+    return field_type
+
+
+def value_encoder(field_type: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Returns a function that converts a value of the given field type the same way to_dict does or None if the value
+    can be used as is. Dataclasses become dictionaries and tuples become lists.
+    :param field_type: The annotated type of a dataclass field.
+    :return: A conversion function or None.
+    """
+    field_type = unwrap_optional(field_type)
+
+    if is_dataclass(field_type):
+        return dataclass_encoder(field_type)
+
+    if get_origin(field_type) is dict:
+        value_args: Tuple = get_args(field_type)
+        item_encoder: Optional[Callable[[Any], Any]] = value_encoder(value_args[1]) if value_args else None
+        if item_encoder is None:
+            return dict
+        return lambda values: {key: item_encoder(value) for key, value in values.items()}
+
+    if get_origin(field_type) in (list, tuple):
+        item_encoders: List[Optional[Callable[[Any], Any]]] = [
+            value_encoder(arg) for arg in get_args(field_type) if arg is not Ellipsis
+        ]
+        if all(encoder is None for encoder in item_encoders):
+            return list
+        if get_origin(field_type) is list or Ellipsis in get_args(field_type):
+            return lambda values: [item_encoders[0](value) for value in values]
+        return lambda values: [
+            value if encoder is None else encoder(value) for encoder, value in zip(item_encoders, values)
+        ]
+
+    return None
+
+
+def dataclass_encoder(cls: type) -> Callable[[Any], Dict]:
+    """
+    Creates a function that converts an instance of a dataclass into the dictionary that dataclasses_json's to_dict
+    makes.
+    :param cls: The dataclass to convert.
+    :return: A function converting an instance of cls into a dictionary.
+    """
+    type_hints: Dict[str, Any] = get_type_hints(cls)
+    encoders: List[Tuple[str, Optional[Callable[[Any], Any]]]] = [
+        (field.name, value_encoder(type_hints[field.name])) for field in fields(cls)
+    ]
+
+    def encode(instance: Any) -> Dict:
+        result: Dict[str, Any] = {}
+        for name, encoder in encoders:
+            value: Any = getattr(instance, name)
+            result[name] = value if encoder is None or value is None else encoder(value)
+        return result
+
+    return encode
+
+
+def value_decoder(field_type: Any, intern_cache_size: int = 0) -> Optional[Callable[[Any], Any]]:
+    """
+    Returns a function that converts a decoded JSON value into the given field type the same way from_dict does or
+    None if the value can be used as is.
+    :param field_type: The annotated type of a dataclass field.
+    :param intern_cache_size: Passed on to the decoders of any dataclasses within field_type. Default 0.
+    :return: A conversion function or None.
+    """
+    field_type = unwrap_optional(field_type)
+
+    if is_dataclass(field_type):
+        return dataclass_decoder(field_type, intern_cache_size)
+
+    if get_origin(field_type) is dict:
+        value_args: Tuple = get_args(field_type)
+        item_decoder: Optional[Callable[[Any], Any]] = (
+            value_decoder(value_args[1], intern_cache_size) if value_args else None
+        )
+        if item_decoder is None:
+            return dict
+        return lambda values: {key: item_decoder(value) for key, value in values.items()}
+
+    if get_origin(field_type) in (list, tuple):
+        collection: type = get_origin(field_type)
+        item_decoders: List[Optional[Callable[[Any], Any]]] = [
+            value_decoder(arg, intern_cache_size) for arg in get_args(field_type) if arg is not Ellipsis
+        ]
+        if all(decoder is None for decoder in item_decoders):
+            return collection
+        if collection is list or Ellipsis in get_args(field_type):
+            return lambda values: collection(item_decoders[0](value) for value in values)
+        return lambda values: tuple(
+            value if decoder is None else decoder(value) for decoder, value in zip(item_decoders, values)
+        )
+
+    if field_type in (bool, int, float, str):
+        return lambda value: value if isinstance(value, field_type) else field_type(value)
+
+    return None
+
+
+def dataclass_decoder(cls: type, intern_cache_size: int = 0) -> Callable[[Dict], Any]:
+    """
+    Creates a function that constructs an instance of a dataclass from a decoded JSON dictionary the same way
+    dataclasses_json's from_dict does. Keys that are not fields are ignored and missing keys take the default of the
+    field. Instances of cls are returned as is.
+
+    When intern_cache_size is positive, decoders of frozen dataclasses return the same instance for equal inputs, and
+    remember up to that many distinct instances.
+    :param cls: The dataclass to construct.
+    :param intern_cache_size: The number of distinct instances of frozen dataclasses to remember. Default 0 (none).
+    :return: A function converting a dictionary into an instance of cls.
+    """
+    type_hints: Dict[str, Any] = get_type_hints(cls)
+    decoders: List[Tuple[str, Optional[Callable[[Any], Any]]]] = [
+        (field.name, value_decoder(type_hints[field.name], intern_cache_size)) for field in fields(cls)
+    ]
+
+    def decode(json_dict: Dict) -> Any:
+        if isinstance(json_dict, cls):
+            return json_dict
+        kwargs: Dict[str, Any] = {}
+        for name, decoder in decoders:
+            if name in json_dict:
+                value: Any = json_dict[name]
+                kwargs[name] = value if decoder is None or value is None else decoder(value)
+        return cls(**kwargs)
+
+    # noinspection PyUnresolvedReferences
+    if intern_cache_size < 1 or not cls.__dataclass_params__.frozen:
+        return decode
+
+    interned: Dict[Tuple, Any] = {}
+
+    def decode_interned(json_dict: Dict) -> Any:
+        instance: Any = decode(json_dict)
+        # Lists are not hashable, so the key is built from the field values with lists converted to tuples
+        key: Tuple = tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (getattr(instance, name) for name, _ in decoders)
+        )
+        if key not in interned and len(interned) >= intern_cache_size:
+            interned.clear()
+        return interned.setdefault(key, instance)
+
+    return decode_interned
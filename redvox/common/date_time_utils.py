@@ -630,6 +630,26 @@ class DateIteratorAPIM:
         return year, month, day, hour
 
 
+def truncate_dt_y(date_time: datetime) -> datetime:
+    """
+    Truncates the provides datetime to only year.
+
+    :param date_time: The datetime to truncate.
+    :return: A truncated datetime.
+    """
+    return datetime(date_time.year, 1, 1)
+
+
+def truncate_dt_ym(date_time: datetime) -> datetime:
+    """
+    Truncates the provides datetime to only year, month.
+
+    :param date_time: The datetime to truncate.
+    :return: A truncated datetime.
+    """
+    return datetime(date_time.year, date_time.month, 1)
+
+
 def truncate_dt_ymd(date_time: datetime) -> datetime:
     """
     Truncates the provides datetime to only year, month, day.
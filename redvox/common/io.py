@@ -1,26 +1,36 @@
 """
 This module provides IO primitives for working with cross-API RedVox data.
 """
+import calendar
+import concurrent.futures
 import enum
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from glob import glob
+import hashlib
 import numpy as np
 import json
 import os.path
 import multiprocessing
+import pickle
+import sys
 import multiprocessing.pool
+from operator import attrgetter
 import tempfile
 from pathlib import Path, PurePath
 from shutil import copy2, move, rmtree
 from typing import (
     Any,
+    Container,
+    Deque,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
     Set,
+    Tuple,
     Union,
     TYPE_CHECKING,
     Callable,
@@ -28,21 +38,21 @@ from typing import (
 
 import lz4.frame
 
-from redvox.api900.reader import read_rdvxz_file, read_buffer
-from redvox.api900.reader_utils import calculate_uncompressed_size
+from redvox.api900.reader import read_rdvxz_file, read_buffer, wrap
+from redvox.api900.reader_utils import calculate_uncompressed_size, lz4_decompress
 from redvox.common import api_conversions as ac
 from redvox.api1000.common.common import check_type
+from redvox.api1000.common.lz4 import decompress_frames
 from redvox.api1000.wrapped_redvox_packet.wrapped_packet import WrappedRedvoxPacketM
 from redvox.api1000.proto.redvox_api_m_pb2 import RedvoxPacketM
-from redvox.common.versioning import check_version, ApiVersion
+from redvox.common.versioning import check_version_buf, ApiVersion
 from redvox.common.date_time_utils import (
+    EPOCH,
     datetime_from_epoch_microseconds_utc as dt_us,
-    datetime_from_epoch_milliseconds_utc as dt_ms,
     datetime_to_epoch_microseconds_utc as us_dt,
-    truncate_dt_ymd,
-    truncate_dt_ymdh,
 )
 from redvox.common.parallel_utils import maybe_parallel_map
+import redvox.settings as settings
 
 if TYPE_CHECKING:
     from redvox.api900.wrapped_redvox_packet import WrappedRedvoxPacket
@@ -364,12 +374,26 @@ def _is_int(value: str) -> Optional[int]:
     :param value: The string to test.
     :return: The integer value if it is valid, or None if it is not valid.
     """
+    # Plain digit strings are by far the most common input and can be converted without risking an exception
+    if value.isascii() and value.isdigit():
+        return int(value)
     try:
         return int(value)
     except ValueError:
         return None
 
 
+def _is_int_str(value: str) -> bool:
+    """
+    Tests if a given str consists of ASCII digits with an optional leading minus sign.
+
+    :param value: The string to test.
+    :return: True if the string is an integer, False otherwise.
+    """
+    digits: str = value[1:] if value[:1] == "-" else value
+    return digits.isascii() and digits.isdigit()
+
+
 def _not_none(value: Optional[Any]) -> bool:
     """
     Tests that the given value is not None.
@@ -380,6 +404,56 @@ def _not_none(value: Optional[Any]) -> bool:
     return value is not None
 
 
+def _parse_file_name(name: str) -> Optional[Tuple[str, int, str]]:
+    """
+    Parses the parts of a standard RedVox file name, i.e. "0000000001_1597189452945991.rdvxm".
+
+    :param name: The file name without any directories.
+    :return: The station ID, timestamp, and extension (including the dot) or None if the name is not valid.
+    """
+    # If you have a filename with a dot, but not an extension, i.e. "0000000001_0.", the extension is the dot
+    base, dot, ext = name.rpartition(".")
+    if dot:
+        ext = dot + ext
+    else:
+        base = ext
+        ext = ""
+
+    # Attempt to parse file name parts
+    split_name: List[str] = base.split("_")
+    if len(split_name) != 2:
+        return None
+
+    station_id: str = split_name[0]
+    ts_str: str = split_name[1]
+
+    # Ensure that both the station ID and timestamp can be represented as ints. This rejects invalid names with a scan
+    # of the string instead of a raised exception.
+    if not (_is_int_str(station_id) and _is_int_str(ts_str)):
+        return None
+
+    return station_id, int(ts_str), ext
+
+
+# The largest header that the size of a compressed file can be read from. An LZ4 frame header is at most 19 bytes.
+_MAX_HEADER_SIZE: int = 19
+
+
+def _read_file_header(path: str) -> Optional[Tuple[int, bytes]]:
+    """
+    Reads the information about a RedVox file that is stored at its start. The API version and both the compressed
+    and decompressed sizes can be determined from the result.
+
+    :param path: Path of the file to read.
+    :return: The size of the file in bytes and its first _MAX_HEADER_SIZE bytes, or None if the file DNE.
+    """
+    try:
+        with open(path, "rb") as fp:
+            return os.fstat(fp.fileno()).st_size, fp.read(_MAX_HEADER_SIZE)
+    except FileNotFoundError:
+        return None
+
+
 @dataclass
 class IndexEntry:
     """
@@ -389,12 +463,29 @@ class IndexEntry:
 
     full_path: str
     station_id: str
-    date_time: datetime
+    date_time_us: int
     extension: str
     api_version: ApiVersion
     compressed_file_size_bytes: int = 0
     decompressed_file_size_bytes: int = 0
 
+    def __post_init__(self):
+        # date_time_us replaced a date_time field in the same position, so datetimes are still accepted
+        if isinstance(self.date_time_us, datetime):
+            self.date_time_us = _dt_to_us(self.date_time_us)
+        elif not isinstance(self.date_time_us, (int, np.integer)):
+            raise TypeError(
+                f"date_time_us must be an int of microseconds since the epoch or a datetime, "
+                f"not {type(self.date_time_us).__name__}"
+            )
+
+    @property
+    def date_time(self) -> datetime:
+        """
+        :return: The timestamp of this entry as a datetime.
+        """
+        return dt_us(self.date_time_us)
+
     @staticmethod
     def from_path(path_str: str, strict: bool = True) -> Optional["IndexEntry"]:
         """
@@ -405,47 +496,45 @@ class IndexEntry:
         :param strict: When set, None is returned if the referenced file DNE.
         :return: Either an IndexEntry or successful parse or None.
         """
-        api_version: ApiVersion = check_version(path_str)
-        path: Path = Path(path_str)
-        name: str = path.stem
-        ext: str = path.suffix
-
-        # Attempt to parse file name parts
-        split_name = name.split("_")
-        if len(split_name) != 2:
-            return None
+        return IndexEntry._from_path(path_str, strict, False)
 
-        station_id: str = split_name[0]
-        ts_str: str = split_name[1]
-
-        # If you have a filename with a dot, but not an extension, i.e. "0000000001_0.", we need to remove the dot
-        # from the end and make in the extension
-        if len(ts_str) > 0 and ts_str[-1] == ".":
-            ts_str = ts_str[:-1]
-            ext = "."
-
-        timestamp: Optional[int] = _is_int(ts_str)
+    @staticmethod
+    def _from_path(path_str: str, strict: bool, is_abs: bool) -> Optional["IndexEntry"]:
+        """
+        Implements from_path.
 
-        # Ensure that both the station ID and timestamp can be represented as ints
-        if _is_int(station_id) is None or timestamp is None:
+        :param path_str: The file system path to attempt to parse.
+        :param strict: When set, None is returned if the referenced file DNE.
+        :param is_abs: When set, the path is known to be absolute and normalized, which skips converting it.
+        :return: Either an IndexEntry or successful parse or None.
+        """
+        # The file name is checked first so that files which are not RedVox files are never opened
+        parsed_name: Optional[Tuple[str, int, str]] = _parse_file_name(os.path.basename(path_str))
+        if parsed_name is None:
             return None
 
-        # Parse the datetime per the specified API version
-        date_time: datetime
-        if api_version == ApiVersion.API_1000:
-            date_time = dt_us(timestamp)
-        else:
-            date_time = dt_ms(timestamp)
+        station_id, timestamp, ext = parsed_name
+        # Many entries share each station ID. Interning stores it once and makes filtering by ID an identity check.
+        station_id = sys.intern(station_id)
+
+        # The version and both file sizes are all read from the start of the file, so it is only opened once. An
+        # unknown version means that the file DNE.
+        file_header: Optional[Tuple[int, bytes]] = _read_file_header(path_str)
+        api_version: ApiVersion = ApiVersion.UNKNOWN if file_header is None else check_version_buf(file_header[1])
 
         full_path: str
-        try:
-            full_path = str(path.resolve(strict=True))
-        except FileNotFoundError:
+        if api_version == ApiVersion.UNKNOWN:
             if strict:
                 return None
             full_path = path_str
+        else:
+            full_path = path_str if is_abs else os.path.abspath(path_str)
 
-        return IndexEntry(full_path, station_id, date_time, ext, api_version)._set_compressed_decompressed_lz4_size()
+        # API M file names store microseconds, all others store milliseconds
+        date_time_us: int = timestamp if api_version == ApiVersion.API_1000 else timestamp * 1000
+
+        entry: IndexEntry = IndexEntry(full_path, station_id, date_time_us, ext, api_version)
+        return entry if file_header is None else entry._set_file_sizes(*file_header)
 
     @staticmethod
     def from_native(entry) -> "IndexEntry":
@@ -458,7 +547,7 @@ class IndexEntry:
         return IndexEntry(
             entry.full_path,
             entry.station_id,
-            dt_us(entry.date_time),
+            int(entry.date_time),
             entry.extension,
             ApiVersion.from_str(entry.api_version),
         )._set_compressed_decompressed_lz4_size()
@@ -467,7 +556,7 @@ class IndexEntry:
         import redvox_native
 
         entry = redvox_native.IndexEntry(
-            self.full_path, self.station_id, us_dt(self.date_time), self.extension, self.api_version.value
+            self.full_path, self.station_id, self.date_time_us, self.extension, self.api_version.value
         )
         return entry
 
@@ -478,14 +567,22 @@ class IndexEntry:
 
         :return: updated self
         """
-        if os.path.exists(self.full_path):
-            self.compressed_file_size_bytes = os.path.getsize(self.full_path)
-            with open(self.full_path, "rb") as fp:
-                if self.api_version == ApiVersion.API_1000:
-                    header = lz4.frame.get_frame_info(fp.read())
-                    self.decompressed_file_size_bytes = header["content_size"]
-                elif self.api_version == ApiVersion.API_900:
-                    self.decompressed_file_size_bytes = calculate_uncompressed_size(fp.read())
+        file_header: Optional[Tuple[int, bytes]] = _read_file_header(self.full_path)
+        return self if file_header is None else self._set_file_sizes(*file_header)
+
+    def _set_file_sizes(self, compressed_size: int, header: bytes) -> "IndexEntry":
+        """
+        set the compressed and decompressed file size in bytes from the size and header of the file.
+
+        :param compressed_size: The size of the file in bytes.
+        :param header: The first bytes of the file, see _read_file_header.
+        :return: updated self
+        """
+        self.compressed_file_size_bytes = compressed_size
+        if self.api_version == ApiVersion.API_1000:
+            self.decompressed_file_size_bytes = lz4.frame.get_frame_info(header)["content_size"]
+        elif self.api_version == ApiVersion.API_900:
+            self.decompressed_file_size_bytes = calculate_uncompressed_size(header)
         return self
 
     def read(self) -> Optional[Union[WrappedRedvoxPacketM, "WrappedRedvoxPacket"]]:
@@ -511,10 +608,8 @@ class IndexEntry:
             with open(self.full_path, "rb") as buf_in:
                 return read_buffer(buf_in.read())
         elif self.api_version == ApiVersion.API_1000:
-            with lz4.frame.open(self.full_path, "rb") as serialized_in:
-                proto: RedvoxPacketM = RedvoxPacketM()
-                proto.ParseFromString(serialized_in.read())
-                return proto
+            with open(self.full_path, "rb") as compressed_in:
+                return RedvoxPacketM.FromString(decompress_frames(compressed_in.read()))
         else:
             return None
 
@@ -536,6 +631,14 @@ class IndexEntry:
         return False
 
 
+def _dt_to_us(date_time: datetime) -> int:
+    """
+    :param date_time: The datetime to convert.
+    :return: The exact number of microseconds between the epoch and the given datetime.
+    """
+    return (date_time - EPOCH) // timedelta(microseconds=1)
+
+
 # noinspection DuplicatedCode
 @dataclass
 class ReadFilter:
@@ -626,11 +729,12 @@ class ReadFilter:
         """
         Add a station id filter. Filters against provided station ids.
 
-        :param station_ids: Station ids to filter against.
+        :param station_ids: Station ids to filter against. The ids are interned and stored in a new set, so that they
+                            are shared with the station ids of index entries.
         :return: A modified instance of this filter
         """
         check_type(station_ids, [set, None])
-        self.station_ids = station_ids
+        self.station_ids = None if station_ids is None else set(map(sys.intern, station_ids))
         return self
 
     def with_extensions(self, extensions: Optional[Set[str]]) -> "ReadFilter":
@@ -685,7 +789,9 @@ class ReadFilter:
         :param dt_fn: An (optional) function that will transform one datetime into another.
         :return: True if the datetime is included, False otherwise
         """
-        check_type(date_time, [datetime])
+        # check_type is only called to raise its error, a plain isinstance test keeps the accepted path cheap
+        if not isinstance(date_time, datetime):
+            check_type(date_time, [datetime])
         start_buf: timedelta = timedelta(seconds=0) if self.start_dt_buf is None else self.start_dt_buf
         if self.start_dt is not None and date_time < (dt_fn(self.start_dt - start_buf)):
             return False
@@ -696,6 +802,18 @@ class ReadFilter:
 
         return True
 
+    def _buffered_bounds(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        :return: The start and end datetimes widened by their buffers. Either may be None when not set.
+        """
+        min_dt: Optional[datetime] = (
+            None if self.start_dt is None else self.start_dt - (self.start_dt_buf or timedelta(seconds=0))
+        )
+        max_dt: Optional[datetime] = (
+            None if self.end_dt is None else self.end_dt + (self.end_dt_buf or timedelta(seconds=0))
+        )
+        return min_dt, max_dt
+
     def apply(self, entry: IndexEntry) -> bool:
         """
         Applies this filter to the given IndexEntry.
@@ -703,21 +821,58 @@ class ReadFilter:
         :param entry: The entry to test.
         :return: True if the entry is accepted by the filter, False otherwise.
         """
-        check_type(entry, [IndexEntry])
-
-        if not self.apply_dt(entry.date_time):
-            return False
+        if not isinstance(entry, IndexEntry):
+            check_type(entry, [IndexEntry])
+        return self.compile()(entry)
 
-        if self.station_ids is not None and entry.station_id not in self.station_ids:
-            return False
+    def compile(self) -> Callable[[IndexEntry], bool]:
+        """
+        Returns a predicate that applies this filter. The buffered time bounds are computed once up front instead of
+        for every entry, which makes the predicate well suited for filtering many entries. The predicate is cached
+        until the filter is modified, but a predicate that was already returned does not reflect later changes.
 
-        if self.extensions is not None and entry.extension not in self.extensions:
-            return False
+        :return: A function returning True if an entry is accepted by the filter, False otherwise.
+        """
+        # The sets are identified by id, which is safe because the cached predicate keeps them alive
+        key: Tuple[Any, ...] = (
+            self.start_dt,
+            self.end_dt,
+            self.start_dt_buf,
+            self.end_dt_buf,
+            id(self.station_ids),
+            id(self.extensions),
+            id(self.api_versions),
+        )
+        compiled: Optional[Tuple[Tuple[Any, ...], Callable[[IndexEntry], bool]]] = self.__dict__.get("_compiled")
+        if compiled is not None and compiled[0] == key:
+            return compiled[1]
+
+        min_dt, max_dt = self._buffered_bounds()
+        min_us: Optional[int] = None if min_dt is None else _dt_to_us(min_dt)
+        max_us: Optional[int] = None if max_dt is None else _dt_to_us(max_dt)
+        station_ids: Optional[Set[str]] = self.station_ids
+        extensions: Optional[Set[str]] = self.extensions
+        api_versions: Optional[Set[ApiVersion]] = self.api_versions
+
+        def predicate(entry: IndexEntry) -> bool:
+            return (
+                (min_us is None or entry.date_time_us >= min_us)
+                and (max_us is None or entry.date_time_us <= max_us)
+                and (station_ids is None or entry.station_id in station_ids)
+                and (extensions is None or entry.extension in extensions)
+                and (api_versions is None or entry.api_version in api_versions)
+            )
 
-        if self.api_versions is not None and entry.api_version not in self.api_versions:
-            return False
+        self.__dict__["_compiled"] = (key, predicate)
+        return predicate
 
-        return True
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        :return: The state of this filter for pickling, without the cached predicate which can not be pickled.
+        """
+        state: Dict[str, Any] = self.__dict__.copy()
+        state.pop("_compiled", None)
+        return state
 
 
 @dataclass
@@ -757,11 +912,12 @@ class IndexStationSummary:
         :param entry: Entry to update this summary from.
         """
         self.total_packets += 1
-        if entry.date_time < self.first_packet:
-            self.first_packet = entry.date_time
+        date_time: datetime = entry.date_time
+        if date_time < self.first_packet:
+            self.first_packet = date_time
 
-        if entry.date_time > self.last_packet:
-            self.last_packet = entry.date_time
+        if date_time > self.last_packet:
+            self.last_packet = date_time
 
 
 @dataclass
@@ -844,21 +1000,108 @@ class IndexSummary:
         :param index: Index to build summary from.
         :return: An instance of IndexSummary.
         """
-        station_summaries: Dict[ApiVersion, Dict[str, IndexStationSummary]] = defaultdict(dict)
+        # Summaries are first collected with a single flat lookup per entry and only nested by API version at the end.
+        # Each station is tracked by a plain [total packets, first timestamp, last timestamp, first entry size] list
+        # that is updated in place, and the IndexStationSummary is only built once per station.
+        summaries: Dict[Tuple[ApiVersion, str], List[int]] = {}
+        get_summary: Callable[[Tuple[ApiVersion, str]], Optional[List[int]]] = summaries.get
 
         entry: IndexEntry
         for entry in index.entries:
-            sub_entry: Dict[str, IndexStationSummary] = station_summaries[entry.api_version]
-            if entry.station_id in sub_entry:
-                # Update existing station summary
-                sub_entry[entry.station_id].update(entry)
-            else:
+            key: Tuple[ApiVersion, str] = (entry.api_version, entry.station_id)
+            date_time_us: int = entry.date_time_us
+            collected: Optional[List[int]] = get_summary(key)
+            if collected is None:
                 # Create new station summary
-                sub_entry[entry.station_id] = IndexStationSummary.from_entry(entry)
+                summaries[key] = [1, date_time_us, date_time_us, entry.decompressed_file_size_bytes]
+            else:
+                # Update existing station summary
+                collected[0] += 1
+                if date_time_us < collected[1]:
+                    collected[1] = date_time_us
+                elif date_time_us > collected[2]:
+                    collected[2] = date_time_us
+
+        station_summaries: Dict[ApiVersion, Dict[str, IndexStationSummary]] = defaultdict(dict)
+        for (api_version, station_id), (total_packets, first_us, last_us, size_bytes) in summaries.items():
+            station_summaries[api_version][station_id] = IndexStationSummary(
+                station_id,
+                api_version,
+                total_packets,
+                first_packet=dt_us(first_us),
+                last_packet=dt_us(last_us),
+                single_packet_decompressed_size_bytes=size_bytes,
+            )
 
         return IndexSummary(station_summaries)
 
 
+# Sorts entries by API version, station ID, and timestamp. The API version is compared by name, as ApiVersion.__lt__
+# does, which keeps every comparison in C.
+_INDEX_ENTRY_SORT_KEY: Callable[[IndexEntry], Tuple[str, str, int]] = attrgetter(
+    "api_version.name", "station_id", "date_time_us"
+)
+
+
+# The minimum number of entries for which Index.sort uses _lexsort_entries
+_MIN_LEXSORT_ENTRIES: int = 4096
+
+# The number of evenly spaced neighboring pairs of entries that _is_mostly_sorted compares, and the most of them that
+# may be out of order for the entries to still count as mostly sorted
+_SORTED_SAMPLE_PAIRS: int = 64
+_MAX_SAMPLE_DESCENTS: int = 4
+
+# The sort ranks of the API versions, which are ordered by name
+_API_VERSION_RANKS: Dict[ApiVersion, int] = {
+    api_version: rank for rank, api_version in enumerate(sorted(ApiVersion, key=attrgetter("name")))
+}
+
+
+def _is_mostly_sorted(entries: List[IndexEntry]) -> bool:
+    """
+    Compares a sample of neighboring entries to estimate whether the entries are already close to sorted, e.g. made of
+    a few sorted runs. sorted() merges such runs faster than _lexsort_entries can build its key arrays.
+
+    :param entries: The entries to check.
+    :return: True if few of the sampled neighboring entries are out of order.
+    """
+    step: int = max(1, (len(entries) - 1) // _SORTED_SAMPLE_PAIRS)
+    descents: int = 0
+    for i in range(0, len(entries) - 1, step):
+        if _INDEX_ENTRY_SORT_KEY(entries[i + 1]) < _INDEX_ENTRY_SORT_KEY(entries[i]):
+            descents += 1
+            if descents > _MAX_SAMPLE_DESCENTS:
+                return False
+    return True
+
+
+def _lexsort_entries(entries: List[IndexEntry]) -> List[IndexEntry]:
+    """
+    Sorts entries in the same order as _INDEX_ENTRY_SORT_KEY. The API versions and station IDs are replaced by their
+    ranks, so the sort itself runs on integer arrays with np.lexsort and no tuples are compared.
+
+    :param entries: The entries to sort.
+    :return: A new list of the sorted entries.
+    """
+    count: int = len(entries)
+    try:
+        date_time_us: np.ndarray = np.fromiter(map(attrgetter("date_time_us"), entries), dtype=np.int64, count=count)
+    except OverflowError:
+        # Timestamps that do not fit in an int64 can only be ordered by Python
+        return sorted(entries, key=_INDEX_ENTRY_SORT_KEY)
+
+    station_codes, station_ids = _column_codes(map(attrgetter("station_id"), entries), count)
+    station_ranks: np.ndarray = np.empty(len(station_ids), dtype=np.int32)
+    station_ranks[[station_ids[station_id] for station_id in sorted(station_ids)]] = np.arange(len(station_ids))
+    station_id_ranks: np.ndarray = station_ranks[station_codes]
+    api_version_ranks: np.ndarray = np.fromiter(
+        map(_API_VERSION_RANKS.__getitem__, map(attrgetter("api_version"), entries)), dtype=np.int8, count=count
+    )
+
+    order: np.ndarray = np.lexsort((date_time_us, station_id_ranks, api_version_ranks))
+    return [entries[i] for i in order.tolist()]
+
+
 @dataclass
 class Index:
     """
@@ -918,10 +1161,11 @@ class Index:
         """
         Sorts the entries stored in this index.
         """
-        self.entries = sorted(
-            self.entries,
-            key=lambda entry: (entry.api_version, entry.station_id, entry.date_time),
-        )
+        # entries listed from a directory are often already in order, which sorted() handles in linear time
+        if len(self.entries) < _MIN_LEXSORT_ENTRIES or _is_mostly_sorted(self.entries):
+            self.entries = sorted(self.entries, key=_INDEX_ENTRY_SORT_KEY)
+        else:
+            self.entries = _lexsort_entries(self.entries)
 
     def append(self, entries: Iterator[IndexEntry]) -> None:
         """
@@ -938,6 +1182,12 @@ class Index:
         """
         return IndexSummary.from_index(self)
 
+    def to_columnar(self) -> "IndexColumnar":
+        """
+        :return: A column oriented view of the entries in this index, for filtering the same index repeatedly.
+        """
+        return IndexColumnar.from_index(self)
+
     def get_index_for_station_id(self, station_id: str) -> "Index":
         """
         :param station_id: id to get entries for
@@ -952,9 +1202,9 @@ class Index:
         :param read_filter: Additional filtering to specify which data should be streamed.
         :return: An iterator over RedvoxPacket and RedvoxPacketM instances.
         """
-        filtered: Iterator[IndexEntry] = filter(read_filter.apply, self.entries)
+        filtered: Iterator[IndexEntry] = filter(read_filter.compile(), self.entries)
         # noinspection Mypy
-        return map(IndexEntry.read_raw, filtered)
+        return map(IndexEntry.read_raw, _prefetch_entries(filtered))
 
     def stream(
         self, read_filter: ReadFilter = ReadFilter()
@@ -965,9 +1215,9 @@ class Index:
         :param read_filter: Additional filtering to specify which data should be streamed.
         :return: An iterator over WrappedRedvoxPacket and WrappedRedvoxPacketM instances.
         """
-        filtered: Iterator[IndexEntry] = filter(read_filter.apply, self.entries)
+        filtered: Iterator[IndexEntry] = filter(read_filter.compile(), self.entries)
         # noinspection Mypy
-        return map(IndexEntry.read, filtered)
+        return map(IndexEntry.read, _prefetch_entries(filtered))
 
     def read_raw(self, read_filter: ReadFilter = ReadFilter()) -> List[Union["RedvoxPacket", RedvoxPacketM]]:
         """
@@ -987,6 +1237,74 @@ class Index:
         """
         return list(self.stream(read_filter))
 
+    def _stream_payloads(
+        self, read_filter: ReadFilter, pool: Optional[multiprocessing.pool.Pool], raw: bool
+    ) -> Iterator[Tuple[ApiVersion, Optional[bytes]]]:
+        """
+        Reads and decompresses the files accepted by the filter, in parallel when there are enough of them.
+
+        :param read_filter: Filter specifying which files should be read.
+        :param pool: An optional pool to read the files with.
+        :param raw: When True, API 900 files are always decompressed, matching IndexEntry.read_raw. Otherwise only
+                    .rdvxz API 900 files are decompressed, matching IndexEntry.read.
+        :return: An iterator of (api version, serialized protobuf) pairs in index order.
+        """
+        filtered: List[IndexEntry] = list(filter(read_filter.compile(), self.entries))
+        read_args: Iterator[Tuple[str, ApiVersion, bool]] = (
+            (entry.full_path, entry.api_version, raw or entry.extension == ".rdvxz")
+            for entry in _prefetch_entries(filtered)
+        )
+        payloads: Iterator[Optional[bytes]] = maybe_parallel_map(
+            pool,
+            _read_payload,
+            read_args,
+            lambda: len(filtered) >= _MIN_PARALLEL_READS,
+            chunk_size=8,
+        )
+        return zip(map(lambda entry: entry.api_version, filtered), payloads)
+
+    def read_raw_parallel(
+        self, read_filter: ReadFilter = ReadFilter(), pool: Optional[multiprocessing.pool.Pool] = None
+    ) -> List[Optional[Union["RedvoxPacket", RedvoxPacketM]]]:
+        """
+        Read, decompress, and deserialize RedVox data pointed to by this index. The files are read and decompressed
+        in parallel when parallelism is enabled in redvox.settings and enough files are selected. LZ4 decompression
+        releases the GIL, so a multiprocessing.pool.ThreadPool can be provided instead of a process pool.
+
+        :param read_filter: Additional filtering to specify which data should be read.
+        :param pool: An optional pool to read the files with.
+        :return: A list of RedvoxPacket and RedvoxPacketM instances in index order.
+        """
+        return [
+            _parse_raw_payload(api_version, payload)
+            for api_version, payload in self._stream_payloads(read_filter, pool, True)
+        ]
+
+    def read_parallel(
+        self, read_filter: ReadFilter = ReadFilter(), pool: Optional[multiprocessing.pool.Pool] = None
+    ) -> List[Optional[Union["WrappedRedvoxPacket", WrappedRedvoxPacketM]]]:
+        """
+        Read, decompress, deserialize, and wrap RedVox data pointed to by this index. The files are read and
+        decompressed in parallel when parallelism is enabled in redvox.settings and enough files are selected. LZ4
+        decompression releases the GIL, so a multiprocessing.pool.ThreadPool can be provided instead of a process pool.
+
+        :param read_filter: Additional filtering to specify which data should be read.
+        :param pool: An optional pool to read the files with.
+        :return: A list of WrappedRedvoxPacket and WrappedRedvoxPacketM instances in index order.
+        """
+        result: List[Optional[Union["WrappedRedvoxPacket", WrappedRedvoxPacketM]]] = []
+        api_version: ApiVersion
+        payload: Optional[bytes]
+        for api_version, payload in self._stream_payloads(read_filter, pool, False):
+            packet: Optional[Union["RedvoxPacket", RedvoxPacketM]] = _parse_raw_payload(api_version, payload)
+            if api_version == ApiVersion.API_900:
+                result.append(wrap(packet))
+            elif api_version == ApiVersion.API_1000:
+                result.append(WrappedRedvoxPacketM(packet))
+            else:
+                result.append(None)
+        return result
+
     def files_size(self) -> float:
         """
         :return: sum of file size in bytes of index
@@ -1038,14 +1356,200 @@ class Index:
         return None
 
 
+# The integer codes of the API versions stored by IndexColumnar
+_API_VERSION_CODES: Dict[ApiVersion, int] = {api_version: code for code, api_version in enumerate(ApiVersion)}
+
+
+def _column_codes(values: Iterator[Any], count: int) -> Tuple[np.ndarray, Dict[Any, int]]:
+    """
+    Encodes a column of repeated values as integer codes.
+
+    :param values: The values to encode.
+    :param count: The number of values.
+    :return: The codes of the values and the mapping from each distinct value to its code.
+    """
+    codes: Dict[Any, int] = {}
+    set_default: Callable[[Any, int], int] = codes.setdefault
+    column: np.ndarray = np.fromiter((set_default(value, len(codes)) for value in values), dtype=np.int32, count=count)
+    return column, codes
+
+
+@dataclass
+class IndexColumnar:
+    """
+    A column oriented view of the entries of an Index. Timestamps are stored as an int64 array and station IDs,
+    extensions, and API versions as integer codes, so a ReadFilter is applied to all entries at once with vectorized
+    comparisons. Building the view takes one pass over the entries, which pays off when the same index is filtered
+    many times. The view does not reflect entries added to the index afterwards.
+    """
+
+    entries: List[IndexEntry]
+    date_time_us: np.ndarray
+    station_id_codes: np.ndarray
+    station_ids: Dict[str, int]
+    extension_codes: np.ndarray
+    extensions: Dict[str, int]
+    api_version_codes: np.ndarray
+
+    @staticmethod
+    def from_index(index: Index) -> "IndexColumnar":
+        """
+        Builds the columns of an index.
+
+        :param index: The index to build the columns of.
+        :return: An instance of IndexColumnar.
+        """
+        entries: List[IndexEntry] = list(index.entries)
+        count: int = len(entries)
+        station_id_codes, station_ids = _column_codes(map(attrgetter("station_id"), entries), count)
+        extension_codes, extensions = _column_codes(map(attrgetter("extension"), entries), count)
+        return IndexColumnar(
+            entries,
+            np.fromiter(map(attrgetter("date_time_us"), entries), dtype=np.int64, count=count),
+            station_id_codes,
+            station_ids,
+            extension_codes,
+            extensions,
+            np.fromiter(
+                map(_API_VERSION_CODES.__getitem__, map(attrgetter("api_version"), entries)),
+                dtype=np.int8,
+                count=count,
+            ),
+        )
+
+    def mask(self, read_filter: ReadFilter) -> np.ndarray:
+        """
+        Applies a filter to all entries.
+
+        :param read_filter: The filter to apply.
+        :return: A boolean array that is True for the entries accepted by the filter.
+        """
+        mask: np.ndarray = np.ones(len(self.entries), dtype=bool)
+        min_dt, max_dt = read_filter._buffered_bounds()
+        if min_dt is not None:
+            mask &= self.date_time_us >= _dt_to_us(min_dt)
+        if max_dt is not None:
+            mask &= self.date_time_us <= _dt_to_us(max_dt)
+
+        column: np.ndarray
+        codes: Dict[Any, int]
+        values: Optional[Set[Any]]
+        for column, codes, values in [
+            (self.station_id_codes, self.station_ids, read_filter.station_ids),
+            (self.extension_codes, self.extensions, read_filter.extensions),
+            (self.api_version_codes, _API_VERSION_CODES, read_filter.api_versions),
+        ]:
+            if values is not None:
+                mask &= np.isin(column, [codes[value] for value in values if value in codes])
+        return mask
+
+    def filter(self, read_filter: ReadFilter) -> Index:
+        """
+        :param read_filter: The filter to apply.
+        :return: An Index of the entries accepted by the filter, in their original order.
+        """
+        entries: List[IndexEntry] = self.entries
+        return Index([entries[i] for i in np.flatnonzero(self.mask(read_filter))])
+
+
+# The minimum number of files Index.read_parallel and Index.read_raw_parallel read before using a pool.
+_MIN_PARALLEL_READS: int = 16
+
+
+# The number of files after the one being read that the kernel is asked to start reading
+_PREFETCH_DEPTH: int = 8
+
+
+def _advise_will_need(path: str) -> None:
+    """
+    Tells the kernel that a file is about to be read so it can start reading it into the page cache in the background.
+    Files that can not be opened are ignored, reading them reports the error.
+
+    :param path: The path of the file.
+    """
+    try:
+        fd: int = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _prefetch_entries(entries: Iterable[IndexEntry], depth: int = _PREFETCH_DEPTH) -> Iterator[IndexEntry]:
+    """
+    Yields the provided entries while keeping the files of the next entries prefetched. Each file is advised when it
+    enters a window of depth entries ahead of the one being yielded, so reading it overlaps with decoding the entries
+    before it. This is a no-op on platforms without posix_fadvise.
+
+    :param entries: The entries to yield.
+    :param depth: The number of entries to prefetch ahead of the current entry.
+    :return: An iterator over the entries in their original order.
+    """
+    if not hasattr(os, "posix_fadvise") or depth <= 0:
+        yield from entries
+        return
+
+    window: Deque[IndexEntry] = deque()
+    entry: IndexEntry
+    for entry in entries:
+        _advise_will_need(entry.full_path)
+        window.append(entry)
+        if len(window) > depth:
+            yield window.popleft()
+    yield from window
+
+
+def _read_payload(read_args: Tuple[str, ApiVersion, bool]) -> Optional[bytes]:
+    """
+    Reads and decompresses a RedVox file without deserializing it. The generated protobuf classes can not be pickled,
+    so this is the part of reading that is handed to pool workers.
+
+    :param read_args: The path of the file, its API version, and whether an API 900 file is compressed.
+    :return: The serialized protobuf or None if the API version is not known.
+    """
+    full_path, api_version, compressed = read_args
+    if api_version == ApiVersion.API_1000:
+        with open(full_path, "rb") as compressed_in:
+            return decompress_frames(compressed_in.read())
+    elif api_version == ApiVersion.API_900:
+        with open(full_path, "rb") as buf_in:
+            buf: bytes = buf_in.read()
+        return lz4_decompress(buf) if compressed else buf
+    else:
+        return None
+
+
+def _parse_raw_payload(
+    api_version: ApiVersion, payload: Optional[bytes]
+) -> Optional[Union["RedvoxPacket", RedvoxPacketM]]:
+    """
+    Deserializes a payload returned by _read_payload.
+
+    :param api_version: The API version of the payload.
+    :param payload: The serialized protobuf.
+    :return: One of RedvoxPacket, RedvoxPacketM, or None.
+    """
+    if payload is None:
+        return None
+    elif api_version == ApiVersion.API_900:
+        return read_buffer(payload, False)
+    else:
+        return RedvoxPacketM.FromString(payload)
+
+
 # The following constants are used for identifying valid RedVox API 900 and API 1000 structured directory layouts.
-__VALID_YEARS: Set[str] = {f"{i:04}" for i in range(2015, 2031)}
-__VALID_MONTHS: Set[str] = {f"{i:02}" for i in range(1, 13)}
-__VALID_DATES: Set[str] = {f"{i:02}" for i in range(1, 32)}
-__VALID_HOURS: Set[str] = {f"{i:02}" for i in range(0, 24)}
+# They map each valid directory name to its value, so a single hash lookup both validates and parses a name.
+__VALID_YEARS: Dict[str, int] = {f"{i:04}": i for i in range(2015, 2031)}
+__VALID_MONTHS: Dict[str, int] = {f"{i:02}": i for i in range(1, 13)}
+__VALID_DATES: Dict[str, int] = {f"{i:02}": i for i in range(1, 32)}
+__VALID_HOURS: Dict[str, int] = {f"{i:02}": i for i in range(0, 24)}
 
 
-def _list_subdirs(base_dir: str, valid_choices: Set[str]) -> Iterator[str]:
+def _list_subdirs(base_dir: str, valid_choices: Container[str]) -> Iterator[str]:
     """
     Lists sub-directors in a given base directory that match the provided choices.
 
@@ -1053,8 +1557,33 @@ def _list_subdirs(base_dir: str, valid_choices: Set[str]) -> Iterator[str]:
     :param valid_choices: A list of valid directory names.
     :return: A list of valid subdirs.
     """
-    subdirs: Iterator[str] = map(lambda p: PurePath(p).name, glob(os.path.join(base_dir, "*", "")))
-    return filter(valid_choices.__contains__, subdirs)
+    # The cheap name check comes first so that only candidate entries need their type checked
+    try:
+        with os.scandir(base_dir) as entries:
+            subdirs: List[str] = [entry.name for entry in entries if entry.name in valid_choices and entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return iter([])
+    return iter(subdirs)
+
+
+def _list_files(base_dir: str, extensions: Tuple[str, ...]) -> List[str]:
+    """
+    Lists the non-hidden files in a given base directory that end with one of the provided extensions. The directory
+    is only listed once, regardless of how many extensions are provided.
+
+    :param base_dir: Base dir to find files in.
+    :param extensions: The extensions to match. An empty extension matches all files.
+    :return: A list of paths of the matching files.
+    """
+    try:
+        with os.scandir(base_dir) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if not entry.name.startswith(".") and entry.name.endswith(extensions) and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 # These fields are set at runtime and provide the implementation (either native or pure python) for IO methods
@@ -1105,6 +1634,47 @@ def __api_native(apis_py: Set[ApiVersion]) -> Set[str]:
     return r
 
 
+def _filter_suffixes(read_filter: ReadFilter) -> Tuple[str, ...]:
+    """
+    :param read_filter: The filter to get the file suffixes of.
+    :return: The file name suffixes accepted by the filter, suitable for str.endswith.
+    """
+    return tuple(read_filter.extensions) if read_filter.extensions is not None else ("",)
+
+
+def _entry_from_listed_path(path_str: str) -> Optional[IndexEntry]:
+    """
+    Parses the path of a listed file into an IndexEntry. The indexing functions list absolute, normalized
+    directories, so the paths of their files do not need to be converted again.
+
+    :param path_str: The absolute and normalized path of the file.
+    :return: Either an IndexEntry or successful parse or None.
+    """
+    return IndexEntry._from_path(path_str, True, True)
+
+
+def _index_paths(
+    all_paths: List[str], read_filter: ReadFilter, pool: Optional[multiprocessing.pool.Pool]
+) -> Iterator[IndexEntry]:
+    """
+    Parses file paths into index entries, in parallel when enough paths are provided.
+
+    :param all_paths: The paths to parse. These must be absolute and normalized, see _entry_from_listed_path.
+    :param read_filter: Filter the entries must pass.
+    :param pool: Pool for multiprocessing
+    :return: An iterator of the entries that were parsed and accepted by the filter.
+    """
+    all_entries: Iterator[Optional[IndexEntry]] = maybe_parallel_map(
+        pool,
+        _entry_from_listed_path,
+        iter(all_paths),
+        lambda: len(all_paths) > 128,
+        chunk_size=64,
+    )
+
+    return filter(read_filter.compile(), filter(_not_none, all_entries))
+
+
 def index_unstructured_py(
     base_dir: str,
     read_filter: ReadFilter = ReadFilter(),
@@ -1124,43 +1694,111 @@ def index_unstructured_py(
     check_type(read_filter, [ReadFilter])
 
     index: Index = Index()
+    all_paths: List[str] = _list_files(os.path.abspath(base_dir), _filter_suffixes(read_filter))
+    index.append(_index_paths(all_paths, read_filter, pool))
 
-    extensions: Set[str] = read_filter.extensions if read_filter.extensions is not None else {""}
+    if sort:
+        index.sort()
 
-    all_paths: List[str] = []
+    return index
 
-    extension: str
-    for extension in extensions:
-        pattern: str = str(PurePath(base_dir).joinpath(f"*{extension}"))
-        paths: List[str] = glob(os.path.join(base_dir, pattern))
-        all_paths.extend(paths)
 
-    all_entries: Iterator[Optional[IndexEntry]] = maybe_parallel_map(
-        pool,
-        IndexEntry.from_path,
-        iter(all_paths),
-        lambda: len(all_paths) > 128,
-        chunk_size=64,
-    )
+def _structured_data_dirs(base_dir: str, read_filter: ReadFilter, hourly: bool) -> Iterator[str]:
+    """
+    Walks a structured directory layout (year/month/day for API 900, year/month/day/hour for API M) and yields the
+    data directories that may contain files accepted by the filter. Each level is checked against the filter's time
+    range before it is listed, so that only the subtrees in range are ever visited.
+
+    :param base_dir: Base directory (should be named api900 or api1000).
+    :param read_filter: Filter providing the time range.
+    :param hourly: When True, the layout includes an hour level (API M).
+    :return: An iterator of data directories.
+    """
+    # Truncating the buffered time range to a level of the layout and comparing it with a directory's datetime is the
+    # same as comparing the leading fields of (year, month, day, hour) tuples, so no datetimes are built per directory
+    min_dt, max_dt = read_filter._buffered_bounds()
+    min_t: Tuple[int, ...] = (0,) if min_dt is None else (min_dt.year, min_dt.month, min_dt.day, min_dt.hour)
+    max_t: Tuple[int, ...] = (10000,) if max_dt is None else (max_dt.year, max_dt.month, max_dt.day, max_dt.hour)
+    min_y, min_ym, min_ymd = min_t[:1], min_t[:2], min_t[:3]
+    max_y, max_ym, max_ymd = max_t[:1], max_t[:2], max_t[:3]
+
+    year: str
+    for year in _list_subdirs(base_dir, __VALID_YEARS):
+        y: int = __VALID_YEARS[year]
+        if not min_y <= (y,) <= max_y:
+            continue
 
-    # if len(all_paths) > 128:
-    #     _pool: multiprocessing.pool.Pool = (
-    #         multiprocessing.Pool() if pool is None else pool
-    #     )
-    #     all_entries = _pool.imap(IndexEntry.from_path, iter(all_paths))
-    #     if pool is None:
-    #         _pool.close()
-    # else:
-    #     all_entries = map(IndexEntry.from_path, all_paths)
+        year_dir: str = os.path.join(base_dir, year)
+        month: str
+        for month in _list_subdirs(year_dir, __VALID_MONTHS):
+            m: int = __VALID_MONTHS[month]
+            if not min_ym <= (y, m) <= max_ym:
+                continue
+
+            days_in_month: int = calendar.monthrange(y, m)[1]
+            month_dir: str = os.path.join(year_dir, month)
+            day: str
+            for day in _list_subdirs(month_dir, __VALID_DATES):
+                d: int = __VALID_DATES[day]
+                # Not a real date, i.e. 02/30
+                if d > days_in_month or not min_ymd <= (y, m, d) <= max_ymd:
+                    continue
 
-    entries: Iterator[IndexEntry] = filter(read_filter.apply, filter(_not_none, all_entries))
+                day_dir: str = os.path.join(month_dir, day)
+                if not hourly:
+                    yield day_dir
+                    continue
 
-    index.append(entries)
+                hour: str
+                for hour in _list_subdirs(day_dir, __VALID_HOURS):
+                    if min_t <= (y, m, d, __VALID_HOURS[hour]) <= max_t:
+                        yield os.path.join(day_dir, hour)
 
-    if sort:
-        index.sort()
 
-    return index
+# The number of threads used to list the files of structured data directories
+_SCAN_THREADS: int = min(32, (os.cpu_count() or 1) * 4)
+
+# The minimum number of data directories to list before threads are used
+_MIN_THREADED_SCAN_DIRS: int = 8
+
+
+def _list_dirs_files(data_dirs: List[str], extensions: Tuple[str, ...]) -> List[str]:
+    """
+    :param data_dirs: The directories to list.
+    :param extensions: File name suffixes to match.
+    :return: The paths of the matching files, in the order of the provided directories.
+    """
+    all_paths: List[str] = []
+    data_dir: str
+    for data_dir in data_dirs:
+        all_paths.extend(_list_files(data_dir, extensions))
+    return all_paths
+
+
+def _list_data_dir_files(data_dirs: List[str], extensions: Tuple[str, ...]) -> List[str]:
+    """
+    Lists the files of many data directories. Listing a directory is dominated by system calls that release the GIL,
+    so when parallelism is enabled in redvox.settings, the directories are split between the threads of a thread pool
+    and listed concurrently. This helps most on network file systems, where each listing waits on the server.
+
+    :param data_dirs: The directories to list.
+    :param extensions: File name suffixes to match.
+    :return: The paths of the matching files, in the order of the provided directories.
+    """
+    if not settings.is_parallelism_enabled() or len(data_dirs) < _MIN_THREADED_SCAN_DIRS:
+        return _list_dirs_files(data_dirs, extensions)
+
+    # Each thread lists a contiguous run of directories, which keeps the per task overhead low and the order stable
+    threads: int = min(_SCAN_THREADS, len(data_dirs))
+    run_len: int = -(-len(data_dirs) // threads)
+    runs: List[List[str]] = [data_dirs[i: i + run_len] for i in range(0, len(data_dirs), run_len)]
+
+    all_paths: List[str] = []
+    paths: List[str]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(runs)) as executor:
+        for paths in executor.map(lambda run: _list_dirs_files(run, extensions), runs):
+            all_paths.extend(paths)
+    return all_paths
 
 
 def index_structured_api_900_py(
@@ -1178,26 +1816,13 @@ def index_structured_api_900_py(
     :param pool: Pool for multiprocessing
     :return: A list of wrapped packets on an empty list if none match the filter or none are found
     """
-    index: Index = Index()
-
-    _pool: multiprocessing.pool.Pool = multiprocessing.Pool() if pool is None else pool
-
-    for year in _list_subdirs(base_dir, __VALID_YEARS):
-        for month in _list_subdirs(os.path.join(base_dir, year), __VALID_MONTHS):
-            for day in _list_subdirs(os.path.join(base_dir, year, month), __VALID_DATES):
-                # Before scanning for *.rdvxz files, let's see if the current year, month, day, are in the
-                # filter's range. If not, we can short circuit and skip getting the *.rdvxz files.
-                if not read_filter.apply_dt(datetime(int(year), int(month), int(day)), dt_fn=truncate_dt_ymd):
-                    continue
-
-                data_dir: str = os.path.join(base_dir, year, month, day)
-                entries: Iterator[IndexEntry] = iter(
-                    index_unstructured_py(data_dir, read_filter, sort=False, pool=_pool).entries
-                )
-                index.append(entries)
+    # The files of every data directory are collected first, so that they are all parsed by a single parallel map
+    all_paths: List[str] = _list_data_dir_files(
+        list(_structured_data_dirs(os.path.abspath(base_dir), read_filter, False)), _filter_suffixes(read_filter)
+    )
 
-    if pool is None:
-        _pool.close()
+    index: Index = Index()
+    index.append(_index_paths(all_paths, read_filter, pool))
 
     if sort:
         index.sort()
@@ -1219,30 +1844,13 @@ def index_structured_api_1000_py(
     :param pool: Pool for multiprocessing
     :return: A list of wrapped packets on an empty list if none match the filter or none are found
     """
-    index: Index = Index()
-
-    _pool: multiprocessing.pool.Pool = multiprocessing.Pool() if pool is None else pool
-
-    for year in _list_subdirs(base_dir, __VALID_YEARS):
-        for month in _list_subdirs(os.path.join(base_dir, year), __VALID_MONTHS):
-            for day in _list_subdirs(os.path.join(base_dir, year, month), __VALID_DATES):
-                for hour in _list_subdirs(os.path.join(base_dir, year, month, day), __VALID_HOURS):
-                    # Before scanning for *.rdvxm files, let's see if the current year, month, day, hour are in the
-                    # filter's range. If not, we can short circuit and skip getting the *.rdvxm files.
-                    if not read_filter.apply_dt(
-                        datetime(int(year), int(month), int(day), int(hour)),
-                        dt_fn=truncate_dt_ymdh,
-                    ):
-                        continue
-
-                    data_dir: str = os.path.join(base_dir, year, month, day, hour)
-                    entries: Iterator[IndexEntry] = iter(
-                        index_unstructured_py(data_dir, read_filter, sort=False, pool=_pool).entries
-                    )
-                    index.append(entries)
+    # The files of every data directory are collected first, so that they are all parsed by a single parallel map
+    all_paths: List[str] = _list_data_dir_files(
+        list(_structured_data_dirs(os.path.abspath(base_dir), read_filter, True)), _filter_suffixes(read_filter)
+    )
 
-    if pool is None:
-        _pool.close()
+    index: Index = Index()
+    index.append(_index_paths(all_paths, read_filter, pool))
 
     if sort:
         index.sort()
@@ -1469,10 +2077,116 @@ def index_structured_api_1000(
     return __INDEX_STRUCTURED_1000_FN(base_dir, read_filter, sort, pool)
 
 
+# Version of the on-disk index cache format. Bump this when IndexEntry or the fingerprint changes.
+_INDEX_CACHE_VERSION: int = 2
+
+
+def _read_filter_key(read_filter: ReadFilter) -> Tuple[Any, ...]:
+    """
+    :param read_filter: The filter to describe.
+    :return: A description of the filter that is independent of set iteration order.
+    """
+
+    def _sorted(values: Optional[Set[Any]]) -> Optional[List[str]]:
+        return None if values is None else sorted(map(str, values))
+
+    return (
+        read_filter.start_dt,
+        read_filter.end_dt,
+        _sorted(read_filter.station_ids),
+        _sorted(read_filter.extensions),
+        read_filter.start_dt_buf,
+        read_filter.end_dt_buf,
+        _sorted(read_filter.api_versions),
+    )
+
+
+def _structured_fingerprint(base_dir: str, read_filter: ReadFilter) -> bytes:
+    """
+    Fingerprints the parts of a structured directory layout that indexing with the given filter would visit. The
+    data directories are walked with the same time based pruning as indexing, but only their modification times are
+    read, so the files themselves are never listed. Adding, removing, or renaming a file changes the modification
+    time of its data directory and therefore the fingerprint.
+
+    :param base_dir: The base_dir may either end with api900, api1000, or be a parent directory to one or both of
+                     API 900 and API 1000.
+    :param read_filter: Filter used for indexing.
+    :return: The fingerprint.
+    """
+    base_path: PurePath = PurePath(base_dir)
+    api_dirs: List[Tuple[str, bool]]
+    if base_path.name == "api900":
+        api_dirs = [(base_dir, False)]
+    elif base_path.name == "api1000":
+        api_dirs = [(base_dir, True)]
+    else:
+        api_dirs = [(os.path.join(base_dir, "api900"), False), (os.path.join(base_dir, "api1000"), True)]
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((_INDEX_CACHE_VERSION, os.path.abspath(base_dir), _read_filter_key(read_filter))).encode())
+    api_dir: str
+    hourly: bool
+    for api_dir, hourly in api_dirs:
+        data_dir: str
+        for data_dir in _structured_data_dirs(api_dir, read_filter, hourly):
+            digest.update(f"{data_dir}\0{os.stat(data_dir).st_mtime_ns}\0".encode())
+    return digest.digest()
+
+
+def _load_index_cache(cache_path: str, fingerprint: bytes) -> Optional[Index]:
+    """
+    Loads a cached index.
+
+    :param cache_path: Path of the cache file.
+    :param fingerprint: The expected fingerprint of the indexed directories.
+    :return: The cached index or None if the cache does not exist, is unreadable, or is stale.
+    """
+    try:
+        with open(cache_path, "rb") as cache_in:
+            cached_fingerprint, entries = pickle.load(cache_in)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError, TypeError):
+        return None
+
+    if cached_fingerprint != fingerprint:
+        return None
+
+    return Index(entries)
+
+
+def _store_index_cache(cache_path: str, fingerprint: bytes, index: Index) -> bool:
+    """
+    Atomically writes an index to a cache file, replacing any previous cache. The cache is only an optimization, so
+    an index that can not be written is not cached and no error is raised.
+
+    :param cache_path: Path of the cache file.
+    :param fingerprint: The fingerprint of the indexed directories.
+    :param index: The index to cache.
+    :return: True if the cache was written, False otherwise.
+    """
+    cache_dir: str = os.path.dirname(os.path.abspath(cache_path))
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return False
+
+    try:
+        with os.fdopen(fd, "wb") as cache_out:
+            pickle.dump((fingerprint, index.entries), cache_out, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        return True
+    except (OSError, pickle.PicklingError):
+        os.remove(tmp_path)
+        return False
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
 def index_structured(
     base_dir: str,
     read_filter: ReadFilter = ReadFilter(),
     pool: Optional[multiprocessing.pool.Pool] = None,
+    cache_path: Optional[str] = None,
 ) -> Index:
     """
     Indexes both API 900 and API 1000 structured directory layouts.
@@ -1481,9 +2195,24 @@ def index_structured(
                      API 900 and API 1000.
     :param read_filter: Filter to further filter results.
     :param pool: Pool for multiprocessing
+    :param cache_path: An optional path of a file to cache the index in. When the cache was written for the same
+                       directory and filter, and no data directories have changed since, the cached index is returned
+                       without indexing the files again. Otherwise the directories are indexed and the cache is
+                       replaced. Changes to the contents of existing files are not detected. An index that can not
+                       be written to the cache is still returned. The cache is a pickle, and loading a pickle can run
+                       arbitrary code, so only use a cache file that you trust and that others can not write to.
+                       Default None (no cache).
     :return: An Index of RedVox files.
     """
-    return __INDEX_STRUCTURED_FN(base_dir, read_filter, pool)
+    if cache_path is None:
+        return __INDEX_STRUCTURED_FN(base_dir, read_filter, pool)
+
+    fingerprint: bytes = _structured_fingerprint(base_dir, read_filter)
+    index: Optional[Index] = _load_index_cache(cache_path, fingerprint)
+    if index is None:
+        index = __INDEX_STRUCTURED_FN(base_dir, read_filter, pool)
+        _store_index_cache(cache_path, fingerprint, index)
+    return index
 
 
 def sort_unstructured_redvox_data(
@@ -1517,13 +2246,10 @@ def sort_unstructured_redvox_data(
         print(f"Base directory for creation: {output_dir} does not exist.  Please create it.  Stopping program.")
         return False
 
+    # The input directory is listed once for all extensions
     index: Index = Index()
-    extension: str
-    for extension in read_filter.extensions:
-        pattern: str = str(PurePath(input_dir).joinpath(f"*{extension}"))
-        paths: List[str] = glob(os.path.join(input_dir, pattern))
-        entries: Iterator[IndexEntry] = filter(read_filter.apply, filter(_not_none, map(IndexEntry.from_path, paths)))
-        index.append(entries)
+    all_paths: List[str] = _list_files(os.path.abspath(input_dir), _filter_suffixes(read_filter))
+    index.append(_index_paths(all_paths, read_filter, None))
 
     if len(index.entries) < 1:
         print(f"Directory with files to sort: {input_dir} does not contain Redvox data to read.  Stopping program.")
@@ -1531,23 +2257,24 @@ def sort_unstructured_redvox_data(
 
     for value in index.entries:
         api_version = value.api_version
+        date_time: datetime = value.date_time
         if api_version == ApiVersion.API_1000:
             file_out_dir = str(
                 PurePath(output_dir).joinpath(
                     "api1000",
-                    f"{value.date_time.year:04}",
-                    f"{value.date_time.month:02}",
-                    f"{value.date_time.day:02}",
-                    f"{value.date_time.hour:02}",
+                    f"{date_time.year:04}",
+                    f"{date_time.month:02}",
+                    f"{date_time.day:02}",
+                    f"{date_time.hour:02}",
                 )
             )
         elif api_version == ApiVersion.API_900:
             file_out_dir = str(
                 PurePath(output_dir).joinpath(
                     "api900",
-                    f"{value.date_time.year:04}",
-                    f"{value.date_time.month:02}",
-                    f"{value.date_time.day:02}",
+                    f"{date_time.year:04}",
+                    f"{date_time.month:02}",
+                    f"{date_time.day:02}",
                 )
             )
         else:
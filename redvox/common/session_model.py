@@ -1,6 +1,7 @@
+import math
 import os.path
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
 
@@ -9,6 +10,7 @@ import redvox.api1000.proto.redvox_api_m_pb2 as api_m
 from redvox.cloud import session_model_api as cloud_sm
 import redvox.common.api_conversions as ac
 import redvox.common.date_time_utils as dtu
+from redvox.common.dataclass_utils import dataclass_decoder, dataclass_encoder
 from redvox.common.errors import RedVoxError, RedVoxExceptions
 from redvox.common import io
 from redvox.common.offset_model import OffsetModel
@@ -22,6 +24,28 @@ CLIENT_VERSION = SESSION_VERSION  # Version of the client used to create the Ses
 APP_NAME = "RedVox"  # Default name of the app
 DAILY_SESSION_NAME = "Day"  # Identifier for day-long dynamic sessions
 HOURLY_SESSION_NAME = "Hour"  # Identifier for hour-long dynamic sessions
+_HOUR_US = int(dtu.MICROSECONDS_IN_HOUR)  # Length of an hourly dynamic session in microseconds
+_DAY_US = int(dtu.MICROSECONDS_IN_DAY)  # Length of a daily dynamic session in microseconds
+
+
+def _get_dynamic_bounds(timestamp: float, length_us: int) -> Tuple[int, int]:
+    """
+    UTC hours and days are whole multiples of their length after the epoch, so the bounds are found with integer
+    arithmetic.  The timestamp is rounded to the nearest microsecond and NaN is treated as 0, the same as
+    dtu.datetime_from_epoch_microseconds_utc.
+
+    :param timestamp: timestamp in microseconds since epoch UTC
+    :param length_us: length of the dynamic session in microseconds
+    :return: start and end timestamps in microseconds since epoch UTC of the dynamic session containing timestamp
+    """
+    start_ts = (0 if math.isnan(timestamp) else round(timestamp)) // length_us * length_us
+    return start_ts, start_ts + length_us
+
+
+_session_to_dict: Callable[[cloud_sm.Session], Dict] = dataclass_encoder(cloud_sm.Session)
+_session_from_dict: Callable[[Dict], cloud_sm.Session] = dataclass_decoder(cloud_sm.Session)
+_dynamic_session_to_dict: Callable[[cloud_sm.DynamicSession], Dict] = dataclass_encoder(cloud_sm.DynamicSession)
+_dynamic_session_from_dict: Callable[[Dict], cloud_sm.DynamicSession] = dataclass_decoder(cloud_sm.DynamicSession)
 
 
 def _get_session_key_from_packet(packet: api_m.RedvoxPacketM) -> str:
@@ -61,8 +85,8 @@ class SessionModel:
         :return: SessionModel as dictionary
         """
         return {
-            "cloud_session": self.cloud_session.to_dict(),
-            "dynamic_sessions": {n: m.to_dict() for n, m in self.dynamic_sessions.items()},
+            "cloud_session": _session_to_dict(self.cloud_session),
+            "dynamic_sessions": {n: _dynamic_session_to_dict(m) for n, m in self.dynamic_sessions.items()},
         }
 
     @staticmethod
@@ -72,8 +96,8 @@ class SessionModel:
         :return: SessionModel from the dict
         """
         return SessionModel(
-            cloud_sm.Session.from_dict(dictionary["cloud_session"]),
-            {n: cloud_sm.DynamicSession.from_dict(m) for n, m in dictionary["dynamic_sessions"].items()},
+            _session_from_dict(dictionary["cloud_session"]),
+            {n: _dynamic_session_from_dict(m) for n, m in dictionary["dynamic_sessions"].items()},
         )
 
     def compress(self, out_dir: str = ".") -> Path:
@@ -140,40 +164,37 @@ class SessionModel:
                     f"Timing is required to complete SessionModel.\nNow Quitting."
                 )
             fst_lst = cloud_sm.FirstLastBufTimeSync([], smu.NUM_BUFFER_TS_POINTS, [], smu.NUM_BUFFER_TS_POINTS)
-            for f in local_ts[5]:
-                smu.add_to_fst_buffer(fst_lst.fst, fst_lst.fst_max_size, f.ts, f)
-                smu.add_to_lst_buffer(fst_lst.lst, fst_lst.lst_max_size, f.ts, f)
+            smu.add_to_fst_lst_buffers(fst_lst, local_ts[5])
             timing = cloud_sm.Timing(local_ts[0], local_ts[1], local_ts[2], local_ts[3], local_ts[4], fst_lst)
 
             fst_lst_gts = cloud_sm.FirstLastBufTimeSync([], smu.NUM_BUFFER_POINTS, [], smu.NUM_BUFFER_POINTS)
-            for f in local_gts[5]:
-                smu.add_to_fst_buffer(fst_lst_gts.fst, fst_lst_gts.fst_max_size, f.ts, f)
-                smu.add_to_lst_buffer(fst_lst_gts.lst, fst_lst_gts.lst_max_size, f.ts, f)
+            smu.add_to_fst_lst_buffers(fst_lst_gts, local_gts[5])
             gnss_timing = cloud_sm.Timing(
                 local_gts[0], local_gts[1], local_gts[2], local_gts[3], local_gts[4], fst_lst_gts
             )
 
             all_sensors = smu.get_all_sensors_in_packet(packet)
             sensors = [cloud_sm.Sensor(s[0], s[1], smu.add_to_stats(s[2])) for s in all_sensors]
+            station_info = packet.station_information
+            timing_info = packet.timing_information
             result = SessionModel(
                 cloud_sm.Session(
-                    id=packet.station_information.id,
-                    uuid=packet.station_information.uuid,
-                    desc=packet.station_information.description,
-                    start_ts=int(packet.timing_information.app_start_mach_timestamp),
+                    id=station_info.id,
+                    uuid=station_info.uuid,
+                    desc=station_info.description,
+                    start_ts=int(timing_info.app_start_mach_timestamp),
                     client=CLIENT_NAME,
                     client_ver=CLIENT_VERSION,
                     session_ver=SESSION_VERSION,
                     app=APP_NAME,
                     api=int(packet.api),
                     sub_api=int(packet.sub_api),
-                    make=packet.station_information.make,
-                    model=packet.station_information.model,
-                    app_ver=packet.station_information.app_version,
-                    owner=packet.station_information.auth_id,
-                    private=packet.station_information.is_private,
-                    packet_dur=packet.timing_information.packet_end_mach_timestamp
-                    - packet.timing_information.packet_start_mach_timestamp,
+                    make=station_info.make,
+                    model=station_info.model,
+                    app_ver=station_info.app_version,
+                    owner=station_info.auth_id,
+                    private=station_info.is_private,
+                    packet_dur=timing_info.packet_end_mach_timestamp - timing_info.packet_start_mach_timestamp,
                     sensors=sensors,
                     n_pkts=1,
                     timing=timing,
@@ -181,25 +202,31 @@ class SessionModel:
                     sub=[],
                 )
             )
-            result.cloud_session.sub = [result.add_dynamic_day(packet)]
+            result.cloud_session.sub = [
+                result._add_dynamic_day(
+                    smu.get_dynamic_data(packet),
+                    timing_info.packet_start_mach_timestamp,
+                    result.cloud_session.session_key(),
+                )
+            ]
         except Exception as e:
             raise e
         return result
 
     @staticmethod
-    def create_from_stream(data_stream: List[api_m.RedvoxPacketM]) -> "SessionModel":
+    def create_from_stream(data_stream: Iterable[api_m.RedvoxPacketM]) -> "SessionModel":
         """
         Raises an error if no packets are found
 
-        :param data_stream: list of API M packets from a single station to read
+        :param data_stream: API M packets from a single station to read.  The packets are only iterated over once
         :return: SessionModel using the data packets from the stream
         """
-        if len(data_stream) > 0:
-            p1 = data_stream.pop(0)
+        packets = iter(data_stream)
+        p1 = next(packets, None)
+        if p1 is not None:
             model = SessionModel.create_from_packet(p1)
-            for p in data_stream:
+            for p in packets:
                 model.add_data_from_packet(p)
-            data_stream.insert(0, p1)
             return model
         raise RedVoxError("Unable to find data files for a model.")
 
@@ -306,55 +333,56 @@ class SessionModel:
                 f"Valid key is: {self.cloud_session.session_key()}"
             )
             return
+        self._add_data_from_packet(packet, session_key)
+
+    def _add_data_from_packet(self, packet: api_m.RedvoxPacketM, session_key: str):
+        """
+        Adds the data from the packet to the SessionModel without checking the key of the packet.  Values used in
+        more than one step, like the session key and the packet start, are read from the packet once and passed along.
+
+        :param packet: packet to add.  Must match the key of the SessionModel
+        :param session_key: the session key of the packet
+        """
+        packet_start = packet.timing_information.packet_start_mach_timestamp
+        # the means are updated with the mean step of Welford's algorithm, which keeps its precision as n_pkts grows
+        new_n_pkts = self.cloud_session.n_pkts + 1
         local_ts = smu.get_local_timesync(packet)
         if local_ts[2] > 0:
             timing = self.cloud_session.timing
-            for f in local_ts[5]:
-                smu.add_to_fst_buffer(timing.fst_lst.fst, timing.fst_lst.fst_max_size, f.ts, f)
-                smu.add_to_lst_buffer(timing.fst_lst.lst, timing.fst_lst.lst_max_size, f.ts, f)
-            timing.mean_lat = (timing.mean_lat * self.cloud_session.n_pkts + local_ts[4]) / (
-                self.cloud_session.n_pkts + 1
-            )
-            timing.mean_off = (timing.mean_off * self.cloud_session.n_pkts + local_ts[4]) / (
-                self.cloud_session.n_pkts + 1
-            )
+            smu.add_to_fst_lst_buffers(timing.fst_lst, local_ts[5])
+            timing.mean_lat += (local_ts[3] - timing.mean_lat) / new_n_pkts
+            timing.mean_off += (local_ts[4] - timing.mean_off) / new_n_pkts
             timing.n_ex += local_ts[2]
             if local_ts[0] < timing.first_data_ts:
                 timing.first_data_ts = local_ts[0]
             if local_ts[1] > timing.last_data_ts:
                 timing.last_data_ts = local_ts[1]
         else:
-            self._errors.append(
-                f"Timesync doesn't exist in packet starting at "
-                f"{packet.timing_information.packet_start_mach_timestamp}."
-            )
+            self._errors.append(f"Timesync doesn't exist in packet starting at {packet_start}.")
         local_gts = smu.get_gps_timing(packet)
         if local_gts[2] > 0:
             g_timing = self.cloud_session.gnss_timing
-            for f in local_gts[5]:
-                smu.add_to_fst_buffer(g_timing.fst_lst.fst, g_timing.fst_lst.fst_max_size, f.ts, f)
-                smu.add_to_lst_buffer(g_timing.fst_lst.lst, g_timing.fst_lst.lst_max_size, f.ts, f)
+            smu.add_to_fst_lst_buffers(g_timing.fst_lst, local_gts[5])
             g_timing.n_ex += local_gts[2]
-            g_timing.mean_off = (g_timing.mean_off * self.cloud_session.n_pkts + local_gts[4]) / (
-                self.cloud_session.n_pkts + 1
-            )
+            g_timing.mean_off += (local_gts[4] - g_timing.mean_off) / new_n_pkts
             if local_gts[0] < g_timing.first_data_ts:
                 g_timing.first_data_ts = local_gts[0]
             if local_gts[1] > g_timing.last_data_ts:
                 g_timing.last_data_ts = local_gts[1]
         else:
-            self._errors.append(
-                f"GNSS time data doesn't exist in packet starting at "
-                f"{packet.timing_information.packet_start_mach_timestamp}."
-            )
-        all_sensors = smu.get_all_sensors_in_packet(packet)
-        for s in all_sensors:
-            sensor = self.get_sensor(s[0], s[1])
+            self._errors.append(f"GNSS time data doesn't exist in packet starting at {packet_start}.")
+        # index the known sensors once instead of searching them with get_sensor for every sensor in the packet
+        known_sensors: Dict[Tuple[str, str], cloud_sm.Sensor] = {}
+        for sensor in self.cloud_session.sensors:
+            known_sensors.setdefault((sensor.name, sensor.description), sensor)
+        for s in smu.get_all_sensors_in_packet(packet):
+            sensor = known_sensors.get((s[0], s[1]))
             if sensor is not None:
                 sensor.sample_rate_stats = smu.add_to_stats(s[2], sensor.sample_rate_stats)
             else:
-                self.cloud_session.sensors.append(cloud_sm.Sensor(s[0], s[1], smu.add_to_stats(s[2])))
-        self.add_dynamic_day(packet)
+                sensor = known_sensors[(s[0], s[1])] = cloud_sm.Sensor(s[0], s[1], smu.add_to_stats(s[2]))
+                self.cloud_session.sensors.append(sensor)
+        self._add_dynamic_day(smu.get_dynamic_data(packet), packet_start, session_key)
         self.cloud_session.n_pkts += 1
 
     def add_dynamic_hour(self, data: dict, packet_start: float, session_key: str) -> str:
@@ -366,13 +394,10 @@ class SessionModel:
         :param session_key: the session key of the parent Session
         :return: the key to the new dynamic session
         """
-        start_dt = dtu.datetime_from_epoch_microseconds_utc(packet_start)
-        hour_start_dt = dtu.datetime(start_dt.year, start_dt.month, start_dt.day, start_dt.hour)
-        hour_end_ts = int(dtu.datetime_to_epoch_microseconds_utc(hour_start_dt + dtu.timedelta(hours=1)))
-        hour_start_ts = int(dtu.datetime_to_epoch_microseconds_utc(hour_start_dt))
+        hour_start_ts, hour_end_ts = _get_dynamic_bounds(packet_start, _HOUR_US)
         dynamic_key = f"{hour_start_ts}:{hour_end_ts}"
         key = f"{session_key}:{dynamic_key}"
-        if key in self.dynamic_sessions.keys():
+        if key in self.dynamic_sessions:
             self._update_dynamic_session(key, data, [f"{int(packet_start)}"])
         else:
             self.dynamic_sessions[key] = cloud_sm.DynamicSession(
@@ -395,16 +420,27 @@ class SessionModel:
         :param packet: packet to read data from
         :return: the key to the new or updated dynamic session
         """
-        data = smu.get_dynamic_data(packet)
-        start_dt = dtu.datetime_from_epoch_microseconds_utc(packet.timing_information.packet_start_mach_timestamp)
-        day_start_dt = dtu.datetime(start_dt.year, start_dt.month, start_dt.day)
-        day_end_ts = int(dtu.datetime_to_epoch_microseconds_utc(day_start_dt + dtu.timedelta(days=1)))
-        day_start_ts = int(dtu.datetime_to_epoch_microseconds_utc(day_start_dt))
+        return self._add_dynamic_day(
+            smu.get_dynamic_data(packet),
+            packet.timing_information.packet_start_mach_timestamp,
+            _get_session_key_from_packet(packet),
+        )
+
+    def _add_dynamic_day(self, data: Dict, packet_start: float, session_key: str) -> str:
+        """
+        Add (or update an existing session if key exists) a dynamic session with length of 1 day, and the hourly
+        dynamic session it contains, using the data from a single packet
+
+        :param data: dictionary of data to add
+        :param packet_start: starting timestamp of the packet in microseconds since epoch UTC
+        :param session_key: the session key of the parent Session
+        :return: the key to the new or updated dynamic session
+        """
+        day_start_ts, day_end_ts = _get_dynamic_bounds(packet_start, _DAY_US)
         dynamic_key = f"{day_start_ts}:{day_end_ts}"
-        session_key = _get_session_key_from_packet(packet)
         key = f"{session_key}:{dynamic_key}"
-        hourly_key = self.add_dynamic_hour(data, packet.timing_information.packet_start_mach_timestamp, session_key)
-        if key in self.dynamic_sessions.keys():
+        hourly_key = self.add_dynamic_hour(data, packet_start, session_key)
+        if key in self.dynamic_sessions:
             self._update_dynamic_session(key, data, [hourly_key])
         else:
             self.dynamic_sessions[key] = cloud_sm.DynamicSession(
@@ -422,30 +458,25 @@ class SessionModel:
 
     def _update_dynamic_session(self, key: str, data: Dict, sub: List[str]):
         """
-        update a dynamic session with a given key.
+        update a dynamic session with a given key.  Only that session is updated; the sessions it is linked to must be
+        updated separately, as add_dynamic_day does by adding the packet to its hourly session first.
 
         :param key: key to the dynamic session
         :param data: dictionary of data to add
         :param sub: the list of keys that the dynamic session is linked to
         """
-        if key not in self.dynamic_sessions.keys():
+        session = self.dynamic_sessions.get(key)
+        if session is None:
             self._errors.append(f"Attempted to update non-existent key: {key}.")
         else:
-            self.dynamic_sessions[key].n_pkts += 1
-            self.dynamic_sessions[key].location = smu.add_location_data(
-                data["location"], self.dynamic_sessions[key].location
-            )
-            self.dynamic_sessions[key].battery = smu.add_to_stats(data["battery"], self.dynamic_sessions[key].battery)
-            self.dynamic_sessions[key].temperature = smu.add_to_stats(
-                data["temperature"], self.dynamic_sessions[key].temperature
-            )
-            if self.dynamic_sessions[key].dur != HOURLY_SESSION_NAME:
+            session.n_pkts += 1
+            session.location = smu.add_location_data(data["location"], session.location)
+            session.battery = smu.add_to_stats(data["battery"], session.battery)
+            session.temperature = smu.add_to_stats(data["temperature"], session.temperature)
+            if session.dur != HOURLY_SESSION_NAME:
                 for s in sub:
-                    if s not in self.dynamic_sessions[key].sub:
-                        self.dynamic_sessions[key].sub.append(s)
-                    child_key = f"{self.dynamic_sessions[key].session_key}:{s}"
-                    if child_key in self.dynamic_sessions.keys():
-                        self._update_dynamic_session(child_key, data, self.dynamic_sessions[child_key].sub)
+                    if s not in session.sub:
+                        session.sub.append(s)
 
     def sdk_version(self) -> str:
         """
@@ -478,13 +509,14 @@ class SessionModel:
                     return s
         return None
 
-    def audio_sample_rate_nominal_hz(self) -> float:
+    def audio_sample_rate_nominal_hz(self) -> Optional[float]:
         """
-        :return: number of sensors in the Session
+        :return: mean sample rate of the audio sensor in Hz or None if the Session doesn't have an audio sensor
         """
         for n in self.cloud_session.sensors:
             if n.name == "audio":
                 return n.sample_rate_stats.welford.mean
+        return None
 
     def get_daily_dynamic_sessions(self) -> List[cloud_sm.DynamicSession]:
         """
@@ -498,6 +530,24 @@ class SessionModel:
         """
         return [n for n in self.dynamic_sessions.values() if n.dur == HOURLY_SESSION_NAME]
 
+    def iter_daily_dynamic_sessions(self) -> Iterator[cloud_sm.DynamicSession]:
+        """
+        Use this instead of get_daily_dynamic_sessions when the sessions are only iterated over.  Do not add dynamic
+        sessions to the Session while iterating.
+
+        :return: an iterator over all day-long dynamic sessions in the Session
+        """
+        return (n for n in self.dynamic_sessions.values() if n.dur == DAILY_SESSION_NAME)
+
+    def iter_hourly_dynamic_sessions(self) -> Iterator[cloud_sm.DynamicSession]:
+        """
+        Use this instead of get_hourly_dynamic_sessions when the sessions are only iterated over.  Do not add dynamic
+        sessions to the Session while iterating.
+
+        :return: an iterator over all hour-long dynamic sessions in the Session
+        """
+        return (n for n in self.dynamic_sessions.values() if n.dur == HOURLY_SESSION_NAME)
+
     def get_timesync_offset_model(self) -> Optional[OffsetModel]:
         """
         :return: OffsetModel defined by the timesync data points in the SessionModel or None if not enough data
@@ -549,7 +599,7 @@ class LocalSessionModels:
         :param in_dict: dictionary to convert from
         :return: LocalSessionModels object from dictionary
         """
-        if "sessions" not in in_dict.keys():
+        if "sessions" not in in_dict:
             return LocalSessionModels()
         result = LocalSessionModels()
         result.sessions = in_dict["sessions"]
@@ -565,8 +615,9 @@ class LocalSessionModels:
         key = _get_session_key_from_packet(packet)
         for s in self.sessions:
             if key == s.cloud_session.session_key():
-                s.add_data_from_packet(packet)
-                return s.cloud_session.session_key()
+                # the key was already checked, so add the data without checking it again
+                s._add_data_from_packet(packet, key)
+                return key
         # if here, key is not in the sessions.
         self.sessions.append(SessionModel.create_from_packet(packet))
         return key
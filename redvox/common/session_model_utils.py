@@ -2,21 +2,23 @@
 This module contains classes and functions that support SessionModel.
 """
 from typing import List, Optional, Tuple, Dict, Union, Callable
-from bisect import insort
 
 import numpy as np
 
 import redvox.api1000.proto.redvox_api_m_pb2 as api_m
 from redvox.api1000.wrapped_redvox_packet.sensors.location import LocationProvider
 from redvox.cloud import session_model_api as sm
-from redvox.common.timesync import TimeSync
+from redvox.common import tri_message_stats as tms
 from redvox.common.offset_model import GPS_LATENCY_MICROS
 
 
 NUM_BUFFER_POINTS = 3  # number of data points to keep in a buffer
 NUM_BUFFER_TS_POINTS = 8  # number of data points to keep in a timesync buffer
 NUM_BUFFER_LOC_POINTS = 3  # number of data points to keep in a location buffer
-COLUMN_TO_ENUM_FN = {"location_provider": lambda l: LocationProvider(l).name}
+MIN_VECTORIZED_LOCATIONS = 32  # minimum number of locations that add_location_data processes as arrays
+MIN_VECTORIZED_BUFFER_DATA = 64  # minimum number of elements that add_to_fst_lst_buffers selects with numpy
+_LOC_PROV_NAMES: Dict[int, str] = {m.value: m.name for m in LocationProvider}  # location provider value to name
+COLUMN_TO_ENUM_FN = {"location_provider": _LOC_PROV_NAMES.__getitem__}
 
 # These are used for checking if a field is present or not
 _ACCELEROMETER_FIELD_NAME: str = "accelerometer"
@@ -79,6 +81,26 @@ __SENSOR_NAME_TO_SENSOR_FN: Dict[
     _VELOCITY_FIELD_NAME: lambda packet: packet.sensors.velocity,
 }
 
+# the sensors reported by get_all_sensors_in_packet, in the order they are reported
+__AUDIO_SENSOR_NAMES: Tuple[str, ...] = (_AUDIO_FIELD_NAME, _COMPRESSED_AUDIO_FIELD_NAME)
+__TIMESTAMPED_SENSOR_NAMES: Tuple[str, ...] = (
+    _PRESSURE_FIELD_NAME,
+    _LOCATION_FIELD_NAME,
+    _ACCELEROMETER_FIELD_NAME,
+    _AMBIENT_TEMPERATURE_FIELD_NAME,
+    _GRAVITY_FIELD_NAME,
+    _GYROSCOPE_FIELD_NAME,
+    _IMAGE_FIELD_NAME,
+    _LIGHT_FIELD_NAME,
+    _LINEAR_ACCELERATION_FIELD_NAME,
+    _MAGNETOMETER_FIELD_NAME,
+    _ORIENTATION_FIELD_NAME,
+    _PROXIMITY_FIELD_NAME,
+    _RELATIVE_HUMIDITY_FIELD_NAME,
+    _ROTATION_VECTOR_FIELD_NAME,
+    _VELOCITY_FIELD_NAME,
+)
+
 
 def _get_sensor_for_data_extraction(sensor_name: str, packet: api_m.RedvoxPacketM) -> Optional[Sensor]:
     """
@@ -124,29 +146,17 @@ def get_all_sensors_in_packet(packet: api_m.RedvoxPacketM) -> List[Tuple[str, st
     :return: list of all sensors as tuple of name, description, and mean sample rate in the packet
     """
     result: List[Tuple] = []
-    for s in [_AUDIO_FIELD_NAME, _COMPRESSED_AUDIO_FIELD_NAME]:
-        if _has_sensor(packet, s):
-            sensor = _get_sensor_for_data_extraction(s, packet)
+    # look up each sensor directly on the sensors message; _has_sensor and _get_sensor_for_data_extraction would check
+    # the field again before getting it
+    sensors = packet.sensors
+    has_field = sensors.HasField
+    for s in __AUDIO_SENSOR_NAMES:
+        if has_field(s):
+            sensor = getattr(sensors, s)
             result.append((s, sensor.sensor_description, sensor.sample_rate))
-    for s in [
-        _PRESSURE_FIELD_NAME,
-        _LOCATION_FIELD_NAME,
-        _ACCELEROMETER_FIELD_NAME,
-        _AMBIENT_TEMPERATURE_FIELD_NAME,
-        _GRAVITY_FIELD_NAME,
-        _GYROSCOPE_FIELD_NAME,
-        _IMAGE_FIELD_NAME,
-        _LIGHT_FIELD_NAME,
-        _LINEAR_ACCELERATION_FIELD_NAME,
-        _MAGNETOMETER_FIELD_NAME,
-        _ORIENTATION_FIELD_NAME,
-        _PROXIMITY_FIELD_NAME,
-        _RELATIVE_HUMIDITY_FIELD_NAME,
-        _ROTATION_VECTOR_FIELD_NAME,
-        _VELOCITY_FIELD_NAME,
-    ]:
-        if _has_sensor(packet, s):
-            sensor = _get_sensor_for_data_extraction(s, packet)
+    for s in __TIMESTAMPED_SENSOR_NAMES:
+        if has_field(s):
+            sensor = getattr(sensors, s)
             result.append((s, sensor.sensor_description, sensor.timestamps.mean_sample_rate))
     if packet.station_information.HasField("station_metrics"):
         result.insert(
@@ -160,16 +170,24 @@ def get_all_sensors_in_packet(packet: api_m.RedvoxPacketM) -> List[Tuple[str, st
     return result
 
 
-def __ordered_insert(buffer: List, value: Tuple):
+def __insert_index(buffer: List, timestamp: float) -> Optional[int]:
     """
-    inserts the value into the buffer using the timestamp as the key
+    finds where to insert the timestamp into the buffer to keep it ordered by timestamp.  Only the timestamps are
+    compared, never the values.  The search starts from the end because timestamps usually arrive in increasing order.
 
-    :param value: value to add.  Must include a timestamp and the same data type as the other buffer elements
+    :param buffer: the buffer to search.  Must be ordered by timestamp
+    :param timestamp: timestamp to insert
+    :return: the index to insert the timestamp at, or None if the timestamp is already in the buffer
     """
-    if len(buffer) < 1:
-        buffer.append(value)
-    else:
-        insort(buffer, value)
+    index = len(buffer)
+    while index > 0:
+        buf_ts = buffer[index - 1][0]
+        if timestamp == buf_ts:
+            return None
+        if not timestamp < buf_ts:
+            break
+        index -= 1
+    return index
 
 
 def add_to_fst_buffer(buffer: List, buf_max_size: int, timestamp: float, value):
@@ -185,10 +203,13 @@ def add_to_fst_buffer(buffer: List, buf_max_size: int, timestamp: float, value):
     :param timestamp: timestamp in microseconds since epoch UTC to add.
     :param value: value to add.  Must be the same type of data as the other elements in the queue.
     """
-    if (len(buffer) < buf_max_size or timestamp < buffer[-1][0]) and timestamp not in [n[0] for n in buffer]:
-        __ordered_insert(buffer, (timestamp, value))
-        while len(buffer) > buf_max_size:
-            buffer.pop()
+    if len(buffer) >= buf_max_size and not timestamp < buffer[-1][0]:
+        return
+    index = __insert_index(buffer, timestamp)
+    if index is not None:
+        buffer.insert(index, (timestamp, value))
+        if len(buffer) > buf_max_size:
+            del buffer[buf_max_size:]
 
 
 def add_to_lst_buffer(buffer: List, buf_max_size: int, timestamp: float, value):
@@ -204,10 +225,41 @@ def add_to_lst_buffer(buffer: List, buf_max_size: int, timestamp: float, value):
     :param timestamp: timestamp in microseconds since epoch UTC to add.
     :param value: value to add.  Must be the same type of data as the other elements in the queue.
     """
-    if (len(buffer) < buf_max_size or timestamp > buffer[0][0]) and timestamp not in [n[0] for n in buffer]:
-        __ordered_insert(buffer, (timestamp, value))
-        while len(buffer) > buf_max_size:
-            buffer.pop(0)
+    if len(buffer) >= buf_max_size and not timestamp > buffer[0][0]:
+        return
+    index = __insert_index(buffer, timestamp)
+    if index is not None:
+        buffer.insert(index, (timestamp, value))
+        if len(buffer) > buf_max_size:
+            del buffer[: len(buffer) - buf_max_size]
+
+
+def add_to_fst_lst_buffers(fst_lst: sm.FirstLastBufTimeSync, data: List[sm.TimeSyncData]):
+    """
+    Add each TimeSyncData into the first and last buffers, using its timestamp as the key.  The result is the same as
+    calling add_to_fst_buffer and add_to_lst_buffer with each element in order.
+
+    The buffers keep the first occurrence of the smallest or largest distinct timestamps, so when there are at least
+    MIN_VECTORIZED_BUFFER_DATA elements, only those within that many distinct timestamps of either end are added.
+
+    :param fst_lst: the buffers to add the data to
+    :param data: the data to add
+    """
+    if len(data) < MIN_VECTORIZED_BUFFER_DATA:
+        for f in data:
+            add_to_fst_buffer(fst_lst.fst, fst_lst.fst_max_size, f.ts, f)
+            add_to_lst_buffer(fst_lst.lst, fst_lst.lst_max_size, f.ts, f)
+        return
+    timestamps = np.array([f.ts for f in data], dtype=float)
+    unique_ts = np.unique(timestamps)
+    fst_max_ts = unique_ts[min(fst_lst.fst_max_size, len(unique_ts)) - 1]
+    lst_min_ts = unique_ts[-min(fst_lst.lst_max_size, len(unique_ts))]
+    for i in np.flatnonzero((timestamps <= fst_max_ts) | (timestamps >= lst_min_ts)).tolist():
+        f = data[i]
+        if timestamps[i] <= fst_max_ts:
+            add_to_fst_buffer(fst_lst.fst, fst_lst.fst_max_size, f.ts, f)
+        if timestamps[i] >= lst_min_ts:
+            add_to_lst_buffer(fst_lst.lst, fst_lst.lst_max_size, f.ts, f)
 
 
 def get_local_timesync(packet: api_m.RedvoxPacketM) -> Tuple:
@@ -221,26 +273,30 @@ def get_local_timesync(packet: api_m.RedvoxPacketM) -> Tuple:
     :param packet: packet to get timesync data from
     :return: Tuple with timing data from packet
     """
-    ts = TimeSync().from_raw_packets([packet])
-    if ts.num_tri_messages() > 0:
-        _ts_latencies = ts.latencies().flatten()
-        _ts_offsets = ts.offsets().flatten()
-        _ts_timestamps = ts.get_device_exchanges_timestamps()
+    # This computes the same values as TimeSync().from_raw_packets([packet]), but reads the exchanges in one pass and
+    # skips the OffsetModel that TimeSync fits, which is not needed here
+    exchanges = packet.timing_information.synch_exchanges
+    if len(exchanges) > 0:
+        a1, a2, a3, b1, b2, b3 = np.array([(ex.a1, ex.a2, ex.a3, ex.b1, ex.b2, ex.b3) for ex in exchanges]).T
+        tse = tms.TriMessageStats("", a1, a2, a3, b1, b2, b3)
+        _ts_latencies = np.concatenate((tse.latency1, tse.latency3))
+        _ts_offsets = np.concatenate((tse.offset1, tse.offset3))
+        _ts_timestamps = np.concatenate((b1, b3))
         # add data to the buffers
         _ts_data = [
             sm.TimeSyncData(_ts_timestamps[i], _ts_latencies[i], _ts_offsets[i]) for i in range(len(_ts_timestamps))
         ]
         return (
-            ts.data_start_timestamp(),
-            ts.data_end_timestamp(),
-            ts.num_tri_messages(),
-            ts.best_latency(),
-            ts.best_offset(),
+            packet.timing_information.packet_start_mach_timestamp,
+            packet.timing_information.packet_end_mach_timestamp,
+            tse.num_messages,
+            tse.best_latency,
+            tse.best_offset,
             _ts_data,
         )
     return (
-        ts.data_start_timestamp(),
-        ts.data_end_timestamp(),
+        packet.timing_information.packet_start_mach_timestamp,
+        packet.timing_information.packet_end_mach_timestamp,
         0.0,
         0.0,
         0.0,
@@ -307,39 +363,152 @@ def add_to_welford(value: float, welford: Optional[sm.WelfordAggregator] = None)
     """
     adds the value to the welford, then returns the updated object.
 
-    If welford is None, creates a new WelfordAggregator object and returns it.
+    If welford is None, creates a new WelfordAggregator object and returns it.  NaN values are not added.
 
     :param value: the value to add
     :param welford: optional WelfordAggregator object to update.  if not given, will make a new one.  Default None
     :return: updated or new WelfordAggregator object
     """
+    if value != value:
+        return sm.WelfordAggregator(0.0, 0.0, 0) if welford is None else welford
     if welford is None:
         return sm.WelfordAggregator(0.0, value, 1)
-    welford.cnt += 1
-    delta = value - welford.mean
-    welford.mean += delta / float(welford.cnt)
-    delta2 = value - welford.mean
-    welford.m2 += delta * delta2
+    # work on locals so each field is read and written once
+    cnt = welford.cnt + 1
+    mean = welford.mean
+    delta = value - mean
+    mean += delta / cnt
+    welford.m2 += delta * (value - mean)
+    welford.mean = mean
+    welford.cnt = cnt
     return welford
 
 
+def merge_welford(cnt: int, mean: float, m2: float, welford: sm.WelfordAggregator) -> sm.WelfordAggregator:
+    """
+    adds the count, mean and m2 of another group of values to the welford, then returns the updated object.
+
+    Uses the parallel form of Welford's algorithm by Chan et al., which gives the same result as adding the values one
+    at a time, up to rounding.
+
+    :param cnt: the number of values in the group.  Must be at least 1
+    :param mean: the mean of the group
+    :param m2: the sum of squared differences from the mean of the group
+    :param welford: WelfordAggregator object to update
+    :return: updated WelfordAggregator object
+    """
+    total = welford.cnt + cnt
+    delta = mean - welford.mean
+    welford.m2 += m2 + delta * delta * welford.cnt * cnt / total
+    welford.mean += delta * cnt / total
+    welford.cnt = total
+    return welford
+
+
+def add_array_to_stats(values: np.ndarray, stats: Optional[sm.Stats] = None) -> sm.Stats:
+    """
+    adds all the values to the stats, then returns the updated object.
+
+    If stats is None, creates a new Stats object and returns it.  NaN values are not added.
+
+    :param values: the values to add
+    :param stats: optional Stats object to update.  if not given, will make a new one.  Default None
+    :return: updated or new Stats object
+    """
+    nans = np.isnan(values)
+    if nans.any():
+        values = values[~nans]
+        if len(values) < 1:
+            return __empty_stats() if stats is None else stats
+    mean = float(values.mean())
+    m2 = float(np.square(values - mean).sum())
+    return __add_summary_to_stats(len(values), mean, m2, float(values.min()), float(values.max()), stats)
+
+
+def __add_summary_to_stats(
+    cnt: int, mean: float, m2: float, min_value: float, max_value: float, stats: Optional[sm.Stats]
+) -> sm.Stats:
+    """
+    adds the summary of a group of values to the stats, then returns the updated object.
+
+    If stats is None, creates a new Stats object and returns it.
+
+    :param cnt: the number of values in the group.  Must be at least 1
+    :param mean: the mean of the group
+    :param m2: the sum of squared differences from the mean of the group
+    :param min_value: the minimum of the group
+    :param max_value: the maximum of the group
+    :param stats: optional Stats object to update.  if not given, will make a new one
+    :return: updated or new Stats object
+    """
+    if stats is None:
+        return sm.Stats(min_value, max_value, sm.WelfordAggregator(m2, mean, cnt))
+    if stats.welford.cnt < 1:
+        stats.min = min_value
+        stats.max = max_value
+    else:
+        if min_value < stats.min:
+            stats.min = min_value
+        if max_value > stats.max:
+            stats.max = max_value
+    merge_welford(cnt, mean, m2, stats.welford)
+    return stats
+
+
+def merge_stats(other: sm.Stats, stats: Optional[sm.Stats] = None) -> sm.Stats:
+    """
+    adds the values summarized by other to the stats, then returns the updated object.  other is not changed.
+
+    If stats is None, creates a new Stats object and returns it.  The welfords are combined with merge_welford, so
+    the Stats of two sessions can be combined without adding their values again.
+
+    :param other: the Stats to add
+    :param stats: optional Stats object to update.  if not given, will make a new one.  Default None
+    :return: updated or new Stats object
+    """
+    welford = other.welford
+    if welford.cnt < 1:
+        return __empty_stats() if stats is None else stats
+    return __add_summary_to_stats(welford.cnt, welford.mean, welford.m2, other.min, other.max, stats)
+
+
+def __empty_stats() -> sm.Stats:
+    """
+    :return: a Stats object without any values.  The minimum and maximum are NaN
+    """
+    return sm.Stats(np.nan, np.nan, sm.WelfordAggregator(0.0, 0.0, 0))
+
+
 def add_to_stats(value: float, stats: Optional[sm.Stats] = None) -> sm.Stats:
     """
     adds the value to the stats, then returns the updated object.
 
-    If stats is None, creates a new Stats object and returns it.
+    If stats is None, creates a new Stats object and returns it.  NaN values are not added.
 
     :param value: the value to add
     :param stats: optional Stats object to update.  if not given, will make a new one.  Default None
     :return: updated or new Stats object
     """
+    if value != value:
+        return __empty_stats() if stats is None else stats
     if stats is None:
-        return sm.Stats(value, value, add_to_welford(value))
-    if value < stats.min:
+        return sm.Stats(value, value, sm.WelfordAggregator(0.0, value, 1))
+    welford = stats.welford
+    if welford.cnt < 1:
+        stats.min = stats.max = value
+    # a value below the minimum can't also be above the maximum
+    elif value < stats.min:
         stats.min = value
-    if value > stats.max:
+    elif value > stats.max:
         stats.max = value
-    add_to_welford(value, stats.welford)
+    # same update as add_to_welford, without the extra call
+    cnt = welford.cnt + 1
+    mean = welford.mean
+    delta = value - mean
+    mean += delta / cnt
+    welford.m2 += delta * (value - mean)
+    welford.mean = mean
+    welford.cnt = cnt
     return stats
 
 
@@ -368,28 +537,30 @@ def get_location_data(packet: api_m.RedvoxPacketM) -> List[Tuple[str, float, flo
         and num_pts == loc.altitude_samples.value_statistics.count
         and num_pts == loc.longitude_samples.value_statistics.count
     ):
-        lats = loc.latitude_samples.values
-        lons = loc.longitude_samples.values
-        alts = loc.altitude_samples.values
-        tstp = loc.timestamps.timestamps
-        for i in range(num_pts):
-            source = (
-                "UNKNOWN"
-                if len(loc.location_providers) != num_pts
-                else COLUMN_TO_ENUM_FN["location_provider"](loc.location_providers[i])
+        if len(loc.location_providers) != num_pts:
+            sources = ["UNKNOWN"] * num_pts
+        else:
+            sources = [_LOC_PROV_NAMES.get(p, "UNKNOWN") for p in loc.location_providers]
+        locations.extend(
+            zip(
+                sources,
+                loc.latitude_samples.values[:num_pts],
+                loc.longitude_samples.values[:num_pts],
+                loc.altitude_samples.values[:num_pts],
+                loc.timestamps.timestamps[:num_pts],
             )
-            locations.append((source, lats[i], lons[i], alts[i], tstp[i]))
+        )
         # set a special flag for later, so we don't add an extra location value
         source = None
     elif loc.last_best_location is not None:
         ts = loc.last_best_location.latitude_longitude_timestamp.mach
-        source = COLUMN_TO_ENUM_FN["location_provider"](loc.last_best_location.location_provider)
+        source = _LOC_PROV_NAMES.get(loc.last_best_location.location_provider, "UNKNOWN")
         lat = loc.last_best_location.latitude
         lon = loc.last_best_location.longitude
         alt = loc.last_best_location.altitude
     elif loc.overall_best_location is not None:
         ts = loc.overall_best_location.latitude_longitude_timestamp.mach
-        source = COLUMN_TO_ENUM_FN["location_provider"](loc.overall_best_location.location_provider)
+        source = _LOC_PROV_NAMES.get(loc.overall_best_location.location_provider, "UNKNOWN")
         lat = loc.overall_best_location.latitude
         lon = loc.overall_best_location.longitude
         alt = loc.overall_best_location.altitude
@@ -405,8 +576,14 @@ def get_dynamic_data(packet: api_m.RedvoxPacketM) -> Dict:
     :return: Dictionary of all dynamic session data from the packet
     """
     location = get_location_data(packet)
-    battery = packet.station_information.station_metrics.battery.value_statistics.mean
-    temperature = packet.station_information.station_metrics.temperature.value_statistics.mean
+    battery = temperature = np.nan
+    if packet.station_information.HasField("station_metrics"):
+        # the mean of a missing field is 0, so only use the means of fields with values
+        metrics = packet.station_information.station_metrics
+        if metrics.battery.value_statistics.count > 0:
+            battery = metrics.battery.value_statistics.mean
+        if metrics.temperature.value_statistics.count > 0:
+            temperature = metrics.temperature.value_statistics.mean
     return {"location": location, "battery": battery, "temperature": temperature}
 
 
@@ -423,13 +600,15 @@ def add_to_location(
     :param loc_stat: optional LocationStat object to update.  if not given, will make a new one.  Default None
     :return: updated or new LocationStat object
     """
+    # the first and last buffers share the Location, like the TimeSyncData in the timing buffers
+    location = sm.Location(lat, lon, alt)
     if loc_stat is None:
         fst_lst = sm.FirstLastBufLocation([], NUM_BUFFER_LOC_POINTS, [], NUM_BUFFER_LOC_POINTS)
-        add_to_fst_buffer(fst_lst.fst, fst_lst.fst_max_size, timestamp, sm.Location(lat, lon, alt))
-        add_to_lst_buffer(fst_lst.lst, fst_lst.lst_max_size, timestamp, sm.Location(lat, lon, alt))
+        add_to_fst_buffer(fst_lst.fst, fst_lst.fst_max_size, timestamp, location)
+        add_to_lst_buffer(fst_lst.lst, fst_lst.lst_max_size, timestamp, location)
         return sm.LocationStat(fst_lst, add_to_stats(lat), add_to_stats(lon), add_to_stats(alt))
-    add_to_fst_buffer(loc_stat.fst_lst.fst, loc_stat.fst_lst.fst_max_size, timestamp, sm.Location(lat, lon, alt))
-    add_to_lst_buffer(loc_stat.fst_lst.lst, loc_stat.fst_lst.lst_max_size, timestamp, sm.Location(lat, lon, alt))
+    add_to_fst_buffer(loc_stat.fst_lst.fst, loc_stat.fst_lst.fst_max_size, timestamp, location)
+    add_to_lst_buffer(loc_stat.fst_lst.lst, loc_stat.fst_lst.lst_max_size, timestamp, location)
     loc_stat.lat = add_to_stats(lat, loc_stat.lat)
     loc_stat.lng = add_to_stats(lon, loc_stat.lng)
     loc_stat.alt = add_to_stats(alt, loc_stat.alt)
@@ -448,6 +627,79 @@ def add_location_data(
     """
     if loc_dict is None:
         loc_dict = {}
-    for s in data:
-        loc_dict[s[0]] = add_to_location(s[1], s[2], s[3], s[4], loc_dict[s[0]] if s[0] in loc_dict.keys() else None)
+    if len(data) < MIN_VECTORIZED_LOCATIONS:
+        for s in data:
+            loc_dict[s[0]] = add_to_location(s[1], s[2], s[3], s[4], loc_dict.get(s[0]))
+        return loc_dict
+    sources, lats, lons, alts, timestamps = zip(*data)
+    values = np.array([lats, lons, alts, timestamps], dtype=float)
+    if len(set(sources)) == 1:
+        loc_dict[sources[0]] = add_location_arrays(*values, loc_dict.get(sources[0]))
+        return loc_dict
+    groups: Dict[str, List[int]] = {}
+    for i, source in enumerate(sources):
+        groups.setdefault(source, []).append(i)
+    for source, indices in groups.items():
+        loc_dict[source] = add_location_arrays(*values[:, indices], loc_dict.get(source))
     return loc_dict
+
+
+def add_location_arrays(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    alts: np.ndarray,
+    timestamps: np.ndarray,
+    loc_stat: Optional[sm.LocationStat] = None,
+) -> sm.LocationStat:
+    """
+    update a LocationStat object with all the locations, or make a new one.  The result is the same as calling
+    add_to_location with each location in order, up to rounding of the statistics.
+
+    :param lats: latitudes in degrees
+    :param lons: longitudes in degrees
+    :param alts: altitudes in meters
+    :param timestamps: timestamps in microseconds from epoch UTC
+    :param loc_stat: optional LocationStat object to update.  if not given, will make a new one.  Default None
+    :return: updated or new LocationStat object
+    """
+    coords = np.array([lats, lons, alts], dtype=float)
+    old_stats = [None] * 3 if loc_stat is None else [loc_stat.lat, loc_stat.lng, loc_stat.alt]
+    if np.isnan(coords).any():
+        # NaN values are not added, and each coordinate may be missing a different number of values
+        summaries = [add_array_to_stats(values, stats) for values, stats in zip(coords, old_stats)]
+    else:
+        # reduce the three coordinates together to share the numpy overhead
+        means = coords.mean(axis=1)
+        summaries = [
+            __add_summary_to_stats(len(timestamps), mean, m2, min_value, max_value, stats)
+            for mean, m2, min_value, max_value, stats in zip(
+                means.tolist(),
+                np.square(coords - means[:, np.newaxis]).sum(axis=1).tolist(),
+                coords.min(axis=1).tolist(),
+                coords.max(axis=1).tolist(),
+                old_stats,
+            )
+        ]
+    if loc_stat is None:
+        loc_stat = sm.LocationStat(
+            sm.FirstLastBufLocation([], NUM_BUFFER_LOC_POINTS, [], NUM_BUFFER_LOC_POINTS), *summaries
+        )
+    else:
+        loc_stat.lat, loc_stat.lng, loc_stat.alt = summaries
+    # The buffers keep the first occurrence of the smallest or largest distinct timestamps, so only locations that
+    # are within that many distinct timestamps of either end can end up in them.  They are added in their original
+    # order so duplicate timestamps resolve the same way.
+    fst_lst = loc_stat.fst_lst
+    unique_ts = np.unique(timestamps)
+    fst_max_ts = unique_ts[min(fst_lst.fst_max_size, len(unique_ts)) - 1]
+    lst_min_ts = unique_ts[-min(fst_lst.lst_max_size, len(unique_ts))]
+    indices = np.flatnonzero((timestamps <= fst_max_ts) | (timestamps >= lst_min_ts))
+    for lat, lon, alt, ts in zip(
+        lats[indices].tolist(), lons[indices].tolist(), alts[indices].tolist(), timestamps[indices].tolist()
+    ):
+        location = sm.Location(lat, lon, alt)
+        if ts <= fst_max_ts:
+            add_to_fst_buffer(fst_lst.fst, fst_lst.fst_max_size, ts, location)
+        if ts >= lst_min_ts:
+            add_to_lst_buffer(fst_lst.lst, fst_lst.lst_max_size, ts, location)
+    return loc_stat
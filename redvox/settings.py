@@ -6,6 +6,7 @@ import os
 from typing import Optional
 
 REDVOX_ENABLE_PARALLELISM_ENV: str = "REDVOX_ENABLE_PARALLELISM"
+REDVOX_ENABLE_FILE_CACHE_ENV: str = "REDVOX_ENABLE_FILE_CACHE"
 
 
 def is_parallelism_enabled_env() -> Optional[bool]:
@@ -51,6 +52,50 @@ def is_parallelism_enabled() -> bool:
     return False if __PARALLELISM_ENABLED is None else __PARALLELISM_ENABLED
 
 
+def is_file_cache_enabled_env() -> Optional[bool]:
+    """
+    Tests if the file cache is enabled or disabled by checking the presence and value of an environmental variable.
+    If the env var DNE, None is returned. If the env var does exist, it is parsed as either "true" or "false" into
+    the corresponding boolean and returned. If the env var exists, but is not one of "true" or "false", None is
+    returned.
+    :return: Either True or False if the env var exists and can be parsed or None.
+    """
+    if REDVOX_ENABLE_FILE_CACHE_ENV not in os.environ:
+        return None
+
+    env_val: str = os.environ.get(REDVOX_ENABLE_FILE_CACHE_ENV).lower()
+    if env_val == "true":
+        return True
+    elif env_val == "false":
+        return False
+    else:
+        return None
+
+
+__FILE_CACHE_ENABLED: Optional[bool] = is_file_cache_enabled_env()
+
+
+def set_file_cache_enabled(file_cache_enabled: bool) -> None:
+    """
+    Sets whether the decompressed contents of API 900 files read by the SDK are cached in memory, so that reading
+    the same file again skips the disk read and decompression.
+    :param file_cache_enabled: True to enable, False otherwise
+    """
+    global __FILE_CACHE_ENABLED
+    __FILE_CACHE_ENABLED = file_cache_enabled
+
+
+def is_file_cache_enabled() -> bool:
+    """
+    Returns whether or not the file cache is enabled with the SDK.
+    :return: Whether or not the file cache is enabled with the SDK.
+    """
+    global __FILE_CACHE_ENABLED
+    if __FILE_CACHE_ENABLED is None:
+        __FILE_CACHE_ENABLED = is_file_cache_enabled_env()
+    return False if __FILE_CACHE_ENABLED is None else __FILE_CACHE_ENABLED
+
+
 def is_gui_extra_enabled() -> bool:
     """
     :return: True if the GUI extra is enabled, False otherwise
@@ -72,3 +117,21 @@ def is_native_extra_enabled() -> bool:
         return True
     except ModuleNotFoundError:
         return False
+
+
+def protobuf_implementation() -> str:
+    """
+    Returns the protobuf runtime used to parse and serialize RedVox packets. The "upb" and "cpp" runtimes are natively
+    compiled. The pure "python" runtime is selected when the environmental variable
+    PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION is set to "python" and is much slower at reading packets.
+    :return: One of "upb", "cpp", or "python"
+    """
+    from google.protobuf.internal import api_implementation
+    return api_implementation.Type()
+
+
+def is_native_protobuf_enabled() -> bool:
+    """
+    :return: True if a natively compiled protobuf runtime is in use, False otherwise
+    """
+    return protobuf_implementation() != "python"
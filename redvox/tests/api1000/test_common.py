@@ -1,6 +1,8 @@
+import json
 import unittest
 
 import numpy as np
+from google.protobuf.json_format import MessageToJson
 
 import redvox.api1000.common.lz4
 import redvox.api1000.common.common as common
@@ -39,11 +41,24 @@ class TestCommonProtoBase(unittest.TestCase):
         json = self.non_empty_microphone_channel.as_json()
         self.assertTrue(len(json) > 0)
 
+    def test_as_json_compact(self):
+        self.assertEqual(MessageToJson(self.non_empty_microphone_channel.get_proto(), True),
+                         self.non_empty_microphone_channel.as_json())
+        for channel in (self.empty_microphone_channel, self.non_empty_microphone_channel):
+            self.assertEqual(json.loads(channel.as_json()), json.loads(channel.as_json(compact=True)))
+        self.assertNotIn("\n", self.non_empty_microphone_channel.as_json(compact=True))
+
     def test_as_dict(self):
         test_dict = self.non_empty_microphone_channel.as_dict()
         self.assertEqual(test_dict["sampleRate"], 10.0)
         self.assertEqual(test_dict["sensorDescription"], "foo")
 
+    def test_as_dict_matches_json_format(self):
+        self.assertEqual(self.non_empty_microphone_channel.as_dict(),
+                         self.non_empty_microphone_channel.as_dict(use_json_format=True))
+        self.assertEqual(self.empty_microphone_channel.as_dict(),
+                         self.empty_microphone_channel.as_dict(use_json_format=True))
+
     def test_as_bytes(self):
         test_bytes = self.non_empty_microphone_channel.as_bytes()
         self.assertTrue(len(test_bytes) > 0)
@@ -88,6 +103,20 @@ class TestCommonMetadata(unittest.TestCase):
         meta_data = self.meta_dict.get_metadata()
         self.assertEqual(meta_data, {})
 
+    def test_get_metadata_after_mutation(self):
+        meta_data = self.meta_dict.get_metadata()
+        meta_data["foo"] = "changed"
+        self.assertEqual(self.meta_dict.get_metadata()["foo"], "bar")
+        self.meta_dict.append_metadata("foo", "baz")
+        self.assertEqual(self.meta_dict.get_metadata()["foo"], "baz")
+
+    def test_get_metadata_after_backing_mutation(self):
+        backing = {"k": "old"}
+        meta_dict = redvox.api1000.common.metadata.Metadata(backing)
+        self.assertEqual(meta_dict.get_metadata(), {"k": "old"})
+        backing["k"] = "new"
+        self.assertEqual(meta_dict.get_metadata(), {"k": "new"})
+
 
 class TestCommonSample(unittest.TestCase):
     def setUp(self) -> None:
@@ -348,3 +377,42 @@ class TestCommonMethods(unittest.TestCase):
         nh = hash(data)
 
         self.assertEqual(h, nh)
+
+    def test_sampling_rate_statistics(self):
+        timestamps = np.array([0.0, 1_000.0, 2_000.0, 3_500.0, 4_000.0])
+        mean_rate, stdev_rate = common.sampling_rate_statistics(timestamps)
+        intervals_s = np.diff(timestamps) / 1_000_000.0
+        self.assertAlmostEqual(mean_rate, 1.0 / intervals_s.mean())
+        self.assertAlmostEqual(stdev_rate, mean_rate ** 2 * intervals_s.std())
+        self.assertEqual((0.0, 0.0), common.sampling_rate_statistics(np.array([0.0, 1_000.0])))
+
+    def test_lz4_compress_hc_decompress(self):
+        data = "".join(map(str, range(1000))).encode() * 100
+        compressed = redvox.api1000.common.lz4.compress_hc(data)
+        self.assertEqual(data, bytes(redvox.api1000.common.lz4.decompress(compressed)))
+
+    def test_lz4_decompress_frames(self):
+        first = "".join(map(str, range(1000))).encode()
+        second = b"second frame"
+        compressed = redvox.api1000.common.lz4.compress(first)
+        self.assertEqual(first, redvox.api1000.common.lz4.decompress_frames(compressed))
+        compressed += redvox.api1000.common.lz4.compress(second)
+        self.assertEqual(first + second, redvox.api1000.common.lz4.decompress_frames(compressed))
+
+    def test_lz4_block_compress_decompress(self):
+        data = "".join(map(str, range(1000))).encode() * 100
+        compressed = redvox.api1000.common.lz4.block_compress(data)
+        self.assertEqual(data, bytes(redvox.api1000.common.lz4.block_decompress(compressed)))
+
+    def test_lz4_compress_decompress_shuffled(self):
+        timestamps = np.arange(1000, dtype=np.float64) * 1000.0 + 1_600_000_000_000_000.0
+        compressed = redvox.api1000.common.lz4.compress_shuffled(timestamps)
+        self.assertLess(len(compressed), len(redvox.api1000.common.lz4.block_compress(timestamps.tobytes())))
+        decompressed = redvox.api1000.common.lz4.decompress_shuffled(compressed, np.float64)
+        self.assertTrue(np.array_equal(timestamps, decompressed))
+
+        samples = np.array([1, -2, 3], dtype=np.int32)
+        decompressed = redvox.api1000.common.lz4.decompress_shuffled(
+            redvox.api1000.common.lz4.compress_shuffled(samples), np.int32
+        )
+        self.assertTrue(np.array_equal(samples, decompressed))
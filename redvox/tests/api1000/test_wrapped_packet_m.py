@@ -1,8 +1,13 @@
+import json
+import os.path
+import tempfile
 import unittest
 import numpy as np
+from google.protobuf.json_format import MessageToJson
 import redvox.api1000.wrapped_redvox_packet.wrapped_packet as w_packet
 import redvox.api1000.wrapped_redvox_packet.station_information as station
 import redvox.api1000.wrapped_redvox_packet.timing_information as timing
+import redvox.tests as tests
 
 
 class TestWrappedPacket(unittest.TestCase):
@@ -49,3 +54,17 @@ class TestWrappedPacket(unittest.TestCase):
         self.assertEqual(error_list, [])
         error_list = w_packet.validate_wrapped_packet(self.empty_packet_info)
         self.assertNotEqual(error_list, [])
+
+    def test_write_json_to_file(self):
+        with tempfile.TemporaryDirectory() as out_dir:
+            out_path: str = self.non_empty_packet_info.write_json_to_file(out_dir)
+            self.assertEqual(os.path.join(out_dir, self.non_empty_packet_info.default_filename("json")), out_path)
+            with open(out_path, "r") as json_in:
+                self.assertEqual(MessageToJson(self.non_empty_packet_info.get_proto(), True), json_in.read())
+
+    def test_as_json_compact(self):
+        packet: w_packet.WrappedRedvoxPacketM = w_packet.WrappedRedvoxPacketM.from_compressed_path(
+            tests.test_data("0000000001_1597189452945991.rdvxm"))
+        self.assertEqual(json.loads(packet.as_json()), json.loads(packet.as_json(compact=True)))
+        self.assertEqual(json.loads(self.non_empty_packet_info.as_json()),
+                         json.loads(self.non_empty_packet_info.as_json(compact=True)))
@@ -23,3 +23,26 @@ class TestXyz(unittest.TestCase):
         self.assertEqual(error_list, [])
         error_list = xyz.validate_xyz(self.empty_xyz_sensor)
         self.assertNotEqual(error_list, [])
+
+    def test_get_samples_xyz(self):
+        samples = self.non_empty_xyz_sensor.get_samples_xyz()
+        self.assertEqual((4, 3), samples.shape)
+        self.assertTrue(np.array_equal(samples[1], [1, 2, 1]))
+        self.assertEqual((0, 3), self.empty_xyz_sensor.get_samples_xyz().shape)
+
+    def test_set_samples_xyz(self):
+        samples = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        self.empty_xyz_sensor.set_samples_xyz(samples, True)
+        self.assertTrue(np.array_equal(self.empty_xyz_sensor.get_y_samples().get_values(), [2.0, 5.0]))
+        self.assertEqual(6.0, self.empty_xyz_sensor.get_z_samples().get_summary_statistics().get_max())
+        self.assertTrue(np.array_equal(self.empty_xyz_sensor.get_samples_xyz(), samples))
+        with self.assertRaises(Exception):
+            self.empty_xyz_sensor.set_samples_xyz(np.array([1.0, 2.0, 3.0]))
+
+    def test_set_yz_samples(self):
+        y_samples = common.SamplePayload.new().set_values(np.array([7.0]))
+        z_samples = common.SamplePayload.new().set_values(np.array([8.0]))
+        self.non_empty_xyz_sensor.set_y_samples(y_samples).set_z_samples(z_samples)
+        self.assertEqual(4, self.non_empty_xyz_sensor.get_x_samples().get_values_count())
+        self.assertEqual(7.0, self.non_empty_xyz_sensor.get_proto().y_samples.values[0])
+        self.assertEqual(8.0, self.non_empty_xyz_sensor.get_proto().z_samples.values[0])
@@ -5,11 +5,17 @@ from redvox.tests import *
 import unittest
 
 from numpy import array, array_equal
+from numpy.testing import assert_allclose
 
 
 class TestBarometerSensor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.example_packet = reader.read_rdvxz_file(test_data("example.rdvxz"))
+
     def setUp(self):
-        self.example_sensor = reader.read_rdvxz_file(test_data("example.rdvxz")).barometer_sensor()
+        # sensors wrap the shared packet, so tests that mutate the example must use a clone of the packet
+        self.example_sensor = self.example_packet.barometer_sensor()
         self.empty_sensor = reader.BarometerSensor()
 
     def test_get_payload_values(self):
@@ -17,9 +23,10 @@ class TestBarometerSensor(unittest.TestCase):
         self.assertTrue(array_equal([], self.empty_sensor.payload_values()))
 
     def test_set_payload_values(self):
-        self.example_sensor.set_payload_values([1.0, 2.0, 3.0])
+        example_sensor = self.example_packet.clone().barometer_sensor()
+        example_sensor.set_payload_values([1.0, 2.0, 3.0])
         self.empty_sensor.set_payload_values(array([1.0, 2.0, 3.0]))
-        self.assertTrue(array_equal([1.0, 2.0, 3.0], self.example_sensor.payload_values()))
+        self.assertTrue(array_equal([1.0, 2.0, 3.0], example_sensor.payload_values()))
         self.assertTrue(array_equal([1.0, 2.0, 3.0], self.empty_sensor.payload_values()))
 
     def test_get_payload_mean(self):
@@ -40,5 +47,11 @@ class TestBarometerSensor(unittest.TestCase):
         with self.assertRaises(exceptions.ReaderException):
             self.assertAlmostEqual(4.1428571428571, self.empty_sensor.payload_std())
 
+    def test_get_payload_stats(self):
+        assert_allclose(self.example_sensor.payload_stats(), [4.1428571428571, 0.0, 10.28769822], rtol=1e-7)
 
+        self.empty_sensor.set_payload_values([1.0, 2.0, 3.0])
+        assert_allclose(self.empty_sensor.payload_stats(), [2.0, 2.0, 0.816496580927726], rtol=1e-7)
 
+        with self.assertRaises(exceptions.ReaderException):
+            reader.BarometerSensor().payload_stats()
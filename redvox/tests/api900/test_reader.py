@@ -2,6 +2,7 @@ import os
 import unittest
 
 import redvox.api900.reader as reader
+import redvox.settings as settings
 import redvox.tests as test_utils
 
 
@@ -10,14 +11,6 @@ class TestReader(unittest.TestCase):
         self.example_packet = reader.read_rdvxz_file(test_utils.test_data("example.rdvxz"))
         self.cloned_packet = self.example_packet.clone()
 
-    def test_is_int(self):
-        self.assertTrue(reader._is_int("1"))
-        self.assertTrue(reader._is_int("0"))
-        self.assertTrue(reader._is_int("-1"))
-        self.assertFalse(reader._is_int("a"))
-        self.assertFalse(reader._is_int("foo"))
-        self.assertFalse(reader._is_int(""))
-
     def test_is_valid_redvox_filename(self):
         self.assertTrue(reader._is_valid_redvox_filename("1637681006_1546631601587.rdvxz"))
         self.assertFalse(reader._is_valid_redvox_filename("163768100_1546631601587.rdvxz"))
@@ -25,6 +18,8 @@ class TestReader(unittest.TestCase):
         self.assertFalse(reader._is_valid_redvox_filename("1637681006_154663160158.rdvxz"))
         self.assertFalse(reader._is_valid_redvox_filename("1637681006_15466316015877.rdvxz"))
         self.assertFalse(reader._is_valid_redvox_filename("1637681006_1546631601587"))
+        self.assertFalse(reader._is_valid_redvox_filename("1637681006_1546631601587.rdvxz.bak"))
+        self.assertFalse(reader._is_valid_redvox_filename("163768100a_1546631601587.rdvxz"))
 
     def test_is_path_in_set(self):
         self.assertTrue(reader._is_path_in_set(f"{os.sep}1637681006_1546631601587.rdvxz",
@@ -97,3 +92,38 @@ class TestReader(unittest.TestCase):
         self.assertEqual(3, len(grouped["0000000001:123456789"]))
         self.assertEqual(2, len(grouped["foo:bar"]))
 
+
+    def test_read_rdvxz_file_range_parallel(self):
+        settings.set_parallelism_enabled(False)
+        serial = reader.read_rdvxz_file_range(test_utils.TEST_DATA_DIR, 0, 2000000000,
+                                              concat_continuous_segments=False)
+        settings.set_parallelism_enabled(True)
+        parallel = reader.read_rdvxz_file_range(test_utils.TEST_DATA_DIR, 0, 2000000000,
+                                                concat_continuous_segments=False)
+        settings.set_parallelism_enabled(False)
+        self.assertEqual(serial.keys(), parallel.keys())
+        for id_uuid, packets in serial.items():
+            self.assertEqual([packet.app_file_start_timestamp_machine() for packet in packets],
+                             [packet.app_file_start_timestamp_machine() for packet in parallel[id_uuid]])
+
+    def test_id_uuid_tuple(self):
+        self.assertEqual(("0000000001", "123456789"), reader._id_uuid_tuple(self.example_packet))
+
+    def test_read_rdvxz_file_cached(self):
+        reader.clear_file_cache()
+        settings.set_file_cache_enabled(True)
+        try:
+            first = reader.read_rdvxz_file(test_utils.test_data("example.rdvxz"))
+            second = reader.read_rdvxz_file(test_utils.test_data("example.rdvxz"))
+            self.assertEqual(1, reader._read_decompressed_file_cached.cache_info().hits)
+            self.assertIsNot(first, second)
+            self.assertEqual("0000000001", second.redvox_id())
+            first.set_redvox_id("foo")
+            self.assertEqual("0000000001", reader.read_rdvxz_file(test_utils.test_data("example.rdvxz")).redvox_id())
+        finally:
+            settings.set_file_cache_enabled(None)
+            reader.clear_file_cache()
+
+    def test_read_rdvxz_file_uncached(self):
+        reader.read_rdvxz_file(test_utils.test_data("example.rdvxz"))
+        self.assertEqual(0, reader._read_decompressed_file_cached.cache_info().currsize)
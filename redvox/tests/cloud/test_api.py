@@ -0,0 +1,105 @@
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
+import threading
+import unittest
+from typing import Dict, List
+
+import requests
+
+import redvox.cloud.api as api
+import redvox.cloud.metadata_api as metadata_api
+from redvox.cloud.config import RedVoxConfig
+from redvox.cloud.routes import RoutesV1
+
+
+class FakeSession:
+    def __init__(self, content: bytes) -> None:
+        self.content: bytes = content
+        self.bodies: List[bytes] = []
+
+    def post(self, url: str, data: bytes, headers: dict, timeout: float) -> requests.Response:
+        self.bodies.append(data)
+        resp: requests.Response = requests.Response()
+        resp.status_code = 200
+        resp._content = self.content
+        return resp
+
+
+class TestPostReq(unittest.TestCase):
+    def setUp(self) -> None:
+        api.clear_response_cache()
+        self.config: RedVoxConfig = RedVoxConfig("user", "pass")
+        self.session: FakeSession = FakeSession(b'{"metadata": [{"api": 900, "station_id": "1637680001"}]}')
+        self.req: metadata_api.MetadataReq = metadata_api.MetadataReq("token", 0, 10, ["1637680001"], ["Api"])
+
+    def tearDown(self) -> None:
+        api.clear_response_cache()
+
+    def test_post_req(self):
+        resp = api.post_req(self.config, RoutesV1.METADATA_REQ, self.req, api.json_resp, self.session)
+        self.assertEqual({"metadata": [{"api": 900, "station_id": "1637680001"}]}, resp)
+        self.assertEqual(self.req.to_dict(), json.loads(self.session.bodies[0]))
+
+    def test_post_req_uncached(self):
+        api.post_req(self.config, RoutesV1.METADATA_REQ, self.req, api.json_resp, self.session)
+        api.post_req(self.config, RoutesV1.METADATA_REQ, self.req, api.json_resp, self.session)
+        self.assertEqual(2, len(self.session.bodies))
+
+    def test_post_req_cached(self):
+        first = metadata_api.request_metadata(self.config, self.req, self.session, use_cache=True)
+        second = metadata_api.request_metadata(self.config, self.req, self.session, use_cache=True)
+        self.assertEqual(1, len(self.session.bodies))
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+        other_req: metadata_api.MetadataReq = metadata_api.MetadataReq("token", 0, 20, ["1637680001"], ["Api"])
+        metadata_api.request_metadata(self.config, other_req, self.session, use_cache=True)
+        self.assertEqual(2, len(self.session.bodies))
+
+        api.clear_response_cache()
+        metadata_api.request_metadata(self.config, self.req, self.session, use_cache=True)
+        self.assertEqual(3, len(self.session.bodies))
+
+
+class UnavailableHandler(BaseHTTPRequestHandler):
+    requests_by_method: Dict[str, int] = {}
+
+    def do_GET(self) -> None:
+        self.__unavailable()
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.__unavailable()
+
+    def __unavailable(self) -> None:
+        UnavailableHandler.requests_by_method[self.command] = UnavailableHandler.requests_by_method.get(
+            self.command, 0) + 1
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class TestHealthCheck(unittest.TestCase):
+    def setUp(self) -> None:
+        UnavailableHandler.requests_by_method = {}
+        self.server: HTTPServer = HTTPServer(("127.0.0.1", 0), UnavailableHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.config: RedVoxConfig = RedVoxConfig("user", "pass", "http", "127.0.0.1", self.server.server_port)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_health_check_unavailable(self):
+        self.assertFalse(api.health_check(self.config, timeout=5.0))
+        with api.new_session() as session:
+            self.assertFalse(api.health_check(self.config, session, timeout=5.0))
+        self.assertEqual(8, UnavailableHandler.requests_by_method["GET"])
+
+    def test_post_req_unavailable(self):
+        req: metadata_api.MetadataReq = metadata_api.MetadataReq("token", 0, 10, ["1637680001"], ["Api"])
+        self.assertIsNone(api.post_req(self.config, RoutesV1.METADATA_REQ, req, api.json_resp, timeout=5.0))
+        self.assertEqual(4, UnavailableHandler.requests_by_method["POST"])
@@ -0,0 +1,203 @@
+import threading
+import unittest
+from unittest import mock
+from dataclasses import fields
+from typing import Dict, List, Set
+
+import numpy as np
+import requests
+
+import redvox.cloud.metadata_api as metadata_api
+
+
+class TestMetadataRespBuilder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.resp_dict: Dict = {
+            "metadata": [
+                {
+                    "api": 900,
+                    "station_id": "1637680001",
+                    "is_private": 1,
+                    "battery_level": 50,
+                    "audio_sensor": {"sensor_name": "mic", "sample_rate": 80, "payload_cnt": 4096},
+                    "barometer_sensor": {"value_mean": 101.3, "metadata": ["a", "b"]},
+                    "accelerometer_sensor": {"x_mean": 0.5},
+                    "location_sensor": None,
+                    "unknown_field": "ignored",
+                },
+                {},
+            ]
+        }
+
+    def test_matches_from_dict(self):
+        built: metadata_api.MetadataResp = metadata_api._build_metadata_resp(self.resp_dict)
+        self.assertEqual(metadata_api.MetadataResp.from_dict(self.resp_dict), built)
+        self.assertEqual(80.0, built.metadata[0].audio_sensor.sample_rate)
+        self.assertIsInstance(built.metadata[0].audio_sensor.sample_rate, float)
+        self.assertTrue(built.metadata[0].is_private)
+        self.assertEqual(["a", "b"], built.metadata[0].barometer_sensor.metadata)
+        self.assertIsNone(built.metadata[0].location_sensor)
+        self.assertEqual(metadata_api.PacketMetadataResult(), built.metadata[1])
+
+    def test_sensor_metadata_interned(self):
+        resp_dict: Dict = {"metadata": [self.resp_dict["metadata"][0], dict(self.resp_dict["metadata"][0])]}
+        built: metadata_api.MetadataResp = metadata_api._build_metadata_resp(resp_dict)
+        self.assertIs(built.metadata[0].audio_sensor, built.metadata[1].audio_sensor)
+        self.assertIs(built.metadata[0].barometer_sensor, built.metadata[1].barometer_sensor)
+        self.assertIsNot(built.metadata[0], built.metadata[1])
+
+    def test_timing_meta(self):
+        timing_dict: Dict = {
+            "station_id": "1637680001",
+            "start_ts_os": 1,
+            "start_ts_mach": 2,
+            "server_ts": 3,
+            "mach_time_zero": 4,
+            "best_latency": 5.5,
+            "best_offset": 6.5,
+        }
+        self.assertEqual(metadata_api.TimingMeta.from_dict(timing_dict), metadata_api._build_timing_meta(timing_dict))
+
+    def test_station_status_resp(self):
+        station_status: Dict = {field.name: None for field in fields(metadata_api.StationStatus)}
+        station_status.update(
+            api="M",
+            recording_state="recording",
+            app_start_timestamp=1,
+            timestamp=2,
+            synch_enabled=True,
+            station_id="1637680001",
+            station_uuid="123",
+            private=False,
+            sampling_rate=80,
+            sensor_name="mic",
+            samples_per_packet=4096,
+            additional_sensors=[["accelerometer", "ok"]],
+            make="make",
+            model="model",
+            os="os",
+            os_version="1.0",
+            client_version="2.0",
+            settings={"a": 1},
+            diffs=[{"b": 2}],
+        )
+        resp_dict: Dict = {
+            "station_statuses": [station_status],
+            "data_availabilities": [
+                {
+                    "station_id": "1637680001",
+                    "station_uuid": "123",
+                    "start": 1,
+                    "end": 2,
+                    "total_packets": 3,
+                    "expected_packets": 4,
+                }
+            ],
+        }
+        built: metadata_api.StationStatusResp = metadata_api._build_station_status_resp(resp_dict)
+        self.assertEqual(metadata_api.StationStatusResp.from_dict(resp_dict), built)
+        self.assertEqual([("accelerometer", "ok")], built.station_statuses[0].additional_sensors)
+
+
+class ClosingSession(requests.Session):
+    def __init__(self) -> None:
+        super().__init__()
+        self.closed: bool = False
+
+    def close(self) -> None:
+        self.closed = True
+        super().close()
+
+
+class TestMapRequests(unittest.TestCase):
+    def test_map_requests_preserves_order(self):
+        reqs = list(range(20))
+        self.assertEqual([req * 2 for req in reqs],
+                         metadata_api._map_requests(lambda req, session: req * 2, reqs, None, 8))
+
+    def test_map_requests_serial(self):
+        session: requests.Session = requests.Session()
+        self.assertEqual([], metadata_api._map_requests(lambda req, req_session: req, [], session, 8))
+        self.assertEqual([session, session],
+                         metadata_api._map_requests(lambda req, req_session: req_session, [1, 2], session, 1))
+
+    def test_map_requests_session_per_thread(self):
+        session: requests.Session = requests.Session()
+        barrier: threading.Barrier = threading.Barrier(4)
+        sessions_by_thread: Dict[int, Set[int]] = {}
+
+        def request_fn(req: int, req_session: requests.Session) -> requests.Session:
+            barrier.wait(5.0)
+            sessions_by_thread.setdefault(threading.get_ident(), set()).add(id(req_session))
+            return req_session
+
+        with mock.patch.object(metadata_api, "new_session", ClosingSession):
+            used: List[ClosingSession] = metadata_api._map_requests(request_fn, list(range(4)), session, 4)
+        self.assertNotIn(session, used)
+        self.assertEqual(4, len({id(used_session) for used_session in used}))
+        self.assertTrue(all(len(ids) == 1 for ids in sessions_by_thread.values()))
+        self.assertTrue(all(used_session.closed for used_session in used))
+
+
+class TestTimingMetaResponse(unittest.TestCase):
+    def setUp(self) -> None:
+        self.timing_dict: Dict = {
+            "station_id": "1637680001",
+            "start_ts_os": 1.0,
+            "start_ts_mach": 2.0,
+            "server_ts": 3.0,
+            "mach_time_zero": 4.0,
+            "best_latency": 5.0,
+            "best_offset": 6.0,
+        }
+        self.timing_meta: metadata_api.TimingMeta = metadata_api.TimingMeta.from_dict(self.timing_dict)
+
+    def test_from_list(self):
+        resp = metadata_api._timing_meta_response_from_json([self.timing_dict])
+        self.assertEqual([self.timing_meta], resp.items)
+
+    def test_from_items_dict(self):
+        resp = metadata_api._timing_meta_response_from_json({"items": [self.timing_dict]})
+        self.assertEqual([self.timing_meta], resp.items)
+
+    def test_empty(self):
+        self.assertEqual([], metadata_api._timing_meta_response_from_json(None).items)
+        self.assertEqual([], metadata_api._timing_meta_response_from_json({"items": None}).items)
+        self.assertEqual([], metadata_api._timing_meta_response_from_json([]).items)
+
+
+class TestPacketMetadataResultBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.json_dicts = [
+            {"api": 900, "station_id": "1637680001", "is_private": True, "best_latency": 1.5},
+            {"api": 1000, "best_latency": None, "audio_sensor": {"sample_rate": 80.0}},
+        ]
+
+    def test_from_json(self):
+        batch: metadata_api.PacketMetadataResultBatch = metadata_api.PacketMetadataResultBatch.from_json(
+            self.json_dicts
+        )
+        self.assertEqual(2, len(batch))
+        self.assertEqual([900.0, 1000.0], batch.api.tolist())
+        self.assertEqual(["1637680001", None], batch.station_id.tolist())
+        self.assertEqual([True, False], batch.is_private.tolist())
+        self.assertEqual(1.5, batch.best_latency[0])
+        self.assertTrue(np.isnan(batch.best_latency[1]))
+        with self.assertRaises(AttributeError):
+            _ = batch.audio_sensor
+
+    def test_from_metadata(self):
+        from_json = metadata_api.PacketMetadataResultBatch.from_json(self.json_dicts)
+        from_metadata = metadata_api.PacketMetadataResultBatch.from_metadata(
+            metadata_api._build_metadata_resp({"metadata": self.json_dicts}).metadata
+        )
+        self.assertEqual(from_json.columns.keys(), from_metadata.columns.keys())
+        for name, column in from_json.columns.items():
+            self.assertTrue(
+                np.array_equal(column, from_metadata.columns[name], equal_nan=column.dtype == np.float64), name
+            )
+
+    def test_empty(self):
+        batch: metadata_api.PacketMetadataResultBatch = metadata_api.PacketMetadataResultBatch.from_json([])
+        self.assertEqual(0, len(batch))
+        self.assertEqual(0, len(batch.best_latency))
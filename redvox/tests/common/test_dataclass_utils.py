@@ -0,0 +1,47 @@
+import unittest
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from dataclasses_json import dataclass_json
+
+import redvox.common.dataclass_utils as dcu
+
+
+@dataclass_json
+@dataclass(frozen=True)
+class Inner:
+    name: str
+    value: float = 0.0
+
+
+@dataclass_json
+@dataclass
+class Outer:
+    count: int
+    pairs: List[Tuple[float, str]]
+    inner: Optional[Inner] = None
+    by_name: Dict[str, Inner] = field(default_factory=dict)
+
+
+class DataclassUtilsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.outer: Outer = Outer(2, [(1.0, "a"), (2.0, "b")], Inner("x", 1.5), {"y": Inner("y")})
+
+    def test_encoder_matches_to_dict(self):
+        self.assertEqual(self.outer.to_dict(), dcu.dataclass_encoder(Outer)(self.outer))
+
+    def test_decoder_matches_from_dict(self):
+        as_dict: Dict = self.outer.to_dict()
+        as_dict["count"] = 2.0
+        as_dict["unknown"] = "ignored"
+        decoded: Outer = dcu.dataclass_decoder(Outer)(as_dict)
+        self.assertEqual(Outer.from_dict(as_dict), decoded)
+        self.assertIsInstance(decoded.count, int)
+        self.assertEqual(Outer(1, []), dcu.dataclass_decoder(Outer)({"count": 1, "pairs": []}))
+
+    def test_decoder_interning(self):
+        as_dict: Dict = {"count": 1, "pairs": [], "inner": {"name": "x"}}
+        decode = dcu.dataclass_decoder(Outer, 4)
+        self.assertIs(decode(as_dict).inner, decode(dict(as_dict)).inner)
+        decode = dcu.dataclass_decoder(Outer)
+        self.assertIsNot(decode(as_dict).inner, decode(dict(as_dict)).inner)
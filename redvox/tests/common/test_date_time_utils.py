@@ -184,6 +184,12 @@ class TestDateTime(unittest.TestCase):
                           ("2020", "07", "04")],
                          list(date_it))
 
+    def test_trucate_dt_y(self):
+        self.assertEqual(datetime(2020, 1, 1), dt.truncate_dt_y(datetime(2020, 3, 2, 3, 4, 5, 6)))
+
+    def test_trucate_dt_ym(self):
+        self.assertEqual(datetime(2020, 3, 1), dt.truncate_dt_ym(datetime(2020, 3, 2, 3, 4, 5, 6)))
+
     def test_trucate_dt_ymd(self):
         _dt = datetime(2020, 1, 2, 3, 4, 5, 6)
         _dt = dt.truncate_dt_ymd(_dt)
@@ -1,14 +1,21 @@
 from datetime import datetime, timedelta
 import os
 import os.path
+import pickle
 import shutil
+import sys
 import tempfile
-from typing import Optional, Union
+from multiprocessing.pool import ThreadPool
+from typing import List, Optional, Union
 from unittest import TestCase
 
+import lz4.frame
+
+from redvox.api1000.errors import ApiMTypeError
 from redvox.api1000.proto.redvox_api_m_pb2 import RedvoxPacketM
 from redvox.api1000.wrapped_redvox_packet.wrapped_packet import WrappedRedvoxPacketM
 from redvox.api900.lib.api900_pb2 import RedvoxPacket
+from redvox.api900.reader_utils import lz4_decompress
 from redvox.common.date_time_utils import (
     datetime_from_epoch_milliseconds_utc as ms2dt,
     datetime_from_epoch_microseconds_utc as us2dt,
@@ -18,6 +25,7 @@ from redvox.common.date_time_utils import (
     truncate_dt_ymdh,
 )
 import redvox.common.io as io
+import redvox.settings as settings
 
 
 def write_min_api_1000(base_dir: str, file_name: Optional[str] = None) -> str:
@@ -145,6 +153,16 @@ class IoTests(IoTestCase):
         self.assertIsNone(io._is_int("foo"))
         self.assertIsNone(io._is_int("1.325"))
 
+    def test_is_int_str(self):
+        self.assertTrue(io._is_int_str("0"))
+        self.assertTrue(io._is_int_str("1597189452945991"))
+        self.assertTrue(io._is_int_str("-10"))
+        self.assertFalse(io._is_int_str(""))
+        self.assertFalse(io._is_int_str("-"))
+        self.assertFalse(io._is_int_str("+1"))
+        self.assertFalse(io._is_int_str("1.0"))
+        self.assertFalse(io._is_int_str("foo"))
+
     def test_not_none(self):
         self.assertTrue(io._not_none(""))
         self.assertFalse(io._not_none(None))
@@ -168,6 +186,119 @@ class IoTests(IoTestCase):
 
         self.assertEqual(["baz"], list(io._list_subdirs(lvl1, {"baz"})))
 
+    def test_list_subdirs_missing_dir(self):
+        self.assertEqual([], list(io._list_subdirs(os.path.join(self.temp_dir_path, "missing"), {"foo"})))
+
+    def test_structured_data_dirs(self):
+        base_dir = os.path.join(self.temp_dir_path, "structured_dirs")
+        for parts in [("2020", "12", "31", "23"), ("2021", "01", "01", "00"), ("2021", "01", "01", "05"),
+                      ("2021", "02", "30", "00"), ("2021", "03", "01", "00"), ("2021", "foo", "01", "00")]:
+            os.makedirs(os.path.join(base_dir, *parts), exist_ok=True)
+
+        read_filter = io.ReadFilter.empty().with_start_dt(datetime(2021, 1, 1)).with_end_dt(datetime(2021, 2, 1))
+        self.assertEqual(
+            {os.path.join(base_dir, "2021", "01", "01", "00"), os.path.join(base_dir, "2021", "01", "01", "05")},
+            set(io._structured_data_dirs(base_dir, read_filter, True)),
+        )
+        self.assertEqual(
+            [os.path.join(base_dir, "2021", "01", "01")],
+            list(io._structured_data_dirs(base_dir, read_filter, False)),
+        )
+        self.assertEqual(4, len(list(io._structured_data_dirs(base_dir, io.ReadFilter.empty(), True))))
+
+    def test_index_structured_cache(self):
+        base_dir = os.path.join(self.temp_dir_path, "structured_cache", "api1000")
+        hour_dir = os.path.join(base_dir, "2021", "01", "01", "00")
+        os.makedirs(hour_dir, exist_ok=True)
+        copy_exact(self.template_1000_path, hour_dir, "1000_1609459200000000.rdvxm")
+        cache_path = os.path.join(self.temp_dir_path, "structured_cache", "index.cache")
+        read_filter = io.ReadFilter()
+
+        self.assertEqual(1, len(io.index_structured(base_dir, read_filter, cache_path=cache_path).entries))
+        self.assertTrue(os.path.isfile(cache_path))
+
+        # A matching fingerprint is served from the cache
+        io._store_index_cache(cache_path, io._structured_fingerprint(base_dir, read_filter), io.Index())
+        self.assertEqual(0, len(io.index_structured(base_dir, read_filter, cache_path=cache_path).entries))
+        self.assertEqual(1, len(io.index_structured(base_dir, io.ReadFilter.empty(), cache_path=cache_path).entries))
+
+        # Changing a data directory invalidates the cache
+        copy_exact(self.template_1000_path, hour_dir, "1000_1609459201000000.rdvxm")
+        os.utime(hour_dir, ns=(0, 0))
+        self.assertEqual(2, len(io.index_structured(base_dir, read_filter, cache_path=cache_path).entries))
+        cached = io._load_index_cache(cache_path, io._structured_fingerprint(base_dir, read_filter))
+        self.assertEqual(2, len(cached.entries))
+
+        # An index that can not be cached is still returned
+        missing_cache_path = os.path.join(self.temp_dir_path, "structured_cache", "missing", "index.cache")
+        self.assertEqual(2, len(io.index_structured(base_dir, read_filter, cache_path=missing_cache_path).entries))
+        self.assertFalse(os.path.exists(missing_cache_path))
+
+    def test_list_files(self):
+        lvl1 = os.path.join(self.temp_dir_path, "foo")
+        os.makedirs(os.path.join(lvl1, "bar.rdvxm"), exist_ok=True)
+        for name in ["a.rdvxm", "b.rdvxz", "c.txt", ".d.rdvxm"]:
+            with open(os.path.join(lvl1, name), "w"):
+                pass
+
+        self.assertEqual(
+            {os.path.join(lvl1, "a.rdvxm"), os.path.join(lvl1, "b.rdvxz")},
+            set(io._list_files(lvl1, (".rdvxm", ".rdvxz"))),
+        )
+        self.assertEqual(3, len(io._list_files(lvl1, ("",))))
+        self.assertEqual([], io._list_files(os.path.join(self.temp_dir_path, "missing"), ("",)))
+
+    def test_list_data_dir_files(self):
+        base_dir = os.path.join(self.temp_dir_path, "data_dirs")
+        data_dirs = []
+        for i in range(20):
+            data_dir = os.path.join(base_dir, f"{i:02}")
+            os.makedirs(data_dir, exist_ok=True)
+            for name in [f"{i}_0.rdvxm", f"{i}_1.rdvxm", f"{i}.txt"]:
+                with open(os.path.join(data_dir, name), "w"):
+                    pass
+            data_dirs.append(data_dir)
+
+        expected = [path for data_dir in data_dirs for path in io._list_files(data_dir, (".rdvxm",))]
+        self.assertEqual(40, len(expected))
+        parallelism_enabled = settings.is_parallelism_enabled()
+        try:
+            for enabled in [False, True]:
+                settings.set_parallelism_enabled(enabled)
+                self.assertEqual(expected, io._list_data_dir_files(data_dirs, (".rdvxm",)))
+        finally:
+            settings.set_parallelism_enabled(parallelism_enabled)
+
+    def test_index_unstructured_relative_dir(self):
+        base_dir = os.path.join(self.temp_dir_path, "relative")
+        os.makedirs(base_dir, exist_ok=True)
+        path = copy_exact(self.template_1000_path, base_dir, "1000_1609459200000000.rdvxm")
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.temp_dir_path)
+            index = io.index_unstructured_py(os.path.join(".", "relative"), io.ReadFilter(), pool=None)
+        finally:
+            os.chdir(cwd)
+        self.assertEqual([os.path.abspath(path)], [entry.full_path for entry in index.entries])
+
+    def test_sort_unstructured_redvox_data(self):
+        input_dir = os.path.join(self.temp_dir_path, "to_sort")
+        output_dir = os.path.join(self.temp_dir_path, "sorted")
+        os.makedirs(input_dir, exist_ok=True)
+        os.makedirs(output_dir, exist_ok=True)
+        copy_exact(self.template_900_path, input_dir, "900_1609459200000.rdvxz")
+        copy_exact(self.template_1000_path, input_dir, "1000_1609459200000000.rdvxm")
+        copy_exact(self.template_1000_path, input_dir, "1000_1609459200000000.foo")
+
+        self.assertTrue(io.sort_unstructured_redvox_data(input_dir, output_dir))
+        self.assertTrue(
+            os.path.isfile(os.path.join(output_dir, "api900", "2021", "01", "01", "900_1609459200000.rdvxz"))
+        )
+        self.assertTrue(
+            os.path.isfile(os.path.join(output_dir, "api1000", "2021", "01", "01", "00", "1000_1609459200000000.rdvxm"))
+        )
+        self.assertEqual(2, len(io.index_structured_py(output_dir, io.ReadFilter(), pool=None).entries))
+
     def test_index_unstructured_all(self):
         copy_exact(self.template_900_path, self.unstructured_900_1000_dir, "900_1546300800000.rdvxz")
         copy_exact(self.template_900_path, self.unstructured_900_1000_dir, "900_1577836800000.rdvxz")
@@ -268,8 +399,46 @@ class IndexEntryTests(IoTestCase):
         self.assertEqual("0000000900", entry.station_id)
         self.assertEqual(io.ApiVersion.API_900, entry.api_version)
         self.assertEqual(datetime(2021, 1, 1), entry.date_time)
+        self.assertEqual(1609459200000000, entry.date_time_us)
         self.assertEqual(".rdvxz", entry.extension)
 
+    def test_from_path_file_sizes(self) -> None:
+        path_900: str = copy_exact(self.template_900_path, self.unstructured_900_dir, "0000000900_1609459200000.rdvxz")
+        entry_900: io.IndexEntry = io.IndexEntry.from_path(path_900)
+        with open(path_900, "rb") as fin:
+            buf: bytes = fin.read()
+        self.assertEqual(len(buf), entry_900.compressed_file_size_bytes)
+        self.assertEqual(len(lz4_decompress(buf)), entry_900.decompressed_file_size_bytes)
+
+        path_1000: str = copy_exact(self.template_1000_path, self.unstructured_1000_dir,
+                                    "0000001000_1609459200000000.rdvxm")
+        entry_1000: io.IndexEntry = io.IndexEntry.from_path(path_1000)
+        with open(path_1000, "rb") as fin:
+            buf = fin.read()
+        self.assertEqual(len(buf), entry_1000.compressed_file_size_bytes)
+        self.assertEqual(len(lz4.frame.decompress(buf)), entry_1000.decompressed_file_size_bytes)
+
+    def test_from_path_missing(self) -> None:
+        path: str = os.path.join(self.unstructured_900_dir, "0000000901_1609459200001.rdvxz")
+        self.assertIsNone(io.IndexEntry.from_path(path))
+        entry: io.IndexEntry = io.IndexEntry.from_path(path, strict=False)
+        self.assertEqual(path, entry.full_path)
+        self.assertEqual(0, entry.compressed_file_size_bytes)
+
+    def test_parse_file_name(self) -> None:
+        self.assertEqual(("0000000001", 1597189452945991, ".rdvxm"),
+                         io._parse_file_name("0000000001_1597189452945991.rdvxm"))
+        self.assertEqual(("1", 2, ""), io._parse_file_name("1_2"))
+        self.assertEqual(("1", 2, "."), io._parse_file_name("1_2."))
+        self.assertIsNone(io._parse_file_name("1_2.tar.gz"))
+        self.assertIsNone(io._parse_file_name(".rdvxm"))
+        self.assertIsNone(io._parse_file_name("1__2.rdvxm"))
+        self.assertIsNone(io._parse_file_name("a_2.rdvxm"))
+        self.assertEqual(("-1", -2, ".rdvxm"), io._parse_file_name("-1_-2.rdvxm"))
+        self.assertIsNone(io._parse_file_name("1_--2.rdvxm"))
+        self.assertIsNone(io._parse_file_name("1_+2.rdvxm"))
+        self.assertIsNone(io._parse_file_name("1_\u00b2.rdvxm"))
+
     def test_from_path_900_good_short_station_id(self) -> None:
         path: str = copy_exact(self.template_900_path, self.unstructured_900_dir, "9_1609459200000.rdvxz")
         entry: io.IndexEntry = io.IndexEntry.from_path(path)
@@ -338,6 +507,15 @@ class IndexEntryTests(IoTestCase):
         entry: io.IndexEntry = io.IndexEntry.from_path(path)
         self.assertIsNone(entry)
 
+    def test_datetime_date_time_us(self) -> None:
+        date_time: datetime = datetime(2021, 1, 1, 0, 0, 0, 123456)
+        entry: io.IndexEntry = io.IndexEntry("a", "0", date_time, ".rdvxm", io.ApiVersion.API_1000)
+        self.assertEqual(1609459200123456, entry.date_time_us)
+        self.assertIsInstance(entry.date_time_us, int)
+        self.assertEqual(date_time, entry.date_time)
+        with self.assertRaises(TypeError):
+            io.IndexEntry("a", "0", "2021-01-01", ".rdvxm", io.ApiVersion.API_1000)
+
     def test_from_path_1000_good(self) -> None:
         path: str = copy_exact(self.template_1000_path, self.unstructured_1000_dir,
                                "00000001000_1609459200000000.rdvxz")
@@ -346,6 +524,7 @@ class IndexEntryTests(IoTestCase):
         self.assertEqual("00000001000", entry.station_id)
         self.assertEqual(io.ApiVersion.API_1000, entry.api_version)
         self.assertEqual(datetime(2021, 1, 1), entry.date_time)
+        self.assertEqual(1609459200000000, entry.date_time_us)
         self.assertEqual(".rdvxz", entry.extension)
 
     def test_from_path_1000_good_short_station_id(self) -> None:
@@ -448,6 +627,34 @@ class IndexEntryTests(IoTestCase):
         self.assertIsNotNone(packet)
         self.assertEqual(1000.0, packet.api)
 
+    def test_read_raw_1000_multiple_frames(self):
+        packet: WrappedRedvoxPacketM = WrappedRedvoxPacketM.new()
+        packet.set_api(1000.0)
+        packet.get_station_information().set_id("1000")
+        serialized: bytes = packet.get_proto().SerializeToString()
+        split: int = len(serialized) // 2
+        path: str = os.path.join(self.unstructured_1000_dir, "0000001000_1609459200000000.rdvxm")
+        with open(path, "wb") as compressed_out:
+            compressed_out.write(lz4.frame.compress(serialized[:split]))
+            compressed_out.write(lz4.frame.compress(serialized[split:]))
+        entry: io.IndexEntry = io.IndexEntry.from_path(path)
+        self.assertEqual(packet.get_proto(), entry.read_raw())
+        self.assertEqual(packet.get_proto(), WrappedRedvoxPacketM.from_compressed_path(path).get_proto())
+
+
+class CountingThreadPool(ThreadPool):
+    """
+    A thread pool that counts its calls to imap, to check that work was handed to the pool.
+    """
+
+    def __init__(self, processes: int) -> None:
+        super().__init__(processes)
+        self.imap_calls: int = 0
+
+    def imap(self, *args, **kwargs):
+        self.imap_calls += 1
+        return super().imap(*args, **kwargs)
+
 
 class IndexTests(IoTestCase):
     def test_empty_index(self):
@@ -497,6 +704,33 @@ class IndexTests(IoTestCase):
             entries[0],
         ], index.entries)
 
+    def test_lexsort_entries(self):
+        entries = [
+            io.IndexEntry(f"{i}", f"{(i * 7) % 13}", (i * 31) % 17, ".rdvxm", api_version)
+            for i in range(200)
+            for api_version in (io.ApiVersion.API_900, io.ApiVersion.API_1000)
+        ]
+        expected = sorted(entries, key=io._INDEX_ENTRY_SORT_KEY)
+        self.assertEqual(expected, io._lexsort_entries(entries))
+        self.assertEqual(expected, io._lexsort_entries(expected))
+        # Entries with equal keys keep their relative order
+        self.assertEqual([id(entry) for entry in expected],
+                         [id(entry) for entry in io._lexsort_entries(entries)])
+        overflow = [io.IndexEntry("a", "0", 10 ** 20, "", io.ApiVersion.API_900),
+                    io.IndexEntry("b", "0", 0, "", io.ApiVersion.API_900)]
+        self.assertEqual([overflow[1], overflow[0]], io._lexsort_entries(overflow))
+
+    def test_is_mostly_sorted(self):
+        entries = [io.IndexEntry(f"{i}", f"{i % 3}", i, ".rdvxm", io.ApiVersion.API_1000) for i in range(1000)]
+        expected = sorted(entries, key=io._INDEX_ENTRY_SORT_KEY)
+        self.assertTrue(io._is_mostly_sorted(expected))
+        self.assertTrue(io._is_mostly_sorted(expected[500:] + expected[:500]))
+        self.assertFalse(io._is_mostly_sorted(expected[::-1]))
+        self.assertTrue(io._is_mostly_sorted([]))
+        index = io.Index(expected[500:] + expected[:500])
+        index.sort()
+        self.assertEqual(expected, index.entries)
+
     def test_append(self):
         index = io.Index()
         self.assertEqual(0, len(index.entries))
@@ -656,6 +890,71 @@ class IndexTests(IoTestCase):
         self.assertEqual(4, len(index.read(io.ReadFilter.empty().with_start_dt(datetime(2021, 1, 1, 0, 0, 1)))))
         self.assertEqual(4, len(index.read(io.ReadFilter.empty().with_end_dt(datetime(2021, 1, 1, 0, 0, 0)))))
 
+    def test_read_parallel(self):
+        entries: List[io.IndexEntry] = []
+        for i in range(10):
+            entries.append(io.IndexEntry.from_path(
+                copy_exact(self.template_900_path, self.unstructured_900_dir, f"900_16094592{i:05}.rdvxz")))
+            entries.append(io.IndexEntry.from_path(
+                copy_exact(self.template_1000_path, self.unstructured_1000_dir, f"1000_16094592{i:05}000.rdvxm")))
+        index: io.Index = io.Index(entries)
+        read_filter: io.ReadFilter = io.ReadFilter.empty()
+        expected = index.read(read_filter)
+        expected_raw = index.read_raw(read_filter)
+
+        parallelism_enabled = settings.is_parallelism_enabled()
+        try:
+            settings.set_parallelism_enabled(True)
+            with CountingThreadPool(2) as pool:
+                self.assertEqual(expected, index.read_parallel(read_filter, pool))
+                self.assertEqual(expected_raw, index.read_raw_parallel(read_filter, pool))
+                self.assertEqual(2, pool.imap_calls)
+            self.assertEqual(expected_raw, index.read_raw_parallel(read_filter))
+        finally:
+            settings.set_parallelism_enabled(parallelism_enabled)
+        self.assertEqual(expected_raw, index.read_raw_parallel(read_filter))
+
+    def test_prefetch_entries(self):
+        entries: List[io.IndexEntry] = [
+            io.IndexEntry.from_path(
+                copy_exact(self.template_1000_path, self.unstructured_1000_dir, f"1000_16094592{i:05}000.rdvxm"))
+            for i in range(5)
+        ]
+        entries.append(io.IndexEntry(os.path.join(self.unstructured_1000_dir, "missing.rdvxm"), "1000", 0, ".rdvxm",
+                                     io.ApiVersion.API_1000))
+        for depth in [0, 1, 3, 10]:
+            self.assertEqual(entries, list(io._prefetch_entries(iter(entries), depth)))
+        self.assertEqual([], list(io._prefetch_entries([])))
+
+    def test_columnar_filter(self):
+        start = datetime(2021, 1, 1)
+        index = io.Index([
+            io.IndexEntry(f"{i}", station_id, int(dt2us(start + timedelta(minutes=minutes))), extension, api_version)
+            for i, (station_id, minutes, extension, api_version) in enumerate([
+                ("0", -3, ".rdvxm", io.ApiVersion.API_1000),
+                ("1", 0, ".rdvxm", io.ApiVersion.API_1000),
+                ("0", 30, ".rdvxz", io.ApiVersion.API_900),
+                ("1", 63, ".foo", io.ApiVersion.API_900),
+                ("2", 30, ".rdvxm", io.ApiVersion.UNKNOWN),
+            ])
+        ])
+        columnar = index.to_columnar()
+        for read_filter in [
+            io.ReadFilter(),
+            io.ReadFilter.empty(),
+            io.ReadFilter(start_dt=start, end_dt=start + timedelta(hours=1)),
+            io.ReadFilter(station_ids={"1", "3"}, extensions=None),
+            io.ReadFilter(extensions=set()),
+        ]:
+            self.assertEqual(list(filter(read_filter.apply, index.entries)), columnar.filter(read_filter).entries)
+
+        read_filter = io.ReadFilter.empty() \
+            .with_start_dt(start) \
+            .with_start_dt_buf(timedelta(minutes=3)) \
+            .with_end_dt(start + timedelta(minutes=30)) \
+            .with_api_versions({io.ApiVersion.API_1000, io.ApiVersion.UNKNOWN})
+        self.assertEqual([True, True, False, False, True], list(columnar.mask(read_filter)))
+
 
 # noinspection PyTypeChecker,DuplicatedCode,Mypy
 class ReadFilterTests(IoTestCase):
@@ -737,6 +1036,13 @@ class ReadFilterTests(IoTestCase):
         self.assertFalse(read_filter.apply_dt(datetime(2021, 1, 1, 23)))
         self.assertTrue(read_filter.apply_dt(datetime(2021, 1, 1, 23), truncate_dt_ymdh))
 
+    def test_apply_wrong_type(self):
+        read_filter = io.ReadFilter()
+        with self.assertRaises(ApiMTypeError):
+            read_filter.apply_dt(1609459200)
+        with self.assertRaises(ApiMTypeError):
+            read_filter.apply("0_0")
+
     def test_apply_all_station_ids(self):
         read_filter = io.ReadFilter().with_extensions(None).with_api_versions(None)
         entries = [
@@ -958,6 +1264,58 @@ class ReadFilterTests(IoTestCase):
         self.assertEqual(["900", "1000", "0"],
                          list(map(lambda entry: entry.station_id, filter(read_filter.apply, entries))))
 
+    def test_compile_matches_apply(self):
+        start = datetime(2021, 1, 1)
+        entries = [
+            io.IndexEntry("", station_id, int(dt2us(start + timedelta(minutes=minutes))), extension, api_version)
+            for station_id in ["0", "1"]
+            for minutes in [-3, -2, 0, 30, 62, 63]
+            for extension in [".rdvxm", ".rdvxz", ".foo"]
+            for api_version in [io.ApiVersion.API_900, io.ApiVersion.API_1000, io.ApiVersion.UNKNOWN]
+        ]
+        read_filters = [
+            io.ReadFilter(),
+            io.ReadFilter.empty(),
+            io.ReadFilter(start_dt=start, end_dt=start + timedelta(hours=1)),
+            io.ReadFilter(start_dt=start, start_dt_buf=None, station_ids={"1"}),
+            io.ReadFilter(end_dt=start, end_dt_buf=None, api_versions={io.ApiVersion.UNKNOWN}),
+            io.ReadFilter(extensions={".foo"}),
+        ]
+        for read_filter in read_filters:
+            predicate = read_filter.compile()
+            self.assertEqual(
+                [
+                    read_filter.apply_dt(entry.date_time)
+                    and (read_filter.station_ids is None or entry.station_id in read_filter.station_ids)
+                    and (read_filter.extensions is None or entry.extension in read_filter.extensions)
+                    and (read_filter.api_versions is None or entry.api_version in read_filter.api_versions)
+                    for entry in entries
+                ],
+                list(map(predicate, entries)),
+            )
+
+    def test_with_station_ids_interned(self):
+        station_ids = {"".join(["00000", "00900"])}
+        read_filter = io.ReadFilter().with_station_ids(station_ids)
+        self.assertEqual(station_ids, read_filter.station_ids)
+        self.assertIsNot(station_ids, read_filter.station_ids)
+        self.assertIs(sys.intern("0000000900"), next(iter(read_filter.station_ids)))
+
+    def test_compile_cached(self):
+        read_filter = io.ReadFilter()
+        predicate = read_filter.compile()
+        self.assertIs(predicate, read_filter.compile())
+
+        read_filter.with_station_ids({"0"})
+        self.assertIsNot(predicate, read_filter.compile())
+        entry = io.IndexEntry("", "1", 0, ".rdvxm", io.ApiVersion.API_1000)
+        self.assertTrue(predicate(entry))
+        self.assertFalse(read_filter.apply(entry))
+
+        unpickled = pickle.loads(pickle.dumps(read_filter))
+        self.assertEqual(read_filter, unpickled)
+        self.assertFalse(unpickled.apply(entry))
+
 
 class IndexSummaryTests(IoTestCase):
     def test_empty(self):
@@ -6,6 +6,8 @@ import redvox.tests as tests
 from redvox.common.io import ReadFilter
 from redvox.common.api_reader import ApiReader
 import redvox.common.session_model as sm
+import redvox.common.session_io as s_io
+import redvox.common.session_model_utils as smu
 
 
 class SessionModelTest(unittest.TestCase):
@@ -18,6 +20,7 @@ class SessionModelTest(unittest.TestCase):
         files = ApiReader(self.input_dir, read_filter=self.station_filter).read_files_by_id("0000000001")
 
         model = sm.SessionModel.create_from_stream(files)
+        self.assertEqual(len(files), 3)
         self.assertEqual(model.cloud_session.n_pkts, 3)
         self.assertEqual(model.cloud_session.app_ver, "0.2.0")
         self.assertEqual(model.cloud_session.id, "0000000001")
@@ -27,6 +30,47 @@ class SessionModelTest(unittest.TestCase):
         self.assertEqual(len(model.dynamic_sessions), 2)
         self.assertEqual(len(model.get_daily_dynamic_sessions()), 1)
         self.assertEqual(len(model.get_hourly_dynamic_sessions()), 1)
+        self.assertEqual(model.get_hourly_dynamic_sessions()[0].n_pkts, 3)
+        self.assertEqual(model.get_daily_dynamic_sessions()[0].n_pkts, 3)
+        # the packets have station metrics, but no battery values
+        self.assertEqual(model.get_hourly_dynamic_sessions()[0].battery.welford.cnt, 0)
+        local_ts = [smu.get_local_timesync(f) for f in files]
+        self.assertAlmostEqual(model.cloud_session.timing.mean_lat, sum(t[3] for t in local_ts) / 3, 6)
+        self.assertAlmostEqual(model.cloud_session.timing.mean_off, sum(t[4] for t in local_ts) / 3, 6)
+
+    def test_sensors_by_name(self):
+        files = ApiReader(self.input_dir, read_filter=self.station_filter).read_files_by_id("0000000001")
+        model = sm.SessionModel.create_from_stream(files)
+        self.assertIs(model.get_sensor("location"), model.cloud_session.sensors[1])
+        self.assertIsNone(model.get_sensor("location", "not a description"))
+        audio = model.cloud_session.sensors.pop(0)
+        self.assertIsNone(model.audio_sample_rate_nominal_hz())
+        model.cloud_session.sensors.append(audio)
+        self.assertEqual(model.audio_sample_rate_nominal_hz(), 48000)
+        replaced = sm.cloud_sm.Sensor.from_dict(audio.to_dict())
+        replaced.sample_rate_stats.welford.mean = 1.
+        model.cloud_session.sensors[-1] = replaced
+        self.assertEqual(model.audio_sample_rate_nominal_hz(), 1.)
+        self.assertIs(model.get_sensor("audio"), replaced)
+
+    def test_dynamic_session_buckets(self):
+        files = ApiReader(self.input_dir, read_filter=self.station_filter).read_files_by_id("0000000001")
+        model = sm.SessionModel.create_from_stream(files)
+        hourly = model.get_hourly_dynamic_sessions()
+        hourly.clear()
+        self.assertEqual(len(model.get_hourly_dynamic_sessions()), 1)
+        new_hour = sm.cloud_sm.DynamicSession.from_dict(model.get_hourly_dynamic_sessions()[0].to_dict())
+        model.dynamic_sessions[f"{new_hour.session_key}:new"] = new_hour
+        self.assertEqual(len(model.get_hourly_dynamic_sessions()), 2)
+        self.assertEqual(len(model.get_daily_dynamic_sessions()), 1)
+        self.assertIs(model.get_hourly_dynamic_sessions()[1], new_hour)
+        replaced = sm.cloud_sm.DynamicSession.from_dict(new_hour.to_dict())
+        replaced.n_pkts = 999
+        model.dynamic_sessions[f"{new_hour.session_key}:new"] = replaced
+        self.assertIs(model.get_hourly_dynamic_sessions()[1], replaced)
+        self.assertIs(list(model.iter_hourly_dynamic_sessions())[1], replaced)
+        self.assertEqual(list(model.iter_hourly_dynamic_sessions()), model.get_hourly_dynamic_sessions())
+        self.assertEqual(list(model.iter_daily_dynamic_sessions()), model.get_daily_dynamic_sessions())
 
     def test_write_station_model(self):
         tmpdir = tempfile.TemporaryDirectory()
@@ -46,6 +90,30 @@ class SessionModelTest(unittest.TestCase):
 
         tmpdir.cleanup()
 
+    def test_session_model_dict_matches_dataclasses_json(self):
+        files = ApiReader(self.input_dir, read_filter=self.station_filter).read_files_by_id("0000000001")
+        model = sm.SessionModel.create_from_stream(files)
+        test = model.as_dict()
+        self.assertEqual(test["cloud_session"], model.cloud_session.to_dict())
+        for key, dynamic_session in model.dynamic_sessions.items():
+            self.assertEqual(test["dynamic_sessions"][key], dynamic_session.to_dict())
+        test = s_io.session_model_dict_from_json(s_io.session_model_to_json(model))
+        loaded = sm.SessionModel.from_dict(test)
+        self.assertEqual(loaded.cloud_session, sm.cloud_sm.Session.from_dict(test["cloud_session"]))
+        for key, dynamic_session in loaded.dynamic_sessions.items():
+            self.assertEqual(dynamic_session, sm.cloud_sm.DynamicSession.from_dict(test["dynamic_sessions"][key]))
+
+    def test_session_model_dict_from_json_non_finite(self):
+        test = s_io.session_model_dict_from_json(b'{"a": NaN, "b": [1, 2.5]}')
+        self.assertNotEqual(test["a"], test["a"])
+        self.assertEqual(test["b"], [1, 2.5])
+
+    def test_dynamic_bounds(self):
+        self.assertEqual(sm._get_dynamic_bounds(1597189452943691.0, sm._HOUR_US), (1597186800000000, 1597190400000000))
+        self.assertEqual(sm._get_dynamic_bounds(1597189452943691.0, sm._DAY_US), (1597104000000000, 1597190400000000))
+        self.assertEqual(sm._get_dynamic_bounds(1597190399999999.6, sm._HOUR_US), (1597190400000000, 1597194000000000))
+        self.assertEqual(sm._get_dynamic_bounds(float("nan"), sm._DAY_US), (0, 86400000000))
+
 
 class LocalSessionModelsTest(unittest.TestCase):
     @classmethod
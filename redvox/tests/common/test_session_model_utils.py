@@ -1,9 +1,11 @@
 import unittest
 import contextlib
 
+import numpy as np
+
 import redvox.common.session_model_utils as smu
 import redvox.tests as tests
-from redvox.cloud.session_model_api import WelfordAggregator, Stats
+from redvox.cloud.session_model_api import FirstLastBufTimeSync, Stats, TimeSyncData, WelfordAggregator
 from redvox.common import api_reader
 from redvox.common.io import ReadFilter
 
@@ -65,6 +67,27 @@ class SessionModelUtilsFirstLastBufferTest(unittest.TestCase):
         self.assertEqual(test[2][0], 300)
         self.assertEqual(test[2][1], "invader")
 
+    def test_buffer_ignores_duplicates(self):
+        fst = []
+        lst = []
+        for ts in [300, 100, 200, 100, 300]:
+            smu.add_to_fst_buffer(fst, 4, ts, object())
+            smu.add_to_lst_buffer(lst, 4, ts, object())
+        self.assertEqual([n[0] for n in fst], [100, 200, 300])
+        self.assertEqual([n[0] for n in lst], [100, 200, 300])
+
+    def test_add_to_fst_lst_buffers(self):
+        data = [TimeSyncData(float((i * 37) % 50), float(i), 0.) for i in range(2 * smu.MIN_VECTORIZED_BUFFER_DATA)]
+        expected = FirstLastBufTimeSync([], 3, [], 4)
+        for f in data:
+            smu.add_to_fst_buffer(expected.fst, expected.fst_max_size, f.ts, f)
+            smu.add_to_lst_buffer(expected.lst, expected.lst_max_size, f.ts, f)
+        for values in [data, data[:5]]:
+            test = FirstLastBufTimeSync([], 3, [], 4)
+            smu.add_to_fst_lst_buffers(test, values)
+            smu.add_to_fst_lst_buffers(test, data)
+            self.assertEqual(expected, test)
+
 
 class SessionModelUtilsGetTimeSyncTest(unittest.TestCase):
     @classmethod
@@ -105,6 +128,13 @@ class SessionModelUtilsWelfordTest(unittest.TestCase):
         self.assertEqual(wf.cnt, 3)
         self.assertEqual(wf.m2, 20000.)
 
+    def test_merge_welford(self):
+        wf = WelfordAggregator(0., 100., 1)
+        wf = smu.merge_welford(2, 250., 5000., wf)
+        self.assertEqual(wf.mean, 200.)
+        self.assertEqual(wf.cnt, 3)
+        self.assertEqual(wf.m2, 20000.)
+
 
 class SessionModelUtilsStatsTest(unittest.TestCase):
     def test_create_stats(self):
@@ -123,6 +153,38 @@ class SessionModelUtilsStatsTest(unittest.TestCase):
         self.assertEqual(sts.welford.cnt, 3)
         self.assertEqual(sts.welford.m2, 20000.)
 
+    def test_add_nan_to_stats(self):
+        sts = smu.add_to_stats(np.nan)
+        self.assertEqual(sts.welford.cnt, 0)
+        sts = smu.add_to_stats(200., sts)
+        sts = smu.add_to_stats(np.nan, sts)
+        sts = smu.add_array_to_stats(np.array([np.nan, 100., 300.]), sts)
+        self.assertEqual(sts.min, 100.)
+        self.assertEqual(sts.max, 300.)
+        self.assertEqual(sts.welford.mean, 200.)
+        self.assertEqual(sts.welford.cnt, 3)
+        self.assertEqual(sts.welford.m2, 20000.)
+
+    def test_merge_stats(self):
+        first = smu.add_array_to_stats(np.array([200., 300.]))
+        sts = smu.merge_stats(first, smu.add_to_stats(100.))
+        self.assertEqual(first.welford.cnt, 2)
+        self.assertEqual(sts.min, 100.)
+        self.assertEqual(sts.max, 300.)
+        self.assertEqual(sts.welford.mean, 200.)
+        self.assertEqual(sts.welford.cnt, 3)
+        self.assertEqual(sts.welford.m2, 20000.)
+        self.assertEqual(smu.merge_stats(smu.add_to_stats(np.nan), sts).welford.cnt, 3)
+        self.assertEqual(smu.merge_stats(sts, smu.add_to_stats(np.nan)).min, 100.)
+
+    def test_add_array_to_stats(self):
+        sts = smu.add_array_to_stats(np.array([200., 300.]), smu.add_to_stats(100.))
+        self.assertEqual(sts.min, 100.)
+        self.assertEqual(sts.max, 300.)
+        self.assertEqual(sts.welford.mean, 200.)
+        self.assertEqual(sts.welford.cnt, 3)
+        self.assertEqual(sts.welford.m2, 20000.)
+
 
 class SessionModelUtilsLocationDataTest(unittest.TestCase):
     @classmethod
@@ -152,6 +214,40 @@ class SessionModelUtilsLocationDataTest(unittest.TestCase):
         self.assertAlmostEqual(first_data.alt.welford.mean, 23.2, 2)
         self.assertEqual(len(first_data.fst_lst.fst), 2)
 
+    def test_add_location_data_many(self):
+        data = [("GPS" if i % 3 else "NETWORK", 20. + i, -150. - i, float(i % 5), 1000. + (i * 7) % 40)
+                for i in range(2 * smu.MIN_VECTORIZED_LOCATIONS)]
+        expected = {}
+        for s in data:
+            expected[s[0]] = smu.add_to_location(s[1], s[2], s[3], s[4], expected.get(s[0]))
+        loc_data = smu.add_location_data(data)
+        self.assertEqual(list(expected.keys()), list(loc_data.keys()))
+        for key, loc in expected.items():
+            self.assertEqual(loc.fst_lst, loc_data[key].fst_lst)
+            for exp_stats, stats in [(loc.lat, loc_data[key].lat), (loc.lng, loc_data[key].lng),
+                                     (loc.alt, loc_data[key].alt)]:
+                self.assertEqual(exp_stats.min, stats.min)
+                self.assertEqual(exp_stats.max, stats.max)
+                self.assertEqual(exp_stats.welford.cnt, stats.welford.cnt)
+                self.assertAlmostEqual(exp_stats.welford.mean, stats.welford.mean, 6)
+                self.assertAlmostEqual(exp_stats.welford.m2, stats.welford.m2, 6)
+
+    def test_add_location_data_nan(self):
+        data = [("GPS", 20. + i, np.nan if i == 3 else -150., np.nan if i % 10 == 0 else 1., 1000. + i)
+                for i in range(2 * smu.MIN_VECTORIZED_LOCATIONS)]
+        expected = None
+        for s in data:
+            expected = smu.add_to_location(s[1], s[2], s[3], s[4], expected)
+        loc = smu.add_location_data(data)["GPS"]
+        for exp_stats, stats in [(expected.lat, loc.lat), (expected.lng, loc.lng), (expected.alt, loc.alt)]:
+            self.assertEqual(exp_stats.min, stats.min)
+            self.assertEqual(exp_stats.max, stats.max)
+            self.assertEqual(exp_stats.welford.cnt, stats.welford.cnt)
+            self.assertAlmostEqual(exp_stats.welford.mean, stats.welford.mean, 6)
+            self.assertAlmostEqual(exp_stats.welford.m2, stats.welford.m2, 6)
+        self.assertEqual(loc.lng.welford.cnt, 2 * smu.MIN_VECTORIZED_LOCATIONS - 1)
+        self.assertEqual(loc.alt.welford.mean, 1.)
+
 
 class SessionModelUtilsDynamicDataTest(unittest.TestCase):
     @classmethod
@@ -163,8 +259,8 @@ class SessionModelUtilsDynamicDataTest(unittest.TestCase):
 
     def test_get_dynamic_data(self):
         test = smu.get_dynamic_data(self.packet)
-        self.assertEqual(test["battery"], 0.)
-        self.assertEqual(test["temperature"], 0.)
+        self.assertTrue(np.isnan(test["battery"]))
+        self.assertTrue(np.isnan(test["temperature"]))
         loc = test["location"]
         self.assertEqual(len(loc), 1)
         self.assertEqual(loc[0][0], "USER")
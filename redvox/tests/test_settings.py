@@ -7,14 +7,19 @@ import redvox.settings as settings
 class TestSettings(TestCase):
     def setUp(self) -> None:
         self.para_env_key: str = "REDVOX_ENABLE_PARALLELISM"
-        if self.para_env_key in os.environ:
-            del os.environ[self.para_env_key]
+        self.cache_env_key: str = "REDVOX_ENABLE_FILE_CACHE"
+        for env_key in [self.para_env_key, self.cache_env_key]:
+            if env_key in os.environ:
+                del os.environ[env_key]
         settings.set_parallelism_enabled(None)
+        settings.set_file_cache_enabled(None)
 
     def tearDown(self) -> None:
-        if self.para_env_key in os.environ:
-            del os.environ[self.para_env_key]
+        for env_key in [self.para_env_key, self.cache_env_key]:
+            if env_key in os.environ:
+                del os.environ[env_key]
         settings.set_parallelism_enabled(None)
+        settings.set_file_cache_enabled(None)
 
     def test_is_parallelism_enabled_env_none(self):
         self.assertIsNone(settings.is_parallelism_enabled_env())
@@ -46,3 +51,24 @@ class TestSettings(TestCase):
         settings.set_parallelism_enabled(False)
         self.assertFalse(settings.is_parallelism_enabled())
 
+    def test_is_file_cache_enabled_env(self):
+        self.assertIsNone(settings.is_file_cache_enabled_env())
+        os.environ[self.cache_env_key] = "true"
+        self.assertTrue(settings.is_file_cache_enabled_env())
+        os.environ[self.cache_env_key] = "false"
+        self.assertFalse(settings.is_file_cache_enabled_env())
+
+    def test_is_file_cache_enabled(self):
+        self.assertFalse(settings.is_file_cache_enabled())
+        os.environ[self.cache_env_key] = "true"
+        self.assertTrue(settings.is_file_cache_enabled())
+
+    def test_set_file_cache_enabled(self):
+        settings.set_file_cache_enabled(True)
+        self.assertTrue(settings.is_file_cache_enabled())
+        settings.set_file_cache_enabled(False)
+        self.assertFalse(settings.is_file_cache_enabled())
+
+    def test_protobuf_implementation(self):
+        self.assertIn(settings.protobuf_implementation(), ["upb", "cpp", "python"])
+        self.assertEqual(settings.protobuf_implementation() != "python", settings.is_native_protobuf_enabled())